@@ -0,0 +1,222 @@
+"""
+app.adapters.ai.llm.backends
+----------------------------
+
+Load balancing of Ollama calls across several Ollama hosts.
+
+OLLAMA_HOSTS lists the hosts (comma-separated base URLs). Each call leases one
+host for a model:
+    1. ejected hosts are skipped
+    2. hosts that have the model loaded (GET /api/ps) are preferred, so a model
+       is not loaded onto a second host while the first has spare capacity;
+       once every such host has spillover_outstanding calls in flight, hosts
+       that have the model pulled (GET /api/tags) are also used
+    3. among those, the host with the fewest outstanding requests wins
+A host whose calls fail max_failures times in a row, or that fails a health
+check, is ejected. The health-check loop refreshes the loaded/pulled models of
+every host and brings ejected hosts back in once they answer again.
+
+With OLLAMA_HOSTS empty, the pool is disabled and engines talk to the default
+Ollama host (OLLAMA_HOST, or localhost:11434). Several local instances, e.g.
+`OLLAMA_HOST=127.0.0.1:11435 ollama serve` or app/scripts/fake_ollama.py on
+different ports, are enough to exercise the pool.
+
+Typical Usage:
+    async with ollama_backends.lease("llava") as backend:
+        response = await chat_models[backend.url].ainvoke(messages)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Set
+
+import httpx
+
+from app.core.config import config
+from app.core.exceptions import AIProcessingError
+from app.infra.logger import LoggerStatus, main_logger
+from app.infra.metrics import metrics
+
+
+def normalize_model_name(model: str) -> str:
+    """Ollama reports models with a tag; "llava" and "llava:latest" are the same model."""
+    return model if ":" in model else f"{model}:latest"
+
+
+class OllamaBackend:
+    """State of one Ollama host."""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.ejected = False
+        self.ejected_at: Optional[float] = None
+        self.last_used = 0.0
+        self.loaded_models: Set[str] = set()
+        self.available_models: Optional[Set[str]] = None  # None until the first health check
+
+    def serves(self, model: str) -> bool:
+        """Whether the host has the model pulled (assumed until the first health check says otherwise)."""
+        available = self.available_models
+        return available is None or model in available
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": not self.ejected,
+            "outstanding": self.outstanding,
+            "consecutive_failures": self.consecutive_failures,
+            "ejected_at": self.ejected_at,
+            "loaded_models": sorted(self.loaded_models),
+        }
+
+
+class OllamaBackendPool:
+    """
+    Least-outstanding-requests, model-aware pool of Ollama hosts.
+
+    Args:
+        urls: Base URLs of the Ollama hosts
+        max_failures: Consecutive call failures that eject a host
+        spillover_outstanding: In-flight calls per host with the model loaded
+            before hosts that would have to load it are used too
+        health_check_interval: Seconds between health checks / model refreshes
+        health_check_timeout: Timeout of a single health-check request
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        max_failures: int = 2,
+        spillover_outstanding: int = 4,
+        health_check_interval: float = 10.0,
+        health_check_timeout: float = 2.0,
+    ):
+        self.backends = [OllamaBackend(url) for url in urls]
+        self.max_failures = max_failures
+        self.spillover_outstanding = spillover_outstanding
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        for backend in self.backends:
+            self._publish(backend)
+
+    @classmethod
+    def from_config(cls) -> "OllamaBackendPool":
+        return cls(
+            urls=[url.strip() for url in config.OLLAMA_HOSTS.split(",") if url.strip()],
+            max_failures=config.OLLAMA_BACKEND_MAX_FAILURES,
+            spillover_outstanding=config.OLLAMA_BACKEND_SPILLOVER_OUTSTANDING,
+            health_check_interval=config.OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.backends)
+
+    def choose(self, model: str) -> OllamaBackend:
+        """
+        Pick the host for a call to the given model.
+
+        Raises:
+            AIProcessingError: If no healthy host serves the model
+        """
+        model = normalize_model_name(model)
+        healthy = [b for b in self.backends if not b.ejected]
+        loaded = [b for b in healthy if model in b.loaded_models]
+        candidates = loaded
+        if not loaded or min(b.outstanding for b in loaded) >= self.spillover_outstanding:
+            candidates = [b for b in healthy if b.serves(model)]
+        if not candidates:
+            raise AIProcessingError(
+                f"No healthy Ollama backend serves model {model}",
+                details={"backends": [b.snapshot() for b in self.backends]},
+            )
+        # Least outstanding requests; ties go to the least recently used host.
+        return min(candidates, key=lambda b: (b.outstanding, b.last_used))
+
+    @asynccontextmanager
+    async def lease(self, model: str) -> AsyncIterator[OllamaBackend]:
+        """
+        Hold a host for one call, recording its outcome.
+
+        Cancellation (e.g. a missed deadline) and AIProcessingError (a response
+        that could not be parsed) are not held against the host.
+        """
+        backend = self.choose(model)
+        backend.outstanding += 1
+        backend.last_used = time.monotonic()
+        self._publish(backend)
+        try:
+            yield backend
+        except (asyncio.CancelledError, AIProcessingError):
+            raise
+        except Exception as e:
+            metrics.increment("llm_backend_requests_total", host=backend.url, outcome="error")
+            backend.consecutive_failures += 1
+            if backend.consecutive_failures >= self.max_failures:
+                self._eject(backend, str(e))
+            raise
+        else:
+            metrics.increment("llm_backend_requests_total", host=backend.url, outcome="success")
+            backend.consecutive_failures = 0
+            backend.loaded_models.add(normalize_model_name(model))
+        finally:
+            backend.outstanding -= 1
+            self._publish(backend)
+
+    async def check(self, backend: OllamaBackend, client: httpx.AsyncClient) -> bool:
+        """Refresh a host's loaded and pulled models; eject or reinstate it accordingly."""
+        try:
+            ps = await client.get(f"{backend.url}/api/ps")
+            ps.raise_for_status()
+            tags = await client.get(f"{backend.url}/api/tags")
+            tags.raise_for_status()
+            loaded = {normalize_model_name(m["name"]) for m in ps.json().get("models", [])}
+            available = {normalize_model_name(m["name"]) for m in tags.json().get("models", [])}
+        except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # A host answering with something other than Ollama's JSON is as unusable as one not answering.
+            if not backend.ejected:
+                self._eject(backend, f"health check failed: {e!r}")
+            return False
+
+        backend.loaded_models = loaded
+        backend.available_models = available
+        if backend.ejected:
+            backend.ejected = False
+            backend.ejected_at = None
+            backend.consecutive_failures = 0
+            main_logger.log(f"[OLLAMA POOL] Backend {backend.url} is healthy again", LoggerStatus.INFO)
+        self._publish(backend)
+        return True
+
+    async def run_health_checks(self) -> None:
+        """Health-check every host periodically; runs until cancelled."""
+        async with httpx.AsyncClient(timeout=self.health_check_timeout) as client:
+            while True:
+                try:
+                    await asyncio.gather(*(self.check(backend, client) for backend in self.backends))
+                except Exception as e:  # pylint: disable=broad-except
+                    # One bad round must not stop the loop that reinstates ejected hosts.
+                    main_logger.log(f"[OLLAMA POOL] Health check round failed: {e!r}", LoggerStatus.ERROR)
+                    metrics.increment("llm_backend_health_check_errors_total")
+                await asyncio.sleep(self.health_check_interval)
+
+    def snapshot(self) -> List[dict]:
+        return [backend.snapshot() for backend in self.backends]
+
+    def _eject(self, backend: OllamaBackend, reason: str) -> None:
+        backend.ejected = True
+        backend.ejected_at = time.time()
+        metrics.increment("llm_backend_ejections_total", host=backend.url)
+        main_logger.log(f"[OLLAMA POOL] Ejected backend {backend.url}: {reason}", LoggerStatus.WARNING)
+        self._publish(backend)
+
+    def _publish(self, backend: OllamaBackend) -> None:
+        metrics.set_gauge("llm_backend_outstanding", backend.outstanding, host=backend.url)
+        metrics.set_gauge("llm_backend_healthy", 0 if backend.ejected else 1, host=backend.url)
+
+
+# Shared pool: every engine balances over the same hosts.
+ollama_backends = OllamaBackendPool.from_config()
@@ -0,0 +1,185 @@
+"""
+app.adapters.ai.llm.circuit_breaker
+-----------------------------------
+
+Circuit breakers around LLM backends, one per model/backend name.
+
+    CLOSED     calls flow; outcomes are tracked over a sliding time window.
+               When at least minimum_calls were made and the failure rate
+               reaches failure_rate_threshold, the circuit opens.
+    OPEN       calls are rejected immediately with LLMCircuitOpenError so
+               callers go straight to their degraded path.
+    HALF_OPEN  after open_seconds, up to half_open_max_calls probe calls are
+               let through; a success closes the circuit, a failure reopens it.
+
+Calls slower than slow_call_seconds count as failures, so an overloaded
+backend that never errors still trips the breaker.
+
+States are published on the /health endpoint and as the llm_circuit_state
+gauge (0 closed, 1 half-open, 2 open).
+
+Typical Usage:
+    breaker = get_circuit_breaker("llava")
+    breaker.before_call()          # raises LLMCircuitOpenError when open
+    ...
+    breaker.record(success=True, duration=1.2)
+    # or, when the caller went away before the call finished:
+    breaker.release()
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Optional, Tuple
+
+from app.core.config import config
+from app.core.exceptions import LLMCircuitOpenError
+from app.infra.metrics import metrics
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_GAUGE = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker with a half-open recovery probe.
+
+    Args:
+        name: Model/backend name the breaker protects
+        failure_rate_threshold: Failure ratio (0-1) that opens the circuit
+        minimum_calls: Calls required in the window before the rate is evaluated
+        window_seconds: Sliding window for outcome tracking
+        open_seconds: Time spent open before probing
+        half_open_max_calls: Concurrent probe calls allowed while half-open
+        slow_call_seconds: Calls slower than this count as failures
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = config.LLM_CIRCUIT_FAILURE_RATE,
+        minimum_calls: int = config.LLM_CIRCUIT_MIN_CALLS,
+        window_seconds: float = config.LLM_CIRCUIT_WINDOW_SECONDS,
+        open_seconds: float = config.LLM_CIRCUIT_OPEN_SECONDS,
+        half_open_max_calls: int = 1,
+        slow_call_seconds: float = config.LLM_CIRCUIT_SLOW_CALL_SECONDS,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self.opened_at_time: Optional[float] = None  # Wall-clock time, for reporting
+        self.half_open_in_flight = 0
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self._publish()
+
+    def before_call(self) -> None:
+        """
+        Admit or reject a call.
+
+        Raises:
+            LLMCircuitOpenError: If the circuit is open (or half-open with its probes in use)
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.open_seconds:
+                metrics.increment("llm_circuit_rejected_total", backend=self.name)
+                raise LLMCircuitOpenError(f"Circuit open for LLM backend '{self.name}'")
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self.half_open_in_flight >= self.half_open_max_calls:
+                metrics.increment("llm_circuit_rejected_total", backend=self.name)
+                raise LLMCircuitOpenError(f"Circuit half-open for LLM backend '{self.name}', probe in progress")
+            self.half_open_in_flight += 1
+
+    def record(self, success: bool, duration: float = 0.0) -> None:
+        """Record the outcome of an admitted call."""
+        if success and duration > self.slow_call_seconds:
+            success = False
+
+        if self.state == CircuitState.HALF_OPEN:
+            self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
+            if success:
+                self.outcomes.clear()
+                self._transition(CircuitState.CLOSED)
+            else:
+                self._open()
+            return
+
+        now = time.monotonic()
+        self.outcomes.append((now, success))
+        while self.outcomes and now - self.outcomes[0][0] > self.window_seconds:
+            self.outcomes.popleft()
+
+        if self.state == CircuitState.CLOSED and len(self.outcomes) >= self.minimum_calls:
+            failures = sum(1 for _, ok in self.outcomes if not ok)
+            if failures / len(self.outcomes) >= self.failure_rate_threshold:
+                self._open()
+
+    def release(self) -> None:
+        """
+        Give back an admitted call without recording an outcome.
+
+        Used when the caller went away (a closed stream, a cancelled request):
+        that says nothing about the backend, so it must neither count as a
+        failure nor settle a half-open probe.
+        """
+        if self.state == CircuitState.HALF_OPEN:
+            self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
+
+    def snapshot(self) -> dict:
+        total = len(self.outcomes)
+        failures = sum(1 for _, ok in self.outcomes if not ok)
+        return {
+            "state": self.state.value,
+            "calls_in_window": total,
+            "failure_rate": round(failures / total, 3) if total else 0.0,
+            "opened_at": self.opened_at_time,
+        }
+
+    def _open(self) -> None:
+        self.opened_at = time.monotonic()
+        self.opened_at_time = time.time()
+        self.outcomes.clear()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state != self.state:
+            metrics.increment("llm_circuit_transitions_total", backend=self.name, state=state.value)
+        self.state = state
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge("llm_circuit_state", _STATE_GAUGE[self.state], backend=self.name)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Return the shared breaker for a model/backend, creating it on first use."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name)
+        _breakers[name] = breaker
+    return breaker
+
+
+def circuit_breaker_states(name: Optional[str] = None) -> Dict[str, dict]:
+    """Snapshot of all breakers (or a single one) for health reporting."""
+    return {
+        key: breaker.snapshot()
+        for key, breaker in _breakers.items()
+        if name is None or key == name
+    }
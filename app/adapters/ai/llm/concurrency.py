@@ -0,0 +1,135 @@
+"""
+app.adapters.ai.llm.concurrency
+-------------------------------
+
+Adaptive (AIMD) concurrency limit for calls to the Ollama backend.
+
+The limiter observes the latency and outcome of each completed call:
+    - latency under target while the limit was in use -> additive increase
+      (+increase_step / limit per call, i.e. roughly +increase_step per "window")
+    - latency over target or an error               -> multiplicative decrease
+Decreases are rate limited by a cooldown so a single burst of slow responses
+only cuts the limit once.
+
+The current limit is exported as the llm_concurrency_limit gauge and a bounded
+history of limit changes is kept for /metrics.
+
+Typical Usage:
+    limiter = AIMDLimiter(initial_limit=4, min_limit=1, max_limit=16, target_latency=20)
+    limiter.record(latency=3.2, error=False, in_flight=4)
+    limit = limiter.current()
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from app.core.config import config
+from app.infra.metrics import metrics
+
+
+class AIMDLimiter:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit.
+
+    Args:
+        initial_limit: Starting limit
+        min_limit: Lower bound for the limit
+        max_limit: Upper bound for the limit
+        target_latency: Latency (seconds) above which a call counts as a spike
+        increase_step: Additive increase applied per full window of successes
+        decrease_factor: Multiplier applied on a spike or error (0 < factor < 1)
+        cooldown_seconds: Minimum time between two decreases (defaults to target_latency)
+        targets: Optional per-operation target latency overrides
+        history_size: Number of limit changes kept in history
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        target_latency: float,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: Optional[float] = None,
+        targets: Optional[Dict[str, float]] = None,
+        history_size: int = 100,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.target_latency = target_latency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = target_latency if cooldown_seconds is None else cooldown_seconds
+        self.targets = targets or {}
+        self.last_decrease = 0.0
+        self.history: Deque[dict] = deque(maxlen=history_size)
+        self._record_change("initial")
+
+    @classmethod
+    def from_config(cls) -> "AIMDLimiter":
+        return cls(
+            initial_limit=config.LLM_MAX_CONCURRENCY,
+            min_limit=config.LLM_AIMD_MIN_CONCURRENCY,
+            max_limit=config.LLM_AIMD_MAX_CONCURRENCY,
+            target_latency=config.LLM_AIMD_TARGET_LATENCY_SECONDS,
+            decrease_factor=config.LLM_AIMD_DECREASE_FACTOR,
+        )
+
+    def current(self) -> int:
+        """Integer limit currently in force."""
+        return max(self.min_limit, int(self.limit))
+
+    def record(self, latency: float, error: bool = False, in_flight: int = 0, operation: str = "unknown") -> None:
+        """
+        Update the limit from a completed call.
+
+        Args:
+            latency (float): Call duration in seconds
+            error (bool): Whether the call failed
+            in_flight (int): Calls still in flight when this one completed
+            operation (str): Operation name, used for per-operation targets
+        """
+        target = self.targets.get(operation, self.target_latency)
+        if error or latency > target:
+            now = time.monotonic()
+            if now - self.last_decrease < self.cooldown_seconds:
+                return
+            self.last_decrease = now
+            self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+            self._record_change("error" if error else "latency", latency=latency, operation=operation)
+            return
+
+        # Only grow when the limit was actually the constraint; an idle
+        # backend says nothing about how much more it can take.
+        if in_flight + 1 < self.current():
+            return
+        previous = self.current()
+        self.limit = min(float(self.max_limit), self.limit + self.increase_step / self.limit)
+        if self.current() != previous:
+            self._record_change("increase", latency=latency, operation=operation)
+
+    def snapshot(self) -> dict:
+        """Return the current limit and its recent history."""
+        return {
+            "limit": self.current(),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "target_latency": self.target_latency,
+            "history": list(self.history),
+        }
+
+    def _record_change(self, reason: str, latency: Optional[float] = None, operation: Optional[str] = None) -> None:
+        self.history.append(
+            {
+                "time": time.time(),
+                "limit": self.current(),
+                "reason": reason,
+                "latency": round(latency, 3) if latency is not None else None,
+                "operation": operation,
+            }
+        )
+        metrics.set_gauge("llm_concurrency_limit", self.current())
+        metrics.increment("llm_concurrency_limit_changes_total", reason=reason)
@@ -1,32 +1,126 @@
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
+"""
+app.adapters.ai.llm.models
+--------------------------
 
-# High-performance but expensive
-gpt_4_turbo = ChatOpenAI(model="gpt-4-turbo", temperature=0.2)
+Model tiers available to the LLM router.
 
-# Cheaper, smaller model
-gpt_4o_mini = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+Each tier names a provider and model together with what the router needs to
+pick it: context size, a prior latency estimate (replaced by observed latency
+once calls are made) and the per-1k-token price from `pricing`.
 
-# External models
-claude = ChatAnthropic(model="claude-3-sonnet-20240229", temperature=0.3)
-gemini = ChatGoogleGenerativeAI(model="gemini-1.5-flash", temperature=0.3)
+Local Ollama models are first-class tiers, so routing works (and can be tested)
+fully offline. Cloud tiers are only used when LLM_ROUTER_CLOUD_ENABLED is set;
+their LangChain clients are imported and built lazily, so the provider packages
+are optional dependencies.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.config import config
 
 pricing = {
     "gpt-4-turbo": 0.01,
     "gpt-4o-mini": 0.002,
     "claude-3-sonnet-20240229": 0.008,
     "gemini-1.5-flash": 0.0015,
+    # Local models only cost hardware time
+    config.OLLAMA_FAST_MODEL: 0.0,
+    config.OLLAMA_BALANCED_MODEL: 0.0,
 }
 
 
+class ModelTier(BaseModel):
+    name: str
+    provider: str  # "ollama", "openai", "anthropic" or "google"
+    model: str
+    temperature: float = 0.3
+    context_tokens: int
+    expected_latency_seconds: float  # Prior estimate before latency is observed
+
+    @property
+    def cost_per_1k_tokens(self) -> float:
+        return pricing.get(self.model, 0.0)
+
+    @property
+    def is_local(self) -> bool:
+        return self.provider == "ollama"
+
+
 models = {
-    "fast": gpt_4o_mini,
-    "balanced": claude,
-    "accurate": gpt_4_turbo,
-    "cheap": gemini,
+    # Local Ollama tiers
+    "local_fast": ModelTier(
+        name="local_fast",
+        provider="ollama",
+        model=config.OLLAMA_FAST_MODEL,
+        context_tokens=4096,
+        expected_latency_seconds=8.0,
+    ),
+    "local_balanced": ModelTier(
+        name="local_balanced",
+        provider="ollama",
+        model=config.OLLAMA_BALANCED_MODEL,
+        context_tokens=4096,
+        expected_latency_seconds=15.0,
+    ),
+    # High-performance but expensive
+    "accurate": ModelTier(
+        name="accurate",
+        provider="openai",
+        model="gpt-4-turbo",
+        temperature=0.2,
+        context_tokens=128000,
+        expected_latency_seconds=6.0,
+    ),
+    # Cheaper, smaller model
+    "fast": ModelTier(
+        name="fast",
+        provider="openai",
+        model="gpt-4o-mini",
+        context_tokens=128000,
+        expected_latency_seconds=2.0,
+    ),
+    # External models
+    "balanced": ModelTier(
+        name="balanced",
+        provider="anthropic",
+        model="claude-3-sonnet-20240229",
+        context_tokens=200000,
+        expected_latency_seconds=4.0,
+    ),
+    "cheap": ModelTier(
+        name="cheap",
+        provider="google",
+        model="gemini-1.5-flash",
+        context_tokens=1000000,
+        expected_latency_seconds=2.0,
+    ),
 }
 
 
+def build_chat_model(tier: ModelTier) -> Any:
+    """
+    Build the LangChain chat model for a cloud tier.
+
+    Raises:
+        ImportError: If the provider's LangChain package is not installed
+        ValueError: If the provider is unknown
+    """
+    # pylint: disable=import-outside-toplevel
+    if tier.provider == "openai":
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(model=tier.model, temperature=tier.temperature)
+    if tier.provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(model=tier.model, temperature=tier.temperature)
+    if tier.provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(model=tier.model, temperature=tier.temperature)
+    raise ValueError(f"Unknown model provider: {tier.provider}")
+
 
 OLLAMA_LLAVA = "llava"
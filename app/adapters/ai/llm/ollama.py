@@ -1,22 +1,61 @@
-from typing import List
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 from langchain_ollama import ChatOllama
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
+from pydantic import ValidationError as PydanticValidationError
 
 from app.adapters.ai.llm.prompts import (
+    REPORT_SUMMARIZATION_SYSTEM_PROMPT,
     REPORT_SUMMARIZATION_PROMPT,
+    REPORT_CATEGORIZATION_SYSTEM_PROMPT,
     REPORT_CATEGORIZATION_PROMPT,
+    PREDICTIVE_VALIDATION_SYSTEM_PROMPT,
     PREDICTIVE_VALIDATION_PROMPT,
 )
+from app.adapters.ai.llm.backends import OllamaBackendPool, ollama_backends
+from app.adapters.ai.llm.circuit_breaker import get_circuit_breaker
+from app.adapters.ai.llm.response_cache import LLMResponseCache, build_llm_cache_key
+from app.adapters.ai.llm.scheduler import LLMScheduler, OPERATION_PRIORITIES, Priority, llm_scheduler
+from app.adapters.ai.llm.single_flight import SingleFlight
+from app.adapters.ai.llm.telemetry import llm_telemetry, queue_wait_ctx
+from app.adapters.ai.llm.token_budget import count_tokens, fit_ranked_lines, truncate_to_tokens
+from app.adapters.cache.base import CacheInterface
+from app.core.config import config
+from app.core.exceptions import AIProcessingError
 from app.domain.schema.categorize import CategoryNode
+from app.infra.logger import main_logger
+from app.infra.metrics import metrics
 
 DEFAULT_MODEL = "llama2-uncensored"
 
+PROMPT_TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+STRUCTURED_OUTPUT_MODES = ("tool_calling", "json_schema")
+
+GENERATED_TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048)
+
 
 # Structured output schemas for LLM responses
 class CategoryResponse(BaseModel):
     """Structured response for report categorization."""
-    category_ids: List[int] = Field(description="List of category IDs that match the report")
+    category_ids: List[int] = Field(description="List of category IDs that match the report, most confident first")
+    confidences: List[float] = Field(
+        default_factory=list, description="Confidence (0-100) for each category ID, in the same order"
+    )
+
+    def ranked(self) -> List[Tuple[int, Optional[float]]]:
+        """Category IDs paired with their 0-100 confidence (None when the model gave none), duplicates dropped."""
+        # Small models sometimes answer on a 0-1 scale despite the instructions.
+        scale = 100.0 if self.confidences and max(self.confidences) <= 1.0 else 1.0
+        ranked: Dict[int, Optional[float]] = {}
+        for position, category_id in enumerate(self.category_ids):
+            if category_id not in ranked:
+                ranked[category_id] = self.confidences[position] * scale if position < len(self.confidences) else None
+        return list(ranked.items())
 
 
 class ValidationResponse(BaseModel):
@@ -29,27 +68,213 @@ class ValidationResponse(BaseModel):
     supporting_inferences: List[str] = Field(default_factory=list, description="Inferences that support the validity decision")
 
 
+class ModelRunnables(NamedTuple):
+    """Chat model and structured-output runnables bound to one backend."""
+    model: Any
+    categorization_model: Any
+    validation_model: Any
+
+
+class CategoryPromptBlock(NamedTuple):
+    """Rendered category list for a categorization prompt."""
+    text: str
+    tokens: int
+    verbose_tokens: int  # Size of the unbudgeted "ID/Name/Slug/Description" rendering
+    omitted: int
+
+
+def render_categories_block(
+    categories: List[CategoryNode],
+    model: str,
+    names: Optional[Dict[int, str]] = None,
+    budget: Optional[int] = None,
+) -> CategoryPromptBlock:
+    """
+    Render category nodes compactly so they fit the category token budget.
+
+    Each category is one "ID|Name: short description" line. If that does not
+    fit, descriptions are dropped; if it still does not fit, trailing
+    categories are omitted.
+
+    Args:
+        categories (List[CategoryNode]): Categories offered at one level
+        model (str): Model name used for token counting
+        names (Optional[Dict[int, str]]): Display name per category id, e.g. a
+            full "Crime > Theft > Vehicle" path; defaults to the category name
+        budget (Optional[int]): Token budget; defaults to LLM_PROMPT_TOKEN_BUDGET_CATEGORIES
+
+    Returns:
+        CategoryPromptBlock: The rendered block and its token accounting
+    """
+    budget = budget or config.LLM_PROMPT_TOKEN_BUDGET_CATEGORIES
+    names = names or {}
+    description_tokens = config.LLM_PROMPT_CATEGORY_DESCRIPTION_TOKENS
+    verbose_tokens = sum(
+        count_tokens(f"ID: {c.id}\nName: {c.name}\nSlug: {c.slug}\nDescription: {c.description}\n", model)
+        for c in categories
+    )
+
+    # Sorted by id so the same category set always renders the same prompt
+    # segment, whatever order the tree was read in.
+    categories = sorted(categories, key=lambda category: category.id)
+    lines = [
+        f"{category.id}|{names.get(category.id, category.name)}: "
+        f"{truncate_to_tokens(' '.join(category.description.split()), description_tokens, model)}"
+        for category in categories
+    ]
+    text = "\n".join(lines)
+    tokens = count_tokens(text, model)
+    if tokens <= budget:
+        return CategoryPromptBlock(text, tokens, verbose_tokens, 0)
+
+    lines = [f"{category.id}|{names.get(category.id, category.name)}" for category in categories]
+    text, omitted = fit_ranked_lines(list(enumerate(lines)), budget, model)
+    return CategoryPromptBlock(text, count_tokens(text, model), verbose_tokens, omitted)
+
+
 class OllamaLLMEngine:
-    def __init__(self, model: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        response_cache: Optional[LLMResponseCache] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        chat_model: Optional[Any] = None,
+        structured_output_mode: Optional[str] = None,
+        backends: Optional[OllamaBackendPool] = None,
+    ):
         self.model_name = model
-        self.model = ChatOllama(model=self.model_name)
-        self.prompt_template = ChatPromptTemplate.from_template(REPORT_SUMMARIZATION_PROMPT)
-
-    async def generate_report_summary(self, content: str) -> str:
+        # A non-Ollama LangChain chat model can be injected for cloud router tiers;
+        # it bypasses the Ollama backend pool.
+        self.model = chat_model or self._build_chat_model()
+        self.backends = None if chat_model is not None else (backends or ollama_backends)
+        self.response_cache = response_cache  # Can be None if Redis is not available.
+        self.single_flight = SingleFlight()
+        self.scheduler = scheduler or llm_scheduler
+        self.circuit_breaker = get_circuit_breaker(self.model_name)
+
+        # Prompt templates and structured-output runnables are compiled once per
+        # engine; building them per call re-parses templates and JSON schemas.
+        # Static instructions go in the system message so every call shares the
+        # same leading prefix and Ollama can reuse its KV cache.
+        self.prompt_template = ChatPromptTemplate.from_messages(
+            [("system", REPORT_SUMMARIZATION_SYSTEM_PROMPT), ("human", REPORT_SUMMARIZATION_PROMPT)]
+        )
+        self.categorization_prompt_template = ChatPromptTemplate.from_messages(
+            [("system", REPORT_CATEGORIZATION_SYSTEM_PROMPT), ("human", REPORT_CATEGORIZATION_PROMPT)]
+        )
+        self.validation_prompt_template = ChatPromptTemplate.from_messages(
+            [("system", PREDICTIVE_VALIDATION_SYSTEM_PROMPT), ("human", PREDICTIVE_VALIDATION_PROMPT)]
+        )
+        # "json_schema" constrains Ollama's decoding to the response schema via its
+        # native `format` option and parses the JSON directly; "tool_calling" uses
+        # LangChain's tool-call structured output (also used for cloud tiers).
+        mode = structured_output_mode or config.LLM_STRUCTURED_OUTPUT_MODE
+        if mode not in STRUCTURED_OUTPUT_MODES:
+            raise ValueError(f"Unknown structured output mode: {mode}")
+        if mode == "json_schema" and not isinstance(self.model, ChatOllama):
+            mode = "tool_calling"
+        self.structured_output_mode = mode
+        self.default_runnables = self._build_runnables(self.model)
+        self.categorization_model = self.default_runnables.categorization_model
+        self.validation_model = self.default_runnables.validation_model
+        self.host_runnables: Dict[str, ModelRunnables] = {}
+
+    async def generate_report_summary(self, content: str, priority: Optional[Priority] = None) -> str:
         """
         Generate a structured title and description for the given report content.
 
         Args:
             content (str): The unstructured report content from the user.
+            priority (Optional[Priority]): Scheduler class (defaults to INTERACTIVE)
 
         Returns:
             str: Output as plain text, including "Title:" and "Description:" fields.
         """
-        prompt = self.prompt_template.format(content=content)
-        response = await self.model.ainvoke(prompt)
-        return response.content.strip()
+        budgeted_content = truncate_to_tokens(content, config.LLM_PROMPT_TOKEN_BUDGET_SUMMARY, self.model_name)
+        inputs = {"content": budgeted_content}
+        messages = self.prompt_template.format_messages(**inputs)
+        prompt_tokens = self._record_prompt_tokens(
+            "summary", messages, count_tokens(content, self.model_name) - count_tokens(budgeted_content, self.model_name)
+        )
+
+        async def _generate() -> str:
+            async with self._backend() as runnables:
+                response = await runnables.model.ainvoke(messages)
+            self._record_call("summary", response.response_metadata, prompt_tokens)
+            return response.content.strip()
+
+        return await self._cached_call("summary", inputs, _generate, priority=priority)
 
-    async def categorize_report(self, title: str, description: str, categories: List[CategoryNode]) -> List[int]:
+    async def stream_report_summary(self, content: str, priority: Optional[Priority] = None) -> AsyncIterator[str]:
+        """
+        Stream the title and description for the given report content token by token.
+
+        A cached response is replayed as a single chunk; a completed stream is
+        stored in the response cache for later calls. A stream closed or
+        cancelled by its consumer (client disconnect, caller's deadline) gives
+        back its circuit-breaker admission without recording an outcome; only
+        backend errors count as failures.
+
+        Args:
+            content (str): The unstructured report content from the user.
+            priority (Optional[Priority]): Scheduler class (defaults to INTERACTIVE)
+
+        Yields:
+            str: Generated text chunks, forming "Title:" and "Description:" fields.
+        """
+        inputs = {"content": truncate_to_tokens(content, config.LLM_PROMPT_TOKEN_BUDGET_SUMMARY, self.model_name)}
+        key = build_llm_cache_key("summary", self.model_name, inputs)
+        use_cache = self.response_cache is not None and self.response_cache.is_enabled("summary")
+
+        if use_cache:
+            cached = await self.response_cache.get(key, "summary")
+            if cached is not None:
+                yield cached
+                return
+
+        messages = self.prompt_template.format_messages(**inputs)
+        prompt_tokens = count_tokens(_prompt_text(messages), self.model_name)
+        chunks: List[str] = []
+        response_metadata: Dict[str, Any] = {}
+        if priority is None:
+            priority = OPERATION_PRIORITIES["summary"]
+        self.circuit_breaker.before_call()
+        success, duration, abandoned = False, 0.0, False
+        enqueued = time.monotonic()
+        try:
+            async with self.scheduler.slot(priority, operation="summary"):
+                started = time.monotonic()
+                queue_wait_ctx.set(started - enqueued)
+                async with self._backend() as runnables:
+                    async for chunk in runnables.model.astream(messages):
+                        if chunk.response_metadata:
+                            response_metadata = chunk.response_metadata
+                        if chunk.content:
+                            chunks.append(chunk.content)
+                            yield chunk.content
+                duration = time.monotonic() - started
+                self._record_call("summary", response_metadata, prompt_tokens)
+                success = True
+        except (GeneratorExit, asyncio.CancelledError):
+            abandoned = True
+            raise
+        finally:
+            if abandoned:
+                self.circuit_breaker.release()
+            else:
+                self.circuit_breaker.record(success, duration)
+
+        if use_cache:
+            await self.response_cache.set(key, "summary", "".join(chunks).strip())
+
+    async def categorize_report(
+        self,
+        title: str,
+        description: str,
+        categories: List[CategoryNode],
+        priority: Optional[Priority] = None,
+        categories_block: Optional[CategoryPromptBlock] = None,
+    ) -> CategoryResponse:
         """
         Categorize a report based on its title and description.
 
@@ -57,24 +282,48 @@ class OllamaLLMEngine:
             title (str): The report title
             description (str): The report description
             categories (List[CategoryNode]): List of available category nodes
+            priority (Optional[Priority]): Scheduler class (defaults to BACKGROUND)
+            categories_block (Optional[CategoryPromptBlock]): Pre-rendered category list
+                (rendered from categories when not given)
 
         Returns:
-            List[int]: List of category IDs that match the report
+            CategoryResponse: Matching category IDs with the model's confidence in each
         """
-        categories_text = self._format_categories_for_prompt(categories)
-
-        prompt_template = ChatPromptTemplate.from_template(REPORT_CATEGORIZATION_PROMPT)
-        prompt = prompt_template.format(
-            title=title,
-            description=description,
-            categories=categories_text
+        if categories_block is None:
+            categories_block = render_categories_block(categories, self.model_name)
+        if categories_block.omitted:
+            metrics.increment("llm_prompt_items_omitted_total", categories_block.omitted, operation="categorization")
+        budgeted_description = truncate_to_tokens(description, config.LLM_PROMPT_TOKEN_BUDGET_REPORT, self.model_name)
+
+        inputs = {
+            "title": title,
+            "description": budgeted_description,
+            "categories": categories_block.text,
+        }
+        messages = self.categorization_prompt_template.format_messages(**inputs)
+        prompt_tokens = self._record_prompt_tokens(
+            "categorization",
+            messages,
+            categories_block.verbose_tokens
+            - categories_block.tokens
+            + count_tokens(description, self.model_name)
+            - count_tokens(budgeted_description, self.model_name),
         )
 
-        # Use structured output for categorization
-        structured_model = self.model.with_structured_output(CategoryResponse)
-        response = await structured_model.ainvoke(prompt)
-
-        return response.category_ids
+        async def _generate() -> CategoryResponse:
+            async with self._backend() as runnables:
+                return await self._invoke_structured(
+                    "categorization", runnables.categorization_model, CategoryResponse, messages, prompt_tokens
+                )
+
+        return await self._cached_call(
+            "categorization",
+            inputs,
+            _generate,
+            encode=lambda result: result.model_dump(),
+            decode=CategoryResponse.model_validate,
+            priority=priority,
+        )
 
     async def validate_report(
         self,
@@ -82,6 +331,7 @@ class OllamaLLMEngine:
         summary: str,
         categories: List[str],
         deterministic_data: dict,
+        priority: Optional[Priority] = None,
     ) -> ValidationResponse:
         """
         Perform predictive validation on a report using AI.
@@ -91,17 +341,17 @@ class OllamaLLMEngine:
             summary (str): Report summary
             categories (List[str]): List of category slugs
             deterministic_data (dict): Deterministic validation data
+            priority (Optional[Priority]): Scheduler class (defaults to BATCH)
 
         Returns:
             ValidationResponse: Structured validation result
         """
         # Format issues and inferences for prompt
-        issues_text = self._format_validation_items(
-            deterministic_data.get("issues", []), "issue"
-        )
-        inferences_text = self._format_validation_items(
-            deterministic_data.get("inferences", []), "inference"
-        )
+        issues = deterministic_data.get("issues", [])
+        inferences = deterministic_data.get("inferences", [])
+        issues_text = self._format_validation_items(issues, "issue")
+        inferences_text = self._format_validation_items(inferences, "inference")
+        budgeted_summary = truncate_to_tokens(summary, config.LLM_PROMPT_TOKEN_BUDGET_REPORT, self.model_name)
 
         metadata = deterministic_data.get("metadata", {})
         categories_str = ", ".join(categories) if categories else "None"
@@ -115,10 +365,9 @@ class OllamaLLMEngine:
             else 0.0
         )
 
-        prompt_template = ChatPromptTemplate.from_template(PREDICTIVE_VALIDATION_PROMPT)
-        prompt = prompt_template.format(
+        inputs = dict(
             title=title,
-            summary=summary,
+            summary=budgeted_summary,
             categories=categories_str,
             trust_score=deterministic_data.get("trust_score", 0),
             issues_count=deterministic_data.get("issues_count", 0),
@@ -133,37 +382,130 @@ class OllamaLLMEngine:
             issues=issues_text,
             inferences=inferences_text,
         )
+        messages = self.validation_prompt_template.format_messages(**inputs)
+        # Unbudgeted items cost their text plus ~8 tokens of numbering, level and emoji markers.
+        verbose_items_tokens = sum(
+            count_tokens(" ".join(str(v) for v in item.values()), self.model_name) + 8
+            for item in issues + inferences
+        )
+        prompt_tokens = self._record_prompt_tokens(
+            "validation",
+            messages,
+            verbose_items_tokens
+            - count_tokens(issues_text + inferences_text, self.model_name)
+            + count_tokens(summary, self.model_name)
+            - count_tokens(budgeted_summary, self.model_name),
+        )
 
-        # Use structured output for validation
-        structured_model = self.model.with_structured_output(ValidationResponse)
-        response = await structured_model.ainvoke(prompt)
-
-        return response
+        async def _generate() -> ValidationResponse:
+            async with self._backend() as runnables:
+                return await self._invoke_structured(
+                    "validation", runnables.validation_model, ValidationResponse, messages, prompt_tokens
+                )
+
+        return await self._cached_call(
+            "validation",
+            inputs,
+            _generate,
+            encode=lambda result: result.model_dump(),
+            decode=ValidationResponse.model_validate,
+            priority=priority,
+        )
 
     ###### HELPERS ########
 
-    def _format_categories_for_prompt(self, categories: List[CategoryNode], level: int = 0) -> str:
+    def _build_chat_model(self, base_url: Optional[str] = None) -> ChatOllama:
+        return ChatOllama(model=self.model_name, base_url=base_url, keep_alive=_keep_alive(config.OLLAMA_KEEP_ALIVE))
+
+    def _build_runnables(self, chat_model: Any) -> ModelRunnables:
+        if self.structured_output_mode == "json_schema":
+            return ModelRunnables(
+                model=chat_model,
+                categorization_model=chat_model.bind(format=CategoryResponse.model_json_schema()),
+                validation_model=chat_model.bind(format=ValidationResponse.model_json_schema()),
+            )
+        # include_raw keeps the raw message so Ollama's timing metadata can be read.
+        return ModelRunnables(
+            model=chat_model,
+            categorization_model=chat_model.with_structured_output(CategoryResponse, include_raw=True),
+            validation_model=chat_model.with_structured_output(ValidationResponse, include_raw=True),
+        )
+
+    @asynccontextmanager
+    async def _backend(self) -> AsyncIterator[ModelRunnables]:
+        """Lease an Ollama host from the backend pool for one call (or use the default host)."""
+        if self.backends is None or not self.backends.enabled:
+            yield self.default_runnables
+            return
+        async with self.backends.lease(self.model_name) as backend:
+            runnables = self.host_runnables.get(backend.url)
+            if runnables is None:
+                runnables = self._build_runnables(self._build_chat_model(backend.url))
+                self.host_runnables[backend.url] = runnables
+            yield runnables
+
+    async def _cached_call(
+        self,
+        operation: str,
+        inputs: Dict[str, Any],
+        generate: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], Any] = lambda result: result,
+        decode: Callable[[Any], Any] = lambda cached: cached,
+        priority: Optional[Priority] = None,
+    ) -> Any:
         """
-        Format category nodes into a readable string for the prompt.
+        Serve an LLM call from the response cache, generating and storing it on a miss.
+
+        Concurrent misses for the same key are coalesced into a single generation,
+        which waits for a scheduler slot of the call's priority class. Cache hits
+        are still served while the backend's circuit breaker is open; misses are
+        rejected immediately with LLMCircuitOpenError.
 
         Args:
-            categories (List[CategoryNode]): List of category nodes
-            level (int): Current nesting level for indentation
+            operation (str): Operation name ("summary", "categorization", "validation")
+            inputs (Dict[str, Any]): Prompt variables used to build the cache key
+            generate (Callable): Coroutine factory performing the actual LLM call
+            encode (Callable): Converts the result to a JSON-serializable value
+            decode (Callable): Converts a cached value back to the result type
+            priority (Optional[Priority]): Scheduler class, defaults per operation
 
         Returns:
-            str: Formatted categories string
+            Any: The (possibly cached) result
         """
-        lines = []
-        indent = "  " * level
-
-        for category in categories:
-            lines.append(f"{indent}ID: {category.id}")
-            lines.append(f"{indent}Name: {category.name}")
-            lines.append(f"{indent}Slug: {category.slug}")
-            lines.append(f"{indent}Description: {category.description}")
-            lines.append("")
-
-        return "\n".join(lines)
+        key = build_llm_cache_key(operation, self.model_name, inputs)
+        use_cache = self.response_cache is not None and self.response_cache.is_enabled(operation)
+
+        if use_cache:
+            cached = await self.response_cache.get(key, operation)
+            if cached is not None:
+                return decode(cached)
+
+        if priority is None:
+            priority = OPERATION_PRIORITIES.get(operation, Priority.BACKGROUND)
+
+        async def _generate_and_store() -> Any:
+            self.circuit_breaker.before_call()
+            success, duration = False, 0.0
+            enqueued = time.monotonic()
+            try:
+                async with self.scheduler.slot(priority, operation=operation):
+                    started = time.monotonic()
+                    queue_wait_ctx.set(started - enqueued)
+                    result = await generate()
+                    duration = time.monotonic() - started
+                    success = True
+            except asyncio.CancelledError:
+                # Only abandoned generations are cancelled (every caller missed
+                # its deadline): a slow call, counted with its elapsed time.
+                duration = time.monotonic() - enqueued
+                raise
+            finally:
+                self.circuit_breaker.record(success, duration)
+            if use_cache:
+                await self.response_cache.set(key, operation, encode(result))
+            return result
+
+        return await self.single_flight.do(key, _generate_and_store, operation=operation)
 
     def parse_ollama_response(self, response: str) -> tuple[str, str]:
         """
@@ -193,7 +535,11 @@ class OllamaLLMEngine:
 
     def _format_validation_items(self, items: List[dict], item_type: str) -> str:
         """
-        Format validation issues or inferences for the prompt.
+        Format validation issues or inferences compactly for the prompt.
+
+        Items are ranked (critical/suspicious and error-level first, then warnings,
+        then info), duplicates are dropped, and the lowest-ranked items are omitted
+        when they do not fit the validation items token budget.
 
         Args:
             items (List[dict]): List of issue or inference dictionaries
@@ -223,25 +569,147 @@ class OllamaLLMEngine:
             "timestamp_anomaly",
         }
 
-        lines = []
-        for i, item in enumerate(items, 1):
-            if item_type == "issue":
-                field = item.get("field", "Unknown")
-                message = item.get("message", "")
-                level = item.get("level", "info")
+        level_rank = {"error": 0, "warning": 1, "info": 2}
 
-                is_critical = field in critical_issue_fields or level == "error"
-                marker = "⚠️ CRITICAL " if is_critical else ""
+        ranked_lines = []
+        seen = set()
+        for item in items:
+            level = item.get("level", "info")
+            if item_type == "issue":
+                name = item.get("field", "Unknown")
+                text = item.get("message", "")
+                flagged = name in critical_issue_fields or level == "error"
+                marker = "CRITICAL " if flagged else ""
+            else:
+                name = item.get("category", "Unknown")
+                text = item.get("observation", "")
+                flagged = name in high_suspicion_inferences
+                marker = "HIGH SUSPICION " if flagged else ""
+
+            line = f"{marker}[{level.upper()}] {name}: {' '.join(text.split())}"
+            if line in seen:
+                continue
+            seen.add(line)
+            rank = (0 if flagged else 1) * 3 + level_rank.get(level, 2)
+            ranked_lines.append((rank, line))
+
+        budget = config.LLM_PROMPT_TOKEN_BUDGET_VALIDATION_ITEMS // 2
+        text, omitted = fit_ranked_lines(ranked_lines, budget, self.model_name)
+        lines = [f"{i}. {line}" for i, line in enumerate(text.split("\n"), 1) if line]
+        if omitted:
+            metrics.increment("llm_prompt_items_omitted_total", omitted, operation="validation")
+            lines.append(f"(+{omitted} lower-priority {item_type}s omitted)")
+        return "\n".join(lines)
 
-                lines.append(f"{i}. {marker}[{level.upper()}] {field}: {message}")
-            elif item_type == "inference":
-                category = item.get("category", "Unknown")
-                observation = item.get("observation", "")
-                level = item.get("level", "info")
+    async def _invoke_structured(
+        self,
+        operation: str,
+        runnable: Any,
+        schema: type[BaseModel],
+        messages: List[BaseMessage],
+        prompt_tokens: int,
+    ) -> Any:
+        """
+        Run a structured-output call, retrying when the response does not parse.
 
-                is_suspicious = category in high_suspicion_inferences
-                marker = "🔴 HIGH SUSPICION " if is_suspicious else ""
+        Retries and generated token counts are exported per operation and mode
+        (llm_structured_output_retries_total, llm_structured_output_eval_tokens)
+        so the tool-calling and JSON-schema modes can be compared.
 
-                lines.append(f"{i}. {marker}[{level.upper()}] {category}: {observation}")
+        Raises:
+            AIProcessingError: If no attempt produced a valid response
+        """
+        error: Any = None
+        for attempt in range(config.LLM_STRUCTURED_OUTPUT_MAX_RETRIES + 1):
+            if attempt:
+                metrics.increment(
+                    "llm_structured_output_retries_total", operation=operation, mode=self.structured_output_mode
+                )
+            response = await runnable.ainvoke(messages)
+            if self.structured_output_mode == "json_schema":
+                raw = response
+                try:
+                    parsed = schema.model_validate_json(raw.content)
+                except PydanticValidationError as e:
+                    parsed, error = None, e
+            else:
+                raw, parsed, error = response.get("raw"), response.get("parsed"), response.get("parsing_error")
+
+            if raw is not None:
+                self._record_call(operation, raw.response_metadata, prompt_tokens)
+                eval_count = raw.response_metadata.get("eval_count")
+                if eval_count is not None:
+                    metrics.observe(
+                        "llm_structured_output_eval_tokens",
+                        eval_count,
+                        buckets=GENERATED_TOKEN_BUCKETS,
+                        operation=operation,
+                        mode=self.structured_output_mode,
+                    )
+            if parsed is not None:
+                return parsed
+
+        metrics.increment("llm_structured_output_failures_total", operation=operation, mode=self.structured_output_mode)
+        raise AIProcessingError(
+            f"Could not parse structured {operation} response",
+            details={"error": str(error), "model": self.model_name, "mode": self.structured_output_mode},
+        )
 
-        return "\n".join(lines)
+    def _record_call(self, operation: str, response_metadata: Dict[str, Any], prompt_tokens: int) -> None:
+        """Record a call's token counts and timings (skipped for backends that report none)."""
+        llm_telemetry.record(operation, self.model_name, response_metadata, prompt_tokens=prompt_tokens)
+
+    def _record_prompt_tokens(self, operation: str, messages: List[BaseMessage], saved: int) -> int:
+        """Log and export the prompt size and the tokens saved by budgeting; returns the prompt size."""
+        prompt_tokens = count_tokens(_prompt_text(messages), self.model_name)
+        saved = max(0, saved)
+        metrics.observe("llm_prompt_tokens", prompt_tokens, buckets=PROMPT_TOKEN_BUCKETS, operation=operation)
+        metrics.increment("llm_prompt_tokens_saved_total", saved, operation=operation)
+        main_logger.debug(
+            f"[TOKENS] {operation} prompt: {prompt_tokens} tokens ({saved} saved by budgeting)",
+            model=self.model_name,
+        )
+        return prompt_tokens
+
+
+def _prompt_text(messages: List[BaseMessage]) -> str:
+    return "\n".join(str(message.content) for message in messages)
+
+
+def _keep_alive(value: str) -> Any:
+    """Ollama takes keep_alive as a duration ("30m") or a number of seconds (-1 keeps the model loaded)."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+_engines: Dict[str, OllamaLLMEngine] = {}
+
+
+def get_llm_engine(
+    model: str = DEFAULT_MODEL,
+    cache: Optional[CacheInterface] = None,
+    chat_model_factory: Optional[Callable[[], Any]] = None,
+) -> OllamaLLMEngine:
+    """
+    Return the shared engine for a model, creating it on first use.
+
+    Services are instantiated per request, so sharing engines is what lets the
+    precompiled templates and runnables actually be reused across calls.
+
+    Args:
+        model (str): Ollama model name
+        cache (Optional[CacheInterface]): Cache used for LLM responses; attached
+            to the engine the first time one is provided
+        chat_model_factory (Optional[Callable]): Builds a non-Ollama chat model
+            for the engine on first use
+    """
+    engine = _engines.get(model)
+    if engine is None:
+        chat_model = chat_model_factory() if chat_model_factory else None
+        engine = OllamaLLMEngine(model=model, chat_model=chat_model)
+        _engines[model] = engine
+    if cache is not None and engine.response_cache is None:
+        engine.response_cache = LLMResponseCache(cache=cache)
+    return engine
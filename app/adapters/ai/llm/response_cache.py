@@ -0,0 +1,114 @@
+"""
+app.adapters.ai.llm.response_cache
+----------------------------------
+
+Redis-backed cache for LLM responses.
+
+Keys are built from the operation, the model name, the prompt-template version
+and a hash of the normalized call inputs, so changing a prompt or model never
+serves stale answers. Values are stored as JSON strings through any
+CacheInterface implementation (RedisCache in the running service).
+
+Typical Usage:
+    response_cache = LLMResponseCache(cache=redis_cache)
+    key = build_llm_cache_key("summary", "llava", {"content": text})
+    cached = await response_cache.get(key, "summary")
+    if cached is None:
+        ...
+        await response_cache.set(key, "summary", result)
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+from app.adapters.ai.llm.prompts import PROMPT_VERSIONS
+from app.adapters.cache.base import CacheInterface
+from app.core.config import config
+from app.core.exceptions import CacheError
+from app.infra.logger import StructuredLogger, LoggerStatus, main_logger
+from app.infra.metrics import metrics
+
+LLM_CACHE_KEY_PREFIX = "resq:llm"
+
+DEFAULT_TTLS: Dict[str, int] = {
+    "summary": config.LLM_CACHE_TTL_SUMMARY,
+    "categorization": config.LLM_CACHE_TTL_CATEGORIZATION,
+    "validation": config.LLM_CACHE_TTL_VALIDATION,
+}
+
+
+def normalize_llm_input(value: Any) -> Any:
+    """Collapse whitespace in strings (recursively) so trivially different inputs share a key."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {k: normalize_llm_input(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_llm_input(v) for v in value]
+    return value
+
+
+def build_llm_cache_key(operation: str, model: str, inputs: Dict[str, Any]) -> str:
+    """Build the cache key for an LLM call."""
+    payload = json.dumps(normalize_llm_input(inputs), sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    version = PROMPT_VERSIONS.get(operation, "0")
+    return f"{LLM_CACHE_KEY_PREFIX}:{operation}:{model}:v{version}:{digest}"
+
+
+class LLMResponseCache:
+    """
+    Per-operation TTL cache for LLM responses with hit/miss metrics.
+
+    Cache failures are logged and treated as misses; they never fail the LLM call.
+
+    Args:
+        cache: CacheInterface used for storage
+        ttls: Optional per-operation TTL overrides in seconds (0 disables the operation)
+        logger: StructuredLogger instance (optional, defaults to main_logger)
+    """
+
+    def __init__(
+        self,
+        cache: CacheInterface,
+        ttls: Optional[Dict[str, int]] = None,
+        logger: Optional[StructuredLogger] = None,
+    ):
+        self.cache = cache
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.logger = logger or main_logger
+
+    def is_enabled(self, operation: str) -> bool:
+        return config.LLM_CACHE_ENABLED and self.ttls.get(operation, 0) > 0
+
+    async def get(self, key: str, operation: str) -> Optional[Any]:
+        """Return the decoded cached value for a key, or None on a miss."""
+        start = time.perf_counter()
+        try:
+            raw = await self.cache.get(key)
+        except CacheError as e:
+            self.logger.log(f"[LLM CACHE] Lookup failed for {operation}: {e}", LoggerStatus.WARNING)
+            metrics.increment("llm_cache_errors_total", operation=operation)
+            return None
+        finally:
+            metrics.observe("llm_cache_lookup_seconds", time.perf_counter() - start, operation=operation)
+
+        if raw is None:
+            metrics.increment("llm_cache_requests_total", operation=operation, result="miss")
+            return None
+
+        metrics.increment("llm_cache_requests_total", operation=operation, result="hit")
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    async def set(self, key: str, operation: str, value: Any) -> None:
+        """Store a JSON-serializable value under a key with the operation's TTL."""
+        try:
+            await self.cache.set(key, json.dumps(value), ttl=self.ttls.get(operation))
+        except CacheError as e:
+            self.logger.log(f"[LLM CACHE] Store failed for {operation}: {e}", LoggerStatus.WARNING)
+            metrics.increment("llm_cache_errors_total", operation=operation)
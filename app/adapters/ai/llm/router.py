@@ -0,0 +1,261 @@
+"""
+app.adapters.ai.llm.router
+--------------------------
+
+Cost/latency-aware routing of LLM calls across the tiers in llm/models.py.
+
+For each call the router orders the tiers configured for the operation:
+    1. tiers that are usable (local, or cloud when enabled and installed)
+    2. whose context window fits the prompt
+    3. preferring tiers whose observed latency (EWMA, or the tier's prior)
+       fits the latency budget, cheapest first by the tier's per-1k-token
+       price for the prompt; equal prices keep the operation's preference
+       order
+The latency budget is the call's deadline: each attempt is bounded by the
+remaining budget and cancelled when it runs out; on timeout or error the next
+tier is tried. When the deadline passes, LLMDeadlineExceededError is raised so
+callers can answer from their degraded path. Cancelling an attempt cancels the
+generation itself (its single-flight task) unless another caller is still
+waiting for the same answer, so a timed-out call gives its scheduler slot and
+Ollama capacity back before the fallback tier runs.
+
+Every decision and its observed latency is recorded in metrics
+(llm_router_decisions_total, llm_router_latency_seconds) and in a bounded
+decision log exported on /metrics, so routing can be tuned.
+
+Typical Usage:
+    router = get_model_router(cache=redis_cache)
+    summary = await router.run(
+        "summary",
+        prompt_tokens,
+        lambda engine: engine.generate_report_summary(text),
+    )
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from app.adapters.ai.llm.models import ModelTier, build_chat_model, models
+from app.adapters.ai.llm.ollama import OllamaLLMEngine, get_llm_engine
+from app.adapters.ai.llm.token_budget import count_tokens
+from app.adapters.cache.base import CacheInterface
+from app.core.config import config
+from app.core.exceptions import AIProcessingError, LLMDeadlineExceededError
+from app.infra.logger import StructuredLogger, LoggerStatus, main_logger
+from app.infra.metrics import metrics
+
+T = TypeVar("T")
+
+# Tier preference per operation, best first
+OPERATION_TIERS: Dict[str, List[str]] = {
+    "summary": ["local_fast", "fast", "cheap"],
+    "categorization": ["local_fast", "local_balanced", "fast", "balanced"],
+    "validation": ["local_balanced", "local_fast", "balanced", "accurate"],
+}
+
+DEFAULT_LATENCY_BUDGETS: Dict[str, float] = {
+    "summary": config.LLM_LATENCY_BUDGET_SUMMARY,
+    "categorization": config.LLM_LATENCY_BUDGET_CATEGORIZATION,
+    "validation": config.LLM_LATENCY_BUDGET_VALIDATION,
+}
+
+
+def estimate_prompt_tokens(text: str) -> int:
+    """Token estimate used for tier selection."""
+    return max(1, count_tokens(text))
+
+
+class ModelRouter:
+    """
+    Picks a model tier per call and falls back through the remaining tiers.
+
+    Args:
+        tiers: Available tiers by name (defaults to llm/models.py)
+        operation_tiers: Tier preference per operation
+        cache: Optional cache attached to the engines for response caching
+        cloud_enabled: Whether cloud tiers may be used
+        ewma_alpha: Smoothing factor for observed latency
+        logger: StructuredLogger instance (optional, defaults to main_logger)
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, ModelTier]] = None,
+        operation_tiers: Optional[Dict[str, List[str]]] = None,
+        cache: Optional[CacheInterface] = None,
+        cloud_enabled: bool = config.LLM_ROUTER_CLOUD_ENABLED,
+        ewma_alpha: float = 0.2,
+        logger: Optional[StructuredLogger] = None,
+    ):
+        self.tiers = tiers or models
+        self.operation_tiers = operation_tiers or OPERATION_TIERS
+        self.cache = cache
+        self.cloud_enabled = cloud_enabled
+        self.ewma_alpha = ewma_alpha
+        self.logger = logger or main_logger
+        self.observed_latency: Dict[str, float] = {}
+        self.decisions: Deque[dict] = deque(maxlen=200)
+        self._unavailable: set = set()
+
+    def engine_for(self, tier: ModelTier) -> OllamaLLMEngine:
+        """Return the shared engine serving a tier."""
+        if tier.is_local:
+            return get_llm_engine(model=tier.model, cache=self.cache)
+        return get_llm_engine(model=tier.model, cache=self.cache, chat_model_factory=lambda: build_chat_model(tier))
+
+    def estimated_latency(self, operation: str, tier: ModelTier) -> float:
+        return self.observed_latency.get(f"{operation}:{tier.name}", tier.expected_latency_seconds)
+
+    @staticmethod
+    def estimated_cost(tier: ModelTier, prompt_tokens: int) -> float:
+        """Price of sending the prompt to a tier."""
+        return tier.cost_per_1k_tokens * prompt_tokens / 1000
+
+    def candidates(self, operation: str, prompt_tokens: int, latency_budget: float) -> List[ModelTier]:
+        """
+        Order the usable tiers for a call.
+
+        Args:
+            operation (str): Operation name ("summary", "categorization", "validation")
+            prompt_tokens (int): Estimated prompt size in tokens
+            latency_budget (float): Total latency budget in seconds
+
+        Returns:
+            List[ModelTier]: Tiers to try, in order
+        """
+        usable = []
+        for name in self.operation_tiers.get(operation, list(self.tiers)):
+            tier = self.tiers.get(name)
+            if tier is None or name in self._unavailable:
+                continue
+            if not tier.is_local and not self.cloud_enabled:
+                continue
+            if prompt_tokens > tier.context_tokens:
+                continue
+            usable.append(tier)
+
+        within_budget = [t for t in usable if self.estimated_latency(operation, t) <= latency_budget]
+        over_budget = [t for t in usable if t not in within_budget]
+        # sorted() is stable, so tiers of equal price keep the preference order
+        within_budget.sort(key=lambda t: self.estimated_cost(t, prompt_tokens))
+        return within_budget + over_budget
+
+    async def run(
+        self,
+        operation: str,
+        prompt_tokens: int,
+        call: Callable[[OllamaLLMEngine], Awaitable[T]],
+        latency_budget: Optional[float] = None,
+    ) -> T:
+        """
+        Run an engine call on the best tier, falling back on timeout or error.
+
+        Args:
+            operation (str): Operation name
+            prompt_tokens (int): Estimated prompt size in tokens
+            call (Callable): Receives the chosen engine and performs the call
+            latency_budget (Optional[float]): Deadline in seconds (defaults per operation)
+
+        Returns:
+            T: The result of the first successful attempt
+
+        Raises:
+            LLMDeadlineExceededError: If the deadline passed before any tier answered
+            AIProcessingError: If every candidate tier failed
+        """
+        budget = latency_budget if latency_budget is not None else DEFAULT_LATENCY_BUDGETS.get(operation, 60.0)
+        deadline = time.monotonic() + budget
+        candidates = self.candidates(operation, prompt_tokens, budget)
+        if not candidates:
+            raise AIProcessingError(f"No model tier available for {operation}", details={"prompt_tokens": prompt_tokens})
+
+        errors: Dict[str, str] = {}
+        for index, tier in enumerate(candidates):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                errors["deadline"] = "exceeded"
+                break
+            is_last = index == len(candidates) - 1
+            try:
+                engine = self.engine_for(tier)
+            except (ImportError, ValueError) as e:
+                self._unavailable.add(tier.name)
+                errors[tier.name] = f"unavailable: {e}"
+                continue
+
+            started = time.monotonic()
+            try:
+                # The last candidate may use the whole remaining budget; earlier
+                # ones leave room for a fallback attempt.
+                timeout = remaining if is_last else min(remaining, max(self.estimated_latency(operation, tier) * 2, remaining / 2))
+                result = await asyncio.wait_for(call(engine), timeout=timeout)
+            except asyncio.TimeoutError:
+                self._record(operation, tier, time.monotonic() - started, "timeout", prompt_tokens)
+                errors[tier.name] = "timeout"
+                continue
+            except Exception as e:  # pylint: disable=broad-except
+                self._record(operation, tier, time.monotonic() - started, "error", prompt_tokens)
+                errors[tier.name] = str(e)
+                self.logger.log(f"[ROUTER] {operation} failed on tier {tier.name}: {e}", LoggerStatus.WARNING)
+                continue
+
+            self._record(operation, tier, time.monotonic() - started, "success", prompt_tokens)
+            return result
+
+        if errors.get("deadline") or time.monotonic() >= deadline:
+            metrics.increment("llm_deadline_exceeded_total", operation=operation)
+            raise LLMDeadlineExceededError(
+                f"{operation} exceeded its {budget:.1f}s deadline", details={"errors": errors}
+            )
+        raise AIProcessingError(f"All model tiers failed for {operation}", details={"errors": errors})
+
+    def snapshot(self) -> dict:
+        """Return observed latencies and recent routing decisions."""
+        return {
+            "observed_latency": {k: round(v, 3) for k, v in self.observed_latency.items()},
+            "decisions": list(self.decisions),
+        }
+
+    def _record(self, operation: str, tier: ModelTier, latency: float, outcome: str, prompt_tokens: int) -> None:
+        key = f"{operation}:{tier.name}"
+        # Errors (open circuit, refused connection) fail fast and say nothing
+        # about how long an answer takes; only successes and timeouts count.
+        if outcome != "error":
+            if outcome == "timeout":
+                # A timeout only gives a lower bound; never let it lower the estimate.
+                latency_sample = max(latency, self.observed_latency.get(key, tier.expected_latency_seconds))
+            else:
+                latency_sample = latency
+            previous = self.observed_latency.get(key)
+            self.observed_latency[key] = (
+                latency_sample if previous is None else previous + self.ewma_alpha * (latency_sample - previous)
+            )
+
+        metrics.increment("llm_router_decisions_total", operation=operation, tier=tier.name, outcome=outcome)
+        metrics.observe("llm_router_latency_seconds", latency, operation=operation, tier=tier.name)
+        self.decisions.append(
+            {
+                "time": time.time(),
+                "operation": operation,
+                "tier": tier.name,
+                "model": tier.model,
+                "prompt_tokens": prompt_tokens,
+                "latency": round(latency, 3),
+                "outcome": outcome,
+            }
+        )
+
+
+_router: Optional[ModelRouter] = None
+
+
+def get_model_router(cache: Optional[CacheInterface] = None) -> ModelRouter:
+    """Return the shared router, attaching the cache the first time one is provided."""
+    global _router  # pylint: disable=global-statement
+    if _router is None:
+        _router = ModelRouter(cache=cache)
+    elif cache is not None and _router.cache is None:
+        _router.cache = cache
+    return _router
@@ -0,0 +1,200 @@
+"""
+app.adapters.ai.llm.scheduler
+-----------------------------
+
+Priority-aware admission control in front of the Ollama backend.
+
+Every LLM call acquires a slot from the shared LLMScheduler before it is sent
+to Ollama. Slots are granted to the highest priority class with waiters, within
+a global concurrency limit and a per-class limit. A lower class is starved only
+up to a bound: once its oldest waiter has queued longer than max_wait_seconds
+it is served ahead of higher classes.
+
+When an AIMDLimiter is attached, the global limit adapts to observed latency:
+every slot reports its duration and outcome to the limiter on release.
+
+Queue wait time, queue depth and in-flight calls are exported per class so
+priority inversions are visible on /metrics.
+
+Typical Usage:
+    async with llm_scheduler.slot(Priority.INTERACTIVE, operation="summary"):
+        response = await model.ainvoke(prompt)
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from app.adapters.ai.llm.concurrency import AIMDLimiter
+from app.core.config import config
+from app.infra.metrics import metrics
+
+
+class Priority(IntEnum):
+    """Priority classes, lower value is served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    BATCH = 2
+
+
+# Default priority class per engine operation
+OPERATION_PRIORITIES: Dict[str, Priority] = {
+    "summary": Priority.INTERACTIVE,
+    "categorization": Priority.BACKGROUND,
+    "validation": Priority.BATCH,
+}
+
+
+class LLMScheduler:
+    """
+    Admission scheduler with priority classes and per-class concurrency limits.
+
+    Args:
+        total_limit: Maximum number of concurrent LLM calls across all classes
+        class_limits: Maximum concurrent calls per priority class
+        max_wait_seconds: Starvation bound; a waiter older than this is served first
+        limiter: Optional AIMDLimiter replacing total_limit with an adaptive limit
+    """
+
+    def __init__(
+        self,
+        total_limit: int,
+        class_limits: Dict[Priority, int],
+        max_wait_seconds: float,
+        limiter: Optional[AIMDLimiter] = None,
+    ):
+        self.total_limit = total_limit
+        self.limiter = limiter
+        self.class_limits = class_limits
+        self.max_wait_seconds = max_wait_seconds
+        self.in_flight = 0
+        self.class_in_flight: Dict[Priority, int] = {p: 0 for p in Priority}
+        self.waiters: Dict[Priority, Deque[Tuple[float, asyncio.Future]]] = {p: deque() for p in Priority}
+
+    @classmethod
+    def from_config(cls) -> "LLMScheduler":
+        return cls(
+            total_limit=config.LLM_MAX_CONCURRENCY,
+            class_limits={
+                Priority.INTERACTIVE: config.LLM_CONCURRENCY_INTERACTIVE,
+                Priority.BACKGROUND: config.LLM_CONCURRENCY_BACKGROUND,
+                Priority.BATCH: config.LLM_CONCURRENCY_BATCH,
+            },
+            max_wait_seconds=config.LLM_SCHEDULER_MAX_WAIT_SECONDS,
+            limiter=AIMDLimiter.from_config() if config.LLM_AIMD_ENABLED else None,
+        )
+
+    def current_limit(self) -> int:
+        """Global concurrency limit currently in force."""
+        if self.limiter is not None:
+            return self.limiter.current()
+        return self.total_limit
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority, operation: str = "unknown") -> AsyncIterator[None]:
+        """
+        Hold a scheduler slot of the given priority for the duration of the block.
+
+        The block's duration and outcome are reported to the adaptive limiter;
+        a cancelled call (e.g. a missed deadline) counts by its elapsed time.
+        """
+        await self.acquire(priority)
+        started = time.monotonic()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            if self.limiter is not None:
+                self.limiter.record(
+                    time.monotonic() - started,
+                    error=error,
+                    in_flight=self.in_flight - 1,
+                    operation=operation,
+                )
+            self.release(priority)
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait until a slot of the given priority class is granted."""
+        enqueued_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self.waiters[priority].append((enqueued_at, future))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation; give it back.
+                self.release(priority)
+            else:
+                self._remove_waiter(priority, future)
+                self._publish(priority)
+            raise
+
+        metrics.observe(
+            "llm_scheduler_queue_wait_seconds",
+            time.monotonic() - enqueued_at,
+            priority=priority.name.lower(),
+        )
+
+    def release(self, priority: Priority) -> None:
+        """Return a slot and wake the next eligible waiter."""
+        self.in_flight -= 1
+        self.class_in_flight[priority] -= 1
+        self._publish(priority)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self.in_flight < self.current_limit():
+            priority = self._next_priority()
+            if priority is None:
+                return
+            _, future = self.waiters[priority].popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            self.class_in_flight[priority] += 1
+            future.set_result(None)
+            self._publish(priority)
+
+    def _next_priority(self) -> Optional[Priority]:
+        now = time.monotonic()
+        eligible = [
+            p for p in Priority
+            if self.waiters[p] and self.class_in_flight[p] < self.class_limits.get(p, self.total_limit)
+        ]
+        if not eligible:
+            return None
+
+        # Starvation bound: serve the longest-waiting class once it is over the limit.
+        starved = [p for p in eligible if now - self.waiters[p][0][0] >= self.max_wait_seconds]
+        if starved:
+            oldest = min(starved, key=lambda p: self.waiters[p][0][0])
+            if oldest != eligible[0]:
+                metrics.increment("llm_scheduler_starvation_promotions_total", priority=oldest.name.lower())
+            return oldest
+
+        return eligible[0]
+
+    def _remove_waiter(self, priority: Priority, future: asyncio.Future) -> None:
+        queue = self.waiters[priority]
+        for entry in queue:
+            if entry[1] is future:
+                queue.remove(entry)
+                return
+
+    def _publish(self, priority: Priority) -> None:
+        label = priority.name.lower()
+        metrics.set_gauge("llm_scheduler_queue_depth", len(self.waiters[priority]), priority=label)
+        metrics.set_gauge("llm_scheduler_in_flight", self.class_in_flight[priority], priority=label)
+
+
+# Shared scheduler: all engines talk to the same Ollama capacity.
+llm_scheduler = LLMScheduler.from_config()
@@ -0,0 +1,82 @@
+"""
+app.adapters.ai.llm.single_flight
+---------------------------------
+
+Single-flight coalescing for identical in-flight LLM calls.
+
+The first caller for a key starts the generation as a task; concurrent callers
+with the same key await that same task instead of starting their own. The task
+is shielded, so a cancelled caller does not cancel the generation for the
+others. When the last waiter is cancelled (e.g. every caller missed its
+deadline) the generation is cancelled too, so it frees its scheduler slot and
+Ollama capacity instead of finishing for nobody.
+
+Typical Usage:
+    flight = SingleFlight()
+    result = await flight.do(cache_key, lambda: model.ainvoke(prompt), operation="summary")
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from app.infra.metrics import metrics
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being generated."""
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], operation: str = "unknown") -> Any:
+        """
+        Run fn once per key among concurrent callers and share its result.
+
+        Args:
+            key (str): Identity of the call (e.g. the LLM cache key)
+            fn (Callable): Coroutine factory performing the work
+            operation (str): Operation label for metrics
+
+        Returns:
+            Any: The shared result; exceptions are propagated to every caller
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            metrics.increment("llm_singleflight_coalesced_total", operation=operation)
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            metrics.set_gauge("llm_singleflight_inflight", len(self._inflight))
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters.get(task) == 1 and not task.done():
+                # Nobody is left to receive the result: stop the generation and
+                # let the next caller for this key start a fresh one.
+                metrics.increment("llm_singleflight_abandoned_total", operation=operation)
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                task.cancel()
+            raise
+        finally:
+            remaining = self._waiters.get(task, 1) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            else:
+                self._waiters.pop(task, None)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        metrics.set_gauge("llm_singleflight_inflight", len(self._inflight))
+        # Mark the exception as retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,123 @@
+"""
+app.adapters.ai.llm.streaming
+-----------------------------
+
+Incremental parsing of streamed summary generations.
+
+The summarization prompt asks the model for:
+    Title: <short descriptive title>
+    Description: <expanded description>
+
+SummaryStreamParser consumes token chunks as they arrive and emits the title
+as soon as its line is complete, followed by description deltas, so callers can
+forward partial results (e.g. as Server-Sent Events) without waiting for the
+whole generation. Parsing rules match OllamaLLMEngine.parse_ollama_response.
+
+Typical Usage:
+    parser = SummaryStreamParser()
+    async for chunk in engine.stream_report_summary(content):
+        for event in parser.feed(chunk):
+            ...
+    for event in parser.finish():
+        ...
+"""
+
+from typing import List, Tuple
+
+DEFAULT_TITLE = "Untitled Report"
+DEFAULT_DESCRIPTION = "No description available"
+
+# Event types emitted by the parser
+TITLE_EVENT = "title"
+DESCRIPTION_EVENT = "description"
+
+
+class SummaryStreamParser:
+    """Stateful parser turning streamed text into (event, text) tuples."""
+
+    def __init__(self):
+        self.buffer = ""
+        self.title = None
+        self.description = ""
+        self.in_description = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """
+        Consume a chunk of generated text.
+
+        Args:
+            chunk (str): Newly generated text
+
+        Returns:
+            List[Tuple[str, str]]: ("title", full_title) once the title line is
+            complete, and ("description", delta) for description text
+        """
+        if self.in_description:
+            return self._description_delta(chunk)
+
+        events: List[Tuple[str, str]] = []
+        self.buffer += chunk
+        while "\n" in self.buffer and not self.in_description:
+            line, self.buffer = self.buffer.split("\n", 1)
+            events.extend(self._consume_line(line, complete=True))
+
+        if self.in_description and self.buffer:
+            remaining, self.buffer = self.buffer, ""
+            events.extend(self._description_delta(remaining))
+        elif self.buffer.strip().lower().startswith("description:"):
+            # Stream the description without waiting for its first line to end.
+            line, self.buffer = self.buffer, ""
+            events.extend(self._consume_line(line, complete=False))
+        return events
+
+    def finish(self) -> List[Tuple[str, str]]:
+        """
+        Flush buffered text at the end of the generation.
+
+        Returns:
+            List[Tuple[str, str]]: Any pending title/description events, including
+            default values when the model did not follow the expected format
+        """
+        events: List[Tuple[str, str]] = []
+        if self.buffer and not self.in_description:
+            line, self.buffer = self.buffer, ""
+            events.extend(self._consume_line(line, complete=True))
+
+        if self.title is None:
+            self.title = DEFAULT_TITLE
+            events.append((TITLE_EVENT, self.title))
+        if not self.description.strip():
+            self.description = DEFAULT_DESCRIPTION
+            events.append((DESCRIPTION_EVENT, self.description))
+        return events
+
+    def result(self) -> Tuple[str, str]:
+        """Return the (title, description) parsed so far."""
+        return self.title or DEFAULT_TITLE, self.description.strip() or DEFAULT_DESCRIPTION
+
+    def _consume_line(self, line: str, complete: bool) -> List[Tuple[str, str]]:
+        stripped = line.strip()
+        lowered = stripped.lower()
+        if lowered.startswith("title:") and self.title is None and complete:
+            self.title = stripped[6:].strip()
+            return [(TITLE_EVENT, self.title)]
+        if lowered.startswith("description:"):
+            events: List[Tuple[str, str]] = []
+            if self.title is None:
+                self.title = DEFAULT_TITLE
+                events.append((TITLE_EVENT, self.title))
+            self.in_description = True
+            text = stripped[12:].lstrip()
+            if complete:
+                text += "\n"
+            events.extend(self._description_delta(text))
+            return events
+        return []
+
+    def _description_delta(self, text: str) -> List[Tuple[str, str]]:
+        if not self.description:
+            text = text.lstrip()
+        if not text:
+            return []
+        self.description += text
+        return [(DESCRIPTION_EVENT, text)]
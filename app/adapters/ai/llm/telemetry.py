@@ -0,0 +1,162 @@
+"""
+app.adapters.ai.llm.telemetry
+-----------------------------
+
+Per-call token and timing telemetry for LLM calls.
+
+Ollama reports, with every response, how the call's time was spent:
+    load_duration         loading the model into memory
+    prompt_eval_count     prompt tokens evaluated (tokens after any cached prefix)
+    prompt_eval_duration  prompt evaluation (prefill)
+    eval_count            generated tokens
+    eval_duration         generation
+Durations are in nanoseconds. Each call is recorded with its operation, model,
+correlation ID, estimated prompt size and the time it waited for a scheduler
+slot, so a slow call can be attributed to loading, prefill, generation or
+queueing.
+
+Every call feeds the llm_call_* histograms, and a bounded window of recent calls
+per operation backs a rolling summary (averages, p50/p95 total time, time share
+per phase and the most expensive calls) exported on /metrics as "llm_calls".
+
+Typical Usage:
+    queue_wait_ctx.set(0.4)
+    llm_telemetry.record("categorization", "llava", response.response_metadata, prompt_tokens=812)
+    llm_telemetry.snapshot()
+"""
+
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import config
+from app.infra.logger import correlation_id_ctx, main_logger
+from app.infra.metrics import metrics
+
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+# Time the current call waited for a scheduler slot; set by the engine before the call.
+queue_wait_ctx: ContextVar[Optional[float]] = ContextVar("llm_queue_wait", default=None)
+
+_PHASES = ("queue_wait_seconds", "load_seconds", "prompt_eval_seconds", "eval_seconds")
+
+
+def _seconds(nanoseconds: Optional[int]) -> float:
+    return (nanoseconds or 0) / 1e9
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LLMTelemetry:
+    """
+    Records per-call LLM telemetry and keeps a rolling window per operation.
+
+    Args:
+        window_size: Recent calls kept per operation for the rolling summary
+        top_n: Most expensive calls listed per operation in the summary
+        prefix_hit_ratio: A call evaluating fewer than this share of its
+            estimated prompt tokens is counted as a prompt prefix cache hit
+    """
+
+    def __init__(self, window_size: int = 200, top_n: int = 5, prefix_hit_ratio: float = 0.5):
+        self.window_size = window_size
+        self.top_n = top_n
+        self.prefix_hit_ratio = prefix_hit_ratio
+        self.calls: Dict[str, Deque[dict]] = {}
+
+    def record(
+        self,
+        operation: str,
+        model: str,
+        response_metadata: Dict[str, Any],
+        prompt_tokens: int = 0,
+    ) -> Optional[dict]:
+        """
+        Record one call from its response metadata.
+
+        Args:
+            operation (str): Operation name ("summary", "categorization", "validation")
+            model (str): Model name
+            response_metadata (Dict[str, Any]): Response metadata of the LLM message
+            prompt_tokens (int): Estimated prompt size in tokens
+
+        Returns:
+            Optional[dict]: The recorded call, or None if the backend reports no timings
+        """
+        if "eval_count" not in response_metadata and "prompt_eval_duration" not in response_metadata:
+            return None
+
+        call = {
+            "time": time.time(),
+            "operation": operation,
+            "model": model,
+            "correlation_id": correlation_id_ctx.get(),
+            "prompt_tokens": prompt_tokens,
+            "prompt_eval_count": response_metadata.get("prompt_eval_count") or 0,
+            "eval_count": response_metadata.get("eval_count") or 0,
+            "queue_wait_seconds": round(queue_wait_ctx.get() or 0.0, 4),
+            "load_seconds": round(_seconds(response_metadata.get("load_duration")), 4),
+            "prompt_eval_seconds": round(_seconds(response_metadata.get("prompt_eval_duration")), 4),
+            "eval_seconds": round(_seconds(response_metadata.get("eval_duration")), 4),
+            "total_seconds": round(_seconds(response_metadata.get("total_duration")), 4),
+        }
+        call["prefix_cache_hit"] = call["prompt_eval_count"] < prompt_tokens * self.prefix_hit_ratio
+
+        labels = {"operation": operation, "model": model}
+        for phase in ("load_seconds", "prompt_eval_seconds", "eval_seconds", "total_seconds"):
+            metrics.observe(f"llm_call_{phase}", call[phase], **labels)
+        metrics.observe("llm_call_prompt_eval_tokens", call["prompt_eval_count"], buckets=TOKEN_BUCKETS, **labels)
+        metrics.observe("llm_call_eval_tokens", call["eval_count"], buckets=TOKEN_BUCKETS, **labels)
+        metrics.increment(
+            "llm_prompt_prefix_cache_total", operation=operation, result="hit" if call["prefix_cache_hit"] else "miss"
+        )
+        if call["load_seconds"] > 1.0:
+            metrics.increment("llm_model_loads_total", model=model)
+
+        window = self.calls.get(operation)
+        if window is None:
+            window = deque(maxlen=self.window_size)
+            self.calls[operation] = window
+        window.append(call)
+
+        main_logger.debug(
+            f"[LLM CALL] {operation}: queue {call['queue_wait_seconds']:.2f}s, load {call['load_seconds']:.2f}s, "
+            f"prompt {call['prompt_eval_count']}/{prompt_tokens} tokens in {call['prompt_eval_seconds']:.2f}s, "
+            f"generated {call['eval_count']} tokens in {call['eval_seconds']:.2f}s",
+            model=model,
+        )
+        return call
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Rolling per-operation summary of recent calls."""
+        summary = {}
+        for operation, window in self.calls.items():
+            calls = list(window)
+            if not calls:
+                continue
+            count = len(calls)
+            totals = [c["total_seconds"] + c["queue_wait_seconds"] for c in calls]
+            phase_sums = {phase: sum(c[phase] for c in calls) for phase in _PHASES}
+            elapsed = sum(totals) or 1.0
+            summary[operation] = {
+                "calls": count,
+                "avg_prompt_tokens": round(sum(c["prompt_tokens"] for c in calls) / count, 1),
+                "avg_prompt_eval_tokens": round(sum(c["prompt_eval_count"] for c in calls) / count, 1),
+                "avg_eval_tokens": round(sum(c["eval_count"] for c in calls) / count, 1),
+                "p50_seconds": round(_percentile(totals, 0.5), 3),
+                "p95_seconds": round(_percentile(totals, 0.95), 3),
+                "avg_seconds": {phase: round(total / count, 3) for phase, total in phase_sums.items()},
+                "time_share": {phase: round(total / elapsed, 3) for phase, total in phase_sums.items()},
+                "prefix_cache_hit_rate": round(sum(1 for c in calls if c["prefix_cache_hit"]) / count, 3),
+                "most_expensive": sorted(
+                    calls, key=lambda c: c["total_seconds"] + c["queue_wait_seconds"], reverse=True
+                )[: self.top_n],
+            }
+        return summary
+
+
+llm_telemetry = LLMTelemetry(window_size=config.LLM_TELEMETRY_WINDOW)
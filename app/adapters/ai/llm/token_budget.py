@@ -0,0 +1,102 @@
+"""
+app.adapters.ai.llm.token_budget
+--------------------------------
+
+Prompt token budgeting for the summarization, categorization and validation
+prompts.
+
+Prompt prefill dominates latency on CPU Ollama, so the variable parts of each
+prompt are rendered compactly and fitted to a configured token budget:
+    - count_tokens estimates tokens per model family without loading a tokenizer
+    - truncate_to_tokens cuts free text at a word boundary
+    - fit_ranked_lines keeps the most useful lines (by rank) that fit, and notes
+      how many were omitted
+
+Typical Usage:
+    text, omitted = fit_ranked_lines(ranked_lines, max_tokens=600, model="llava")
+    saved = count_tokens(verbose_text, model) - count_tokens(text, model)
+"""
+
+import re
+from typing import List, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+# Average characters per sub-word token for a word, by model family. SentencePiece
+# vocabularies (llama, llava, mistral) split English slightly finer than tiktoken.
+_CHARS_PER_TOKEN = {
+    "llama": 3.6,
+    "llava": 3.6,
+    "mistral": 3.6,
+    "gemma": 3.8,
+    "gpt": 4.0,
+    "claude": 3.8,
+    "gemini": 4.0,
+}
+_DEFAULT_CHARS_PER_TOKEN = 3.6
+
+
+def _chars_per_token(model: str) -> float:
+    model = (model or "").lower()
+    for family, ratio in _CHARS_PER_TOKEN.items():
+        if model.startswith(family):
+            return ratio
+    return _DEFAULT_CHARS_PER_TOKEN
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    """
+    Estimate the number of tokens a model's tokenizer produces for text.
+
+    Each punctuation mark counts as one token and each word as
+    ceil(len(word) / chars_per_token) tokens for the model family.
+    """
+    if not text:
+        return 0
+    ratio = _chars_per_token(model)
+    total = 0
+    for piece in _TOKEN_PATTERN.findall(text):
+        total += max(1, int(len(piece) / ratio + 0.999))
+    return total
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "") -> str:
+    """Cut text at a word boundary so it fits max_tokens, marking the cut with '…'."""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    words = text.split()
+    kept: List[str] = []
+    used = 1  # room for the ellipsis
+    for word in words:
+        cost = count_tokens(word, model)
+        if used + cost > max_tokens:
+            break
+        kept.append(word)
+        used += cost
+    return " ".join(kept) + " …"
+
+
+def fit_ranked_lines(lines: List[Tuple[int, str]], max_tokens: int, model: str = "") -> Tuple[str, int]:
+    """
+    Keep the best-ranked lines that fit the budget, preserving their original order.
+
+    Args:
+        lines (List[Tuple[int, str]]): (rank, line) pairs; lower rank is more useful
+        max_tokens (int): Token budget for the joined lines
+        model (str): Model name used for token counting
+
+    Returns:
+        Tuple[str, int]: The joined kept lines and the number of lines omitted
+    """
+    order = sorted(range(len(lines)), key=lambda i: (lines[i][0], i))
+    kept = set()
+    used = 0
+    for i in order:
+        cost = count_tokens(lines[i][1], model) + 1  # newline
+        if used + cost > max_tokens:
+            continue
+        kept.add(i)
+        used += cost
+    omitted = len(lines) - len(kept)
+    text = "\n".join(lines[i][1] for i in range(len(lines)) if i in kept)
+    return text, omitted
@@ -0,0 +1,197 @@
+"""
+app.adapters.ai.prediction.linear
+---------------------------------
+
+Logistic pre-screen model for predictive validation.
+
+A standardized logistic regression over the report's ValidationMetadata and its
+issue and inference counts estimates the probability that the report is valid.
+Reports it is sure about (probability above the valid threshold or below the
+invalid threshold) are decided without the LLM; the rest go to the LLM
+validator.
+
+The model is trained offline (app/scripts/train_validation_prescreen.py) on the
+verdicts in the predictive-validation stream, joined with the features the
+validator stores per report, and saved as a small JSON file: feature names,
+standardization mean/scale, weights and bias. Loading it is a json.load and
+scoring one report is a few NumPy operations on a vector of FEATURE_NAMES
+length; predict_proba scores a whole matrix at once.
+
+Typical Usage:
+    model = LogisticModel.load("models/validation_prescreen.json")
+    probability_valid = model.score(feature_vector(feature_dict(req_body.deterministic_validation)))
+    probabilities = model.predict_proba(feature_matrix(rows))
+"""
+
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.domain.schema.validate import DeterministicValidationData
+
+# Features of each validated report, stored by the validator for training
+TRAINING_FEATURES_KEY_PREFIX = "resq:validation:features"
+
+FEATURE_NAMES = (
+    "reporter_history_count",
+    "rejected_reports_count",
+    "rejection_rate",
+    "device_fingerprint_match",
+    "average_evidence_distance",
+    "report_frequency_score",
+    "issues_count",
+    "inferences_count",
+)
+
+
+def feature_dict(data: DeterministicValidationData) -> Dict[str, float]:
+    """Model features of a report, by name (stored by the validator for training)."""
+    metadata = data.metadata
+    history = metadata.reporter_history_count
+    return {
+        "reporter_history_count": float(history),
+        "rejected_reports_count": float(metadata.rejected_reports_count),
+        "rejection_rate": metadata.rejected_reports_count / history if history else 0.0,
+        "device_fingerprint_match": 1.0 if metadata.device_fingerprint_match else 0.0,
+        "average_evidence_distance": float(metadata.average_evidence_distance),
+        "report_frequency_score": float(metadata.report_frequency_score),
+        "issues_count": float(data.issues_count),
+        "inferences_count": float(data.inferences_count),
+    }
+
+
+def training_features_key(report_id: int) -> str:
+    """Cache key of a report's stored training features."""
+    return f"{TRAINING_FEATURES_KEY_PREFIX}:{report_id}"
+
+
+def feature_vector(features: Dict[str, float], names: Sequence[str] = FEATURE_NAMES) -> np.ndarray:
+    """Features in model order; missing features are 0."""
+    return np.array([features.get(name, 0.0) for name in names], dtype=np.float64)
+
+
+class LogisticModel:
+    """
+    Standardized logistic regression.
+
+    Args:
+        feature_names: Names of the input features, in column order
+        mean: Per-feature mean subtracted before scoring
+        scale: Per-feature standard deviation divided by before scoring
+        weights: Per-feature weights
+        bias: Intercept
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        mean: np.ndarray,
+        scale: np.ndarray,
+        weights: np.ndarray,
+        bias: float,
+    ):
+        self.feature_names = tuple(feature_names)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        # Fold the standardization into the weights: w . (x - m) / s + b = (w / s) . x + b'
+        self._coef = self.weights / self.scale
+        self._intercept = self.bias - float(self._coef @ self.mean)
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Probability of the positive class for each row of a feature matrix."""
+        return 1.0 / (1.0 + np.exp(-(features @ self._coef + self._intercept)))
+
+    def score(self, features: np.ndarray) -> float:
+        """Probability of the positive class for one feature vector."""
+        logit = float(features @ self._coef) + self._intercept
+        return 1.0 / (1.0 + math.exp(-max(-500.0, min(500.0, logit))))
+
+    def contributions(self, features: np.ndarray, top: int = 3) -> List[tuple]:
+        """The features moving one score furthest from the average report, as (name, log-odds change)."""
+        changes = self._coef * (features - self.mean)
+        order = np.argsort(-np.abs(changes))[:top]
+        return [(self.feature_names[i], float(changes[i])) for i in order if changes[i] != 0]
+
+    @classmethod
+    def fit(
+        cls,
+        features: np.ndarray,
+        labels: np.ndarray,
+        feature_names: Sequence[str] = FEATURE_NAMES,
+        l2: float = 1e-2,
+        learning_rate: float = 0.5,
+        epochs: int = 2000,
+    ) -> "LogisticModel":
+        """
+        Fit by full-batch gradient descent on the L2-regularized log loss.
+
+        Args:
+            features (np.ndarray): Feature matrix, one row per report
+            labels (np.ndarray): 1 for the positive class, 0 otherwise
+            feature_names (Sequence[str]): Column names
+            l2 (float): L2 penalty on the (standardized) weights
+            learning_rate (float): Gradient step size
+            epochs (int): Gradient steps
+
+        Returns:
+            LogisticModel: The fitted model
+        """
+        mean = features.mean(axis=0)
+        scale = features.std(axis=0)
+        scale[scale == 0] = 1.0
+        standardized = (features - mean) / scale
+        labels = labels.astype(np.float64)
+        weights = np.zeros(standardized.shape[1])
+        bias = float(np.log((labels.mean() + 1e-6) / (1 - labels.mean() + 1e-6)))
+        count = len(labels)
+        for _ in range(epochs):
+            predictions = 1.0 / (1.0 + np.exp(-(standardized @ weights + bias)))
+            error = predictions - labels
+            weights -= learning_rate * (standardized.T @ error / count + l2 * weights)
+            bias -= learning_rate * float(error.mean())
+        return cls(feature_names, mean, scale, weights, bias)
+
+    def to_dict(self) -> dict:
+        return {
+            "feature_names": list(self.feature_names),
+            "mean": self.mean.tolist(),
+            "scale": self.scale.tolist(),
+            "weights": self.weights.tolist(),
+            "bias": self.bias,
+        }
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "LogisticModel":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["feature_names"], data["mean"], data["scale"], data["weights"], data["bias"])
+
+
+def log_loss(probabilities: np.ndarray, labels: np.ndarray) -> float:
+    """Mean binary cross-entropy of predicted probabilities."""
+    clipped = np.clip(probabilities, 1e-9, 1 - 1e-9)
+    return float(-np.mean(labels * np.log(clipped) + (1 - labels) * np.log(1 - clipped)))
+
+
+def load_model(path: str) -> Optional[LogisticModel]:
+    """Load a saved model, or None when no model file exists at path."""
+    if not path or not os.path.exists(path):
+        return None
+    return LogisticModel.load(path)
+
+
+def feature_matrix(rows: List[Dict[str, float]], names: Sequence[str] = FEATURE_NAMES) -> np.ndarray:
+    """Stack feature dicts into a matrix for batch scoring or training."""
+    return np.array([[row.get(name, 0.0) for name in names] for row in rows], dtype=np.float64).reshape(-1, len(names))
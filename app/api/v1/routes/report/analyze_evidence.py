@@ -7,10 +7,11 @@ router = APIRouter()
 
 
 def get_processor(request: Request):
-    """Dependency to get processor with injected Redis stream and S3 client."""
+    """Dependency to get processor with injected Redis stream, cache and S3 client."""
     redis_stream = getattr(request.app.state, "redis_stream", None)
+    redis_cache = getattr(request.app.state, "redis_cache", None)
     s3_client = getattr(request.app.state, "s3_client", None)
-    return ResQAIProcessor(stream=redis_stream, s3_client=s3_client)
+    return ResQAIProcessor(stream=redis_stream, s3_client=s3_client, cache=redis_cache)
 
 
 async def process_evidence(
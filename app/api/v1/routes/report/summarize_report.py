@@ -1,4 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends
+import json
+from typing import AsyncIterator
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 from app.domain.schema.upload import (
     AIResponseLightSummarizationRequest,
     AIResponseLightSummarizationResponse,
@@ -9,8 +12,10 @@ from app.services.ai_processor import ResQAIProcessor
 router = APIRouter()
 
 
-def get_processor():
-    return ResQAIProcessor()
+def get_processor(request: Request):
+    """Dependency to get processor with injected Redis cache for LLM response caching."""
+    redis_cache = getattr(request.app.state, "redis_cache", None)
+    return ResQAIProcessor(cache=redis_cache)
 
 
 @router.post("/light-summarize", response_model=AIResponseLightSummarizationResponse)
@@ -25,9 +30,37 @@ async def summarize_report_text_content(
         return AIResponseLightSummarizationResponse(
             title=result.get("title", "Untitled"),
             description=result.get("description", ""),
+            degraded=result.get("degraded", False),
         )
     except Exception as e:
         main_logger.log(f"error processing text content: {e}", "ERROR")
         raise HTTPException(
             status_code=500, detail=f"Processing failed: {str(e)}"
         ) from e
+
+
+async def _encode_sse(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """Encode processor stream events as Server-Sent Events."""
+    async for event in events:
+        yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+@router.post("/light-summarize/stream")
+async def stream_summarize_report_text_content(
+    request: AIResponseLightSummarizationRequest,
+    processor: ResQAIProcessor = Depends(get_processor),
+):
+    """
+    Server-Sent Events variant of /light-summarize.
+
+    Streams a `title` event as soon as the title line is generated, then
+    `description` events carrying text deltas, and a final `done` event with
+    the complete title and description. Errors after streaming has started are
+    reported as an `error` event.
+    """
+    events = processor.stream_report_tags(request.tags, request.extra_description)
+    return StreamingResponse(
+        _encode_sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
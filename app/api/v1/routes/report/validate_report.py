@@ -16,7 +16,8 @@ def get_validator(request: Request):
     Dependency to get validator with injected dependencies.
     """
     redis_stream = getattr(request.app.state, "redis_stream", None)
-    return ResQAIValidator(stream=redis_stream)
+    redis_cache = getattr(request.app.state, "redis_cache", None)
+    return ResQAIValidator(stream=redis_stream, cache=redis_cache)
 
 
 async def process_validation(
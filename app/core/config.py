@@ -37,6 +37,97 @@ class Config:
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
+    # LLM Model Configuration
+    OLLAMA_FAST_MODEL: str = os.getenv("OLLAMA_FAST_MODEL", "llava")
+    OLLAMA_BALANCED_MODEL: str = os.getenv("OLLAMA_BALANCED_MODEL", "llama2-uncensored")
+    # How long Ollama keeps a model (and its prompt KV cache) loaded after a call
+    OLLAMA_KEEP_ALIVE: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+    # Ollama hosts to balance calls across (comma-separated base URLs; empty uses the default host)
+    OLLAMA_HOSTS: str = os.getenv("OLLAMA_HOSTS", "")
+    OLLAMA_BACKEND_MAX_FAILURES: int = int(os.getenv("OLLAMA_BACKEND_MAX_FAILURES", "2"))
+    OLLAMA_BACKEND_SPILLOVER_OUTSTANDING: int = int(os.getenv("OLLAMA_BACKEND_SPILLOVER_OUTSTANDING", "4"))
+    OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS: float = float(os.getenv("OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS", "10"))
+    LLM_ROUTER_CLOUD_ENABLED: bool = os.getenv("LLM_ROUTER_CLOUD_ENABLED", "false").lower() == "true"
+    LLM_LATENCY_BUDGET_SUMMARY: float = float(os.getenv("LLM_LATENCY_BUDGET_SUMMARY", "30"))
+    LLM_LATENCY_BUDGET_CATEGORIZATION: float = float(os.getenv("LLM_LATENCY_BUDGET_CATEGORIZATION", "60"))
+    LLM_LATENCY_BUDGET_VALIDATION: float = float(os.getenv("LLM_LATENCY_BUDGET_VALIDATION", "120"))
+
+    # LLM Prompt Token Budgets (estimated tokens for the variable parts of prompts)
+    LLM_PROMPT_TOKEN_BUDGET_SUMMARY: int = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET_SUMMARY", "512"))
+    LLM_PROMPT_TOKEN_BUDGET_REPORT: int = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET_REPORT", "400"))
+    LLM_PROMPT_TOKEN_BUDGET_CATEGORIES: int = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET_CATEGORIES", "1200"))
+    LLM_PROMPT_CATEGORY_DESCRIPTION_TOKENS: int = int(os.getenv("LLM_PROMPT_CATEGORY_DESCRIPTION_TOKENS", "24"))
+    LLM_PROMPT_TOKEN_BUDGET_VALIDATION_ITEMS: int = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET_VALIDATION_ITEMS", "600"))
+
+    # LLM Structured Output ("tool_calling" or "json_schema" for Ollama's schema-constrained decoding)
+    LLM_STRUCTURED_OUTPUT_MODE: str = os.getenv("LLM_STRUCTURED_OUTPUT_MODE", "tool_calling")
+    LLM_STRUCTURED_OUTPUT_MAX_RETRIES: int = int(os.getenv("LLM_STRUCTURED_OUTPUT_MAX_RETRIES", "1"))
+
+    # Category tree cache (parsed trees kept in process; invalidated by keyspace notifications)
+    CATEGORY_TREE_TTL_SECONDS: float = float(os.getenv("CATEGORY_TREE_TTL_SECONDS", "300"))
+    CATEGORY_TREE_KEY_PATTERN: str = os.getenv("CATEGORY_TREE_KEY_PATTERN", "categories*")
+    CATEGORY_TREE_KEYSPACE_NOTIFICATIONS: bool = os.getenv("CATEGORY_TREE_KEYSPACE_NOTIFICATIONS", "true").lower() == "true"
+
+    # Categorizer (concurrent LLM calls per report when drilling into sibling categories)
+    CATEGORIZER_MAX_PARALLEL_BRANCHES: int = int(os.getenv("CATEGORIZER_MAX_PARALLEL_BRANCHES", "3"))
+    # Branches followed per level, confidence (0-100) below which branches are pruned, LLM calls per report (0 = no limit)
+    CATEGORIZER_MAX_BRANCHES_PER_LEVEL: int = int(os.getenv("CATEGORIZER_MAX_BRANCHES_PER_LEVEL", "2"))
+    CATEGORIZER_CONFIDENCE_FLOOR: float = float(os.getenv("CATEGORIZER_CONFIDENCE_FLOOR", "40"))
+    CATEGORIZER_MAX_LLM_CALLS: int = int(os.getenv("CATEGORIZER_MAX_LLM_CALLS", "6"))
+    # "recursive" (one LLM call per level and matched branch) or "flat" (one call over all leaf paths)
+    CATEGORIZER_MODE: str = os.getenv("CATEGORIZER_MODE", "recursive")
+    CATEGORIZER_FLAT_TOKEN_BUDGET: int = int(os.getenv("CATEGORIZER_FLAT_TOKEN_BUDGET", "2400"))
+    # BM25 shortlist: best-matching categories offered per level / in flat mode (0 offers all)
+    CATEGORIZER_SHORTLIST_K: int = int(os.getenv("CATEGORIZER_SHORTLIST_K", "8"))
+    CATEGORIZER_SHORTLIST_FLAT_K: int = int(os.getenv("CATEGORIZER_SHORTLIST_FLAT_K", "20"))
+    CATEGORIZER_CATCH_ALL_SLUGS: str = os.getenv("CATEGORIZER_CATCH_ALL_SLUGS", "other,others,general,miscellaneous")
+    # Keyword fast path: confident keyword matches (at most MAX_MATCHES leaves) skip the LLM
+    CATEGORIZER_KEYWORD_FAST_PATH: bool = os.getenv("CATEGORIZER_KEYWORD_FAST_PATH", "true").lower() == "true"
+    CATEGORIZER_KEYWORD_MAX_MATCHES: int = int(os.getenv("CATEGORIZER_KEYWORD_MAX_MATCHES", "1"))
+    CATEGORIZER_SYNONYMS_PATH: str = os.getenv("CATEGORIZER_SYNONYMS_PATH", "")
+
+    # Predictive validation rule engine (clear cases decided without the LLM; JSON rules file replaces the defaults)
+    VALIDATION_RULES_ENABLED: bool = os.getenv("VALIDATION_RULES_ENABLED", "true").lower() == "true"
+    VALIDATION_RULES_PATH: str = os.getenv("VALIDATION_RULES_PATH", "")
+    # Logistic pre-screen model (empty path or missing file disables it); probability-valid thresholds
+    VALIDATION_PRESCREEN_MODEL_PATH: str = os.getenv("VALIDATION_PRESCREEN_MODEL_PATH", "models/validation_prescreen.json")
+    VALIDATION_PRESCREEN_VALID_THRESHOLD: float = float(os.getenv("VALIDATION_PRESCREEN_VALID_THRESHOLD", "0.95"))
+    VALIDATION_PRESCREEN_INVALID_THRESHOLD: float = float(os.getenv("VALIDATION_PRESCREEN_INVALID_THRESHOLD", "0.05"))
+    # Per-report features kept for training the pre-screen model (0 disables)
+    VALIDATION_FEATURES_TTL_SECONDS: int = int(os.getenv("VALIDATION_FEATURES_TTL_SECONDS", "2592000"))
+
+    # LLM call telemetry (recent calls kept per operation for the /metrics summary)
+    LLM_TELEMETRY_WINDOW: int = int(os.getenv("LLM_TELEMETRY_WINDOW", "200"))
+
+    # LLM Circuit Breaker Configuration
+    LLM_CIRCUIT_FAILURE_RATE: float = float(os.getenv("LLM_CIRCUIT_FAILURE_RATE", "0.5"))
+    LLM_CIRCUIT_MIN_CALLS: int = int(os.getenv("LLM_CIRCUIT_MIN_CALLS", "5"))
+    LLM_CIRCUIT_WINDOW_SECONDS: float = float(os.getenv("LLM_CIRCUIT_WINDOW_SECONDS", "60"))
+    LLM_CIRCUIT_OPEN_SECONDS: float = float(os.getenv("LLM_CIRCUIT_OPEN_SECONDS", "30"))
+    LLM_CIRCUIT_SLOW_CALL_SECONDS: float = float(os.getenv("LLM_CIRCUIT_SLOW_CALL_SECONDS", "90"))
+
+    # LLM Response Cache Configuration (TTLs in seconds, 0 disables caching)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL_SUMMARY: int = int(os.getenv("LLM_CACHE_TTL_SUMMARY", "86400"))
+    LLM_CACHE_TTL_CATEGORIZATION: int = int(os.getenv("LLM_CACHE_TTL_CATEGORIZATION", "3600"))
+    LLM_CACHE_TTL_VALIDATION: int = int(os.getenv("LLM_CACHE_TTL_VALIDATION", "600"))
+    # Whole categorization results per normalized report text and tree version (0 disables)
+    CATEGORIZATION_RESULT_CACHE_TTL: int = int(os.getenv("CATEGORIZATION_RESULT_CACHE_TTL", "86400"))
+
+    # LLM Scheduler Configuration
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+    LLM_CONCURRENCY_INTERACTIVE: int = int(os.getenv("LLM_CONCURRENCY_INTERACTIVE", "4"))
+    LLM_CONCURRENCY_BACKGROUND: int = int(os.getenv("LLM_CONCURRENCY_BACKGROUND", "2"))
+    LLM_CONCURRENCY_BATCH: int = int(os.getenv("LLM_CONCURRENCY_BATCH", "1"))
+    LLM_SCHEDULER_MAX_WAIT_SECONDS: float = float(os.getenv("LLM_SCHEDULER_MAX_WAIT_SECONDS", "30"))
+
+    # Adaptive (AIMD) concurrency; LLM_MAX_CONCURRENCY is the starting limit
+    LLM_AIMD_ENABLED: bool = os.getenv("LLM_AIMD_ENABLED", "true").lower() == "true"
+    LLM_AIMD_MIN_CONCURRENCY: int = int(os.getenv("LLM_AIMD_MIN_CONCURRENCY", "1"))
+    LLM_AIMD_MAX_CONCURRENCY: int = int(os.getenv("LLM_AIMD_MAX_CONCURRENCY", "16"))
+    LLM_AIMD_TARGET_LATENCY_SECONDS: float = float(os.getenv("LLM_AIMD_TARGET_LATENCY_SECONDS", "20"))
+    LLM_AIMD_DECREASE_FACTOR: float = float(os.getenv("LLM_AIMD_DECREASE_FACTOR", "0.5"))
+
     @classmethod
     def validate_aws_credentials(cls) -> bool:
         """
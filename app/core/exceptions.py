@@ -73,6 +73,18 @@ class AIProcessingError(InfrastructureException):
     pass
 
 
+class LLMDeadlineExceededError(AIProcessingError):
+    """LLM call did not complete before its deadline."""
+
+    pass
+
+
+class LLMCircuitOpenError(AIProcessingError):
+    """LLM backend circuit breaker is open; the call was rejected without being sent."""
+
+    pass
+
+
 class DatabaseError(InfrastructureException):
     """Database operation errors."""
 
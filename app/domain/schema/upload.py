@@ -60,6 +60,7 @@ class AIResponse(BaseModel):
 class AIResponseLightSummarizationResponse(BaseModel):
     title: str
     description: str
+    degraded: bool = False  # True when the extractive fallback answered instead of the LLM
 
 
 class AIResponseLightSummarizationRequest(BaseModel):
@@ -0,0 +1,100 @@
+"""
+In-process metrics registry.
+
+Counters, gauges and histograms are kept in memory per worker process and
+exposed as a JSON snapshot on the /metrics endpoint. Labels are passed as
+keyword arguments and rendered as "key=value" pairs.
+"""
+
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60,
+)
+
+
+def _label_key(labels: Dict[str, object]) -> str:
+    if not labels:
+        return ""
+    return ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+
+
+class Histogram:
+    """Cumulative bucket histogram with sum and count."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+class MetricsRegistry:
+    """Registry of named counters, gauges and histograms."""
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[str, float]] = {}
+        self.gauges: Dict[str, Dict[str, float]] = {}
+        self.histograms: Dict[str, Dict[str, Histogram]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Increase a counter."""
+        series = self.counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Set a gauge to an absolute value."""
+        self.gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(
+        self, name: str, value: float, buckets: Optional[Tuple[float, ...]] = None, **labels
+    ) -> None:
+        """Record a value into a histogram."""
+        series = self.histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = Histogram(buckets or DEFAULT_BUCKETS)
+            series[key] = histogram
+        histogram.observe(value)
+
+    def get_counter(self, name: str, **labels) -> float:
+        """Read the current value of a counter (0 if never incremented)."""
+        return self.counters.get(name, {}).get(_label_key(labels), 0)
+
+    def snapshot(self) -> dict:
+        """Return all metrics as a JSON-serializable dictionary."""
+        return {
+            "counters": {name: dict(series) for name, series in self.counters.items()},
+            "gauges": {name: dict(series) for name, series in self.gauges.items()},
+            "histograms": {
+                name: {key: hist.snapshot() for key, hist in series.items()}
+                for name, series in self.histograms.items()
+            },
+        }
+
+
+# Create singleton instance
+metrics = MetricsRegistry()
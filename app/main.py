@@ -1,5 +1,6 @@
+import asyncio
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Any, Dict
 from fastapi import FastAPI
 from dotenv import load_dotenv
 from app.api.middleware.correlation_id import CorrelationIdMiddleware
@@ -9,6 +10,13 @@ from app.adapters.cache.redis import RedisCache
 from app.adapters.cache.redis_stream import RedisStream
 from app.adapters.storage.s3 import S3Client
 from app.infra.logger import main_logger
+from app.infra.metrics import metrics
+from app.adapters.ai.llm.scheduler import llm_scheduler
+from app.adapters.ai.llm.router import get_model_router
+from app.adapters.ai.llm.circuit_breaker import CircuitState, circuit_breaker_states
+from app.adapters.ai.llm.telemetry import llm_telemetry
+from app.adapters.ai.llm.backends import ollama_backends
+from app.services.category_tree import category_tree_cache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -48,8 +56,26 @@ async def lifespan(fastapi_app: FastAPI):
         # Don't raise - S3 is optional if not processing evidence
         fastapi_app.state.s3_client = None
 
+    # Startup: Health-check the Ollama backend pool (only when OLLAMA_HOSTS is set)
+    backend_health_task = None
+    if ollama_backends.enabled:
+        backend_health_task = asyncio.create_task(ollama_backends.run_health_checks())
+        main_logger.log(f"Ollama backend pool started with {len(ollama_backends.backends)} hosts", "INFO")
+
+    # Startup: Invalidate cached category trees when they change in Redis
+    category_tree_task = None
+    if config.CATEGORY_TREE_KEYSPACE_NOTIFICATIONS:
+        category_tree_task = asyncio.create_task(
+            category_tree_cache.run_invalidation_listener(redis_cache.redis)
+        )
+
     yield
 
+    # Shutdown: Stop background tasks
+    for task in (backend_health_task, category_tree_task):
+        if task is not None:
+            task.cancel()
+
     # Shutdown: Close Redis stream connection
     try:
         if hasattr(fastapi_app.state, "redis_stream") and fastapi_app.state.redis_stream:
@@ -94,14 +120,47 @@ async def root() -> Dict[str, str]:
 
 
 @app.get("/health", tags=["Health"])
-async def health_check() -> Dict[str, str]:
+async def health_check() -> Dict[str, Any]:
     """
     Health check endpoint that returns the status of the API.
 
+    The API reports "degraded" while any LLM backend circuit is not closed or
+    any Ollama host is ejected; requests are still served, from cache, the
+    remaining hosts or the fallback paths.
+
+    Returns:
+        Dict[str, Any]: Status of the API, the LLM backend circuit breakers and the Ollama hosts.
+    """
+    circuits = circuit_breaker_states()
+    hosts = ollama_backends.snapshot()
+    if any(c["state"] != CircuitState.CLOSED.value for c in circuits.values()) or any(
+        not h["healthy"] for h in hosts
+    ):
+        return {
+            "status": "degraded",
+            "message": "ResQ AI API is up, some LLM backends are unavailable",
+            "llm_circuits": circuits,
+            "ollama_hosts": hosts,
+        }
+    return {"status": "ok", "message": "ResQ AI API is healthy", "llm_circuits": circuits, "ollama_hosts": hosts}
+
+
+@app.get("/metrics", tags=["Health"])
+async def get_metrics() -> Dict[str, dict]:
+    """
+    Metrics endpoint exposing in-process counters, gauges and histograms.
+
     Returns:
-        Dict[str, str]: Status indicating the API is healthy.
+        Dict[str, dict]: Snapshot of the metrics registry for this worker,
+        plus the adaptive LLM concurrency limit, model routing decisions and
+        a rolling per-operation summary of LLM call token counts and timings.
     """
-    return {"status": "ok", "message": "ResQ AI API is healthy"}
+    snapshot = metrics.snapshot()
+    if llm_scheduler.limiter is not None:
+        snapshot["llm_concurrency"] = llm_scheduler.limiter.snapshot()
+    snapshot["llm_router"] = get_model_router().snapshot()
+    snapshot["llm_calls"] = llm_telemetry.snapshot()
+    return snapshot
 
 
 # Include application routers
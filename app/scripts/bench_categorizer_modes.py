@@ -0,0 +1,137 @@
+"""
+Compare categorizer modes on a fixed labelled set.
+
+Each report is categorized once per variant, in process, against the configured
+Ollama host(s):
+    recursive            the recursive mode with the configured branch pruning
+                         and LLM call cap
+    recursive-unbounded  the recursive mode following every selected branch
+    flat                 one call over all leaf paths
+Per variant the benchmark reports latency percentiles, LLM calls per report,
+and accuracy against the labels (exact match and any overlap); it then reports
+how often each variant agrees with the first one, which shows what pruning
+saves and whether it costs quality. The LLM response cache, the categorization
+result cache and the keyword fast path are disabled so every run measures real
+calls.
+
+The default set is the sample tree and reports of app/scripts/bench_service.py.
+A custom set is a JSON file:
+    {"tree": [...category nodes...],
+     "reports": [{"title": "...", "description": "...", "labels": [11, 31]}]}
+
+With app/scripts/fake_ollama.py this runs without a model:
+    python -m app.scripts.fake_ollama --port 11500 &
+    OLLAMA_HOST=http://127.0.0.1:11500 python -m app.scripts.bench_categorizer_modes
+
+Run with: python -m app.scripts.bench_categorizer_modes [--dataset set.json] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+from app.adapters.cache.redis import RedisCache
+from app.core.config import config
+from app.infra.metrics import metrics
+from app.scripts.bench_service import SAMPLE_REPORTS, SAMPLE_TREE
+from app.services.ai_categorizer import ResQAICategorizer
+
+# name -> (categorizer mode, config overrides)
+VARIANTS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "recursive": ("recursive", {}),
+    "recursive-unbounded": (
+        "recursive",
+        {"CATEGORIZER_MAX_BRANCHES_PER_LEVEL": 0, "CATEGORIZER_CONFIDENCE_FLOOR": 0.0, "CATEGORIZER_MAX_LLM_CALLS": 0},
+    ),
+    "flat": ("flat", {}),
+}
+
+# Expected leaf categories of SAMPLE_REPORTS in SAMPLE_TREE, in order.
+SAMPLE_LABELS = [[11], [31], [21], [4], [32], [22]]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _llm_calls() -> float:
+    decisions = metrics.counters.get("llm_router_decisions_total", {})
+    return sum(count for labels, count in decisions.items() if "operation=categorization" in labels)
+
+
+def _load_dataset(path: str) -> tuple:
+    if not path:
+        reports = [
+            {"title": title, "description": description, "labels": labels}
+            for (title, description), labels in zip(SAMPLE_REPORTS, SAMPLE_LABELS)
+        ]
+        return SAMPLE_TREE, reports
+    with open(path, encoding="utf-8") as f:
+        dataset = json.load(f)
+    return dataset["tree"], dataset["reports"]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    config.LLM_CACHE_ENABLED = False
+    config.CATEGORIZATION_RESULT_CACHE_TTL = 0
+    config.CATEGORIZER_KEYWORD_FAST_PATH = False  # compare the LLM modes on every report
+    tree, reports = _load_dataset(args.dataset)
+    cache = RedisCache()
+    await cache.set(args.category_key, json.dumps(tree))
+    categorizer = ResQAICategorizer(cache=cache)
+
+    predictions: Dict[str, List[Set[int]]] = {name: [] for name in VARIANTS}
+    for name, (mode, overrides) in VARIANTS.items():
+        defaults = {key: getattr(config, key) for key in overrides}
+        for key, value in overrides.items():
+            setattr(config, key, value)
+        latencies: List[float] = []
+        calls_before = _llm_calls()
+        exact = overlap = 0
+        for _ in range(args.repeat):
+            for report in reports:
+                started = time.perf_counter()
+                result = await categorizer.categorize_report(
+                    report["title"], report["description"], args.category_key, mode=mode
+                )
+                latencies.append(time.perf_counter() - started)
+                predicted = {category.id for category in result}
+                labels = set(report["labels"])
+                exact += predicted == labels
+                overlap += bool(predicted & labels)
+                predictions[name].append(predicted)
+        for key, value in defaults.items():
+            setattr(config, key, value)
+
+        runs = len(latencies)
+        print(f"\n{name}: {runs} categorizations")
+        print(
+            f"  latency:   p50 {_percentile(latencies, 0.5):.3f}s  p95 {_percentile(latencies, 0.95):.3f}s  "
+            f"mean {sum(latencies) / runs:.3f}s"
+        )
+        print(f"  LLM calls: {(_llm_calls() - calls_before) / runs:.2f} per report")
+        print(f"  accuracy:  exact {exact / runs:.1%}  any overlap {overlap / runs:.1%}")
+
+    baseline, *others = VARIANTS
+    print()
+    for name in others:
+        pairs = list(zip(predictions[baseline], predictions[name]))
+        agree = sum(1 for a, b in pairs if a == b)
+        jaccard = sum(len(a & b) / len(a | b) if a | b else 1.0 for a, b in pairs) / len(pairs)
+        print(f"agreement {baseline} vs {name}: exact {agree / len(pairs):.1%}  mean Jaccard {jaccard:.2f}")
+    await cache.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare categorizer modes on a labelled set")
+    parser.add_argument("--dataset", default="", help="JSON file with a tree and labelled reports")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--category-key", default="categories:bench-modes")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for prompt construction overhead in OllamaLLMEngine.
+
+Compares building the categorization/validation prompt templates and
+structured-output runnables on every call (the old behaviour) against the
+precompiled ones held by the engine. No Ollama server is contacted.
+
+Run with: python -m app.scripts.bench_llm_prompts [iterations]
+"""
+
+import sys
+import time
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.adapters.ai.llm.ollama import (
+    CategoryResponse,
+    OllamaLLMEngine,
+    ValidationResponse,
+)
+from app.adapters.ai.llm.prompts import (
+    REPORT_CATEGORIZATION_SYSTEM_PROMPT,
+    REPORT_CATEGORIZATION_PROMPT,
+    PREDICTIVE_VALIDATION_SYSTEM_PROMPT,
+    PREDICTIVE_VALIDATION_PROMPT,
+)
+
+
+def _per_call(engine: OllamaLLMEngine, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        ChatPromptTemplate.from_messages(
+            [("system", REPORT_CATEGORIZATION_SYSTEM_PROMPT), ("human", REPORT_CATEGORIZATION_PROMPT)]
+        ).format_messages(title="t", description="d", categories="c")
+        engine.model.with_structured_output(CategoryResponse, include_raw=True)
+        ChatPromptTemplate.from_messages(
+            [("system", PREDICTIVE_VALIDATION_SYSTEM_PROMPT), ("human", PREDICTIVE_VALIDATION_PROMPT)]
+        )
+        engine.model.with_structured_output(ValidationResponse, include_raw=True)
+    return time.perf_counter() - start
+
+
+def _precompiled(engine: OllamaLLMEngine, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        engine.categorization_prompt_template.format_messages(
+            title="t", description="d", categories="c"
+        )
+        _ = engine.categorization_model
+        _ = engine.validation_prompt_template
+        _ = engine.validation_model
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    engine = OllamaLLMEngine()
+
+    per_call = _per_call(engine, iterations)
+    precompiled = _precompiled(engine, iterations)
+
+    print(f"Iterations: {iterations}")
+    print(f"Per-call compilation: {per_call / iterations * 1e6:10.1f} us/call")
+    print(f"Precompiled:          {precompiled / iterations * 1e6:10.1f} us/call")
+    if precompiled > 0:
+        print(f"Speedup:              {per_call / precompiled:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+End-to-end load benchmark for the running service.
+
+Drives the summarization, categorization and validation endpoints with a fixed
+number of requests at a given concurrency and reports throughput and latency
+percentiles. Summaries are timed on the HTTP response; categorization and
+validation run as background tasks, so they are timed until their final event
+appears on the Redis stream.
+
+Combined with app/scripts/fake_ollama.py this runs on a laptop without a model:
+    python -m app.scripts.fake_ollama --port 11500 &
+    OLLAMA_HOST=http://127.0.0.1:11500 uvicorn app.main:app --port 8000 &
+    python -m app.scripts.bench_service --requests 100 --concurrency 8 --seed-tree
+
+The LLM call summary from /metrics ("llm_calls") is printed at the end.
+
+Run with: python -m app.scripts.bench_service [--scenario summary|categorize|validate|all]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import redis.asyncio as redis
+
+from app.core.config import config
+from app.domain.constants.stream_constants import (
+    REDIS_STREAM_REPORT_LIGHT_CATEGORIZATION,
+    REDIS_STREAM_REPORT_PREDICTIVE_VALIDATION,
+)
+
+SAMPLE_REPORTS = [
+    ("Armed robbery at bus stop", "Two men with guns robbed passengers waiting at the Ojota bus stop around 9pm."),
+    ("Burst water pipe flooding road", "A burst water pipe has flooded the main road near the market since morning."),
+    ("House fire in residential area", "A fire broke out in a two-storey building, residents are trapped upstairs."),
+    ("Child left alone on street", "A young child has been wandering alone near the school gate for hours."),
+    ("Power line down after storm", "An electric pole fell during the storm and live wires are lying on the road."),
+    ("Road accident on expressway", "A trailer collided with two cars on the expressway, several people injured."),
+]
+
+SAMPLE_TREE = [
+    {"id": 1, "name": "Crime", "slug": "crime", "description": "Robbery, theft, assault, armed attacks", "children": [
+        {"id": 11, "name": "Armed Robbery", "slug": "armed-robbery", "description": "Robbery with guns or weapons", "parent_id": 1},
+        {"id": 12, "name": "Theft", "slug": "theft", "description": "Stealing property without violence", "parent_id": 1},
+    ]},
+    {"id": 2, "name": "Emergency", "slug": "emergency", "description": "Fire, accidents, people trapped or injured", "children": [
+        {"id": 21, "name": "Fire", "slug": "fire", "description": "Building fire, residents trapped, smoke", "parent_id": 2},
+        {"id": 22, "name": "Road Accident", "slug": "road-accident", "description": "Collision of vehicles, people injured on road", "parent_id": 2},
+    ]},
+    {"id": 3, "name": "Infrastructure", "slug": "infrastructure", "description": "Water pipes, power lines, roads", "children": [
+        {"id": 31, "name": "Water", "slug": "water", "description": "Burst water pipe, flooding, no water supply", "parent_id": 3},
+        {"id": 32, "name": "Electricity", "slug": "electricity", "description": "Power line down, electric pole, live wires", "parent_id": 3},
+    ]},
+    {"id": 4, "name": "Child Protection", "slug": "child-protection", "description": "Child abuse, missing or abandoned child", "children": []},
+]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class StreamWaiter:
+    """Resolves futures when a final event for a report appears on a Redis stream."""
+
+    def __init__(self, client: redis.Redis, stream: str):
+        self.client = client
+        self.stream = stream
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.last_id = "$"
+
+    def expect(self, report_id: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[report_id] = future
+        return future
+
+    async def run(self) -> None:
+        while True:
+            response = await self.client.xread({self.stream: self.last_id}, block=1000, count=100)
+            for _, messages in response or []:
+                for message_id, fields in messages:
+                    self.last_id = message_id
+                    future = self.pending.get(str(fields.get("report_id")))
+                    if future and not future.done() and fields.get("is_final", "true") == "true":
+                        future.set_result(fields)
+
+
+async def _run_scenario(
+    name: str,
+    requests: int,
+    concurrency: int,
+    one: Callable[[int], Awaitable[None]],
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    async def timed(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await one(i)
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(f"{type(e).__name__}: {e}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{name}: {requests} requests, concurrency {concurrency}, {elapsed:.2f}s")
+    print(f"  throughput: {len(latencies) / elapsed:8.2f} req/s   errors: {len(errors)}")
+    if latencies:
+        print(
+            f"  latency:    p50 {_percentile(latencies, 0.5):.3f}s  p95 {_percentile(latencies, 0.95):.3f}s  "
+            f"p99 {_percentile(latencies, 0.99):.3f}s  max {max(latencies):.3f}s"
+        )
+    for error in sorted(set(errors))[:5]:
+        print(f"  error: {error}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    redis_client: Optional[redis.Redis] = None
+    if args.scenario in ("categorize", "validate", "all"):
+        redis_client = redis.from_url(config.get_redis_url(), decode_responses=True)
+        if args.seed_tree:
+            await redis_client.set(args.category_key, json.dumps(SAMPLE_TREE))
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+
+        async def summarize(i: int) -> None:
+            title, description = SAMPLE_REPORTS[i % len(SAMPLE_REPORTS)]
+            response = await client.post(
+                "/api/v1/report/light-summarize", json={"tags": [title], "extra_description": [description]}
+            )
+            response.raise_for_status()
+
+        async def through_stream(waiter: StreamWaiter, path: str, payload: Callable[[str, int], dict], i: int) -> None:
+            report_id = str(args.report_id_base + i) if path.endswith("validation") else uuid.uuid4().hex
+            done = waiter.expect(report_id)
+            response = await client.post(path, json=payload(report_id, i))
+            response.raise_for_status()
+            await asyncio.wait_for(done, timeout=args.timeout)
+
+        def categorize_payload(report_id: str, i: int) -> dict:
+            title, description = SAMPLE_REPORTS[i % len(SAMPLE_REPORTS)]
+            return {"report_id": report_id, "title": title, "description": description, "cache_key": args.category_key}
+
+        def validate_payload(report_id: str, i: int) -> dict:
+            title, description = SAMPLE_REPORTS[i % len(SAMPLE_REPORTS)]
+            return {
+                "report_id": int(report_id),
+                "report_title": title,
+                "report_summary": description,
+                "categories": ["emergency"],
+                "deterministic_validation": {
+                    "trust_score": (i * 37) % 100,
+                    "is_valid": True,
+                    "issues": [{"field": "location", "message": "Location is approximate", "level": "warning"}],
+                    "inferences": [{"category": "reporter_history", "observation": "New reporter", "level": "info"}],
+                    "metadata": {
+                        "reporter_history_count": i % 5,
+                        "rejected_reports_count": 0,
+                        "device_fingerprint_match": True,
+                        "average_evidence_distance": 0.4,
+                        "report_frequency_score": 20,
+                    },
+                    "issues_count": 1,
+                    "inferences_count": 1,
+                },
+            }
+
+        if args.scenario in ("summary", "all"):
+            await _run_scenario("summary", args.requests, args.concurrency, summarize)
+
+        for scenario, stream, path, payload in (
+            ("categorize", REDIS_STREAM_REPORT_LIGHT_CATEGORIZATION, "/api/v1/categorize/light-categorize", categorize_payload),
+            ("validate", REDIS_STREAM_REPORT_PREDICTIVE_VALIDATION, "/api/v1/validate/predictive-validation", validate_payload),
+        ):
+            if args.scenario not in (scenario, "all"):
+                continue
+            waiter = StreamWaiter(redis_client, stream)
+            reader = asyncio.create_task(waiter.run())
+            await asyncio.sleep(0.1)  # let XREAD start before the first event
+            try:
+                await _run_scenario(
+                    scenario,
+                    args.requests,
+                    args.concurrency,
+                    lambda i, w=waiter, p=path, f=payload: through_stream(w, p, f, i),
+                )
+            finally:
+                reader.cancel()
+
+        llm_calls = (await client.get("/metrics")).json().get("llm_calls", {})
+        print("\nLLM calls (rolling summary from /metrics):")
+        for operation, summary in llm_calls.items():
+            print(
+                f"  {operation:15} calls {summary['calls']:5}  p50 {summary['p50_seconds']:.3f}s  "
+                f"p95 {summary['p95_seconds']:.3f}s  time share {summary['time_share']}"
+            )
+
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark for the ResQ AI service")
+    parser.add_argument("--base-url", default=f"http://localhost:{config.PORT}")
+    parser.add_argument("--scenario", choices=["summary", "categorize", "validate", "all"], default="all")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--category-key", default="categories:tree")
+    parser.add_argument("--seed-tree", action="store_true", help="Write a sample category tree to --category-key")
+    parser.add_argument("--report-id-base", type=int, default=int(time.time()) % 1_000_000 * 1000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Deterministic stand-in for an Ollama server, for offline load and latency tests.
+
+Implements the parts of the Ollama HTTP API the service uses (POST /api/chat,
+streamed or not, GET /api/tags, GET /api/ps, GET /api/version) and answers:
+    - summarization prompts with "Title: ... / Description: ..." text
+    - categorization prompts with a CategoryResponse, picking the listed
+      categories that share the most words with the report (confidence grows
+      with the number of shared words)
+    - validation prompts with a ValidationResponse derived from the trust score
+Structured answers are returned in whichever form was requested: JSON content
+for a `format` schema, or a tool call when `tools` are passed.
+
+Timing is simulated: model load on first use, prompt evaluation at a fixed rate
+(with the previous prompt's common prefix treated as cached, like Ollama's KV
+cache), time to first token and a fixed generation rate, with at most
+--num-parallel requests generating at once (OLLAMA_NUM_PARALLEL). Response
+metadata reports the simulated durations. Failures (HTTP errors) and malformed
+structured output can be injected at a given rate; all randomness is seeded.
+
+Scripted answers can be supplied as a JSON file of rules; the first rule whose
+operation matches and whose regex matches the prompt wins:
+    [{"operation": "categorization", "match": "(?i)fire", "response": {"category_ids": [3]}}]
+
+Run with:
+    python -m app.scripts.fake_ollama --port 11500 --ttft 0.2 --tokens-per-second 40
+and point the service at it with OLLAMA_HOST=http://127.0.0.1:11500 (or list
+several instances in OLLAMA_HOSTS).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+_WORD = re.compile(r"[a-z]{4,}")
+_TOKEN = re.compile(r"\S+\s*")
+_CATEGORY_LINE = re.compile(r"^(\d+)\|([^:\n]+)(?::\s*(.*))?$", re.MULTILINE)
+_TRUST_SCORE = re.compile(r"Trust Score:\s*(\d+)")
+
+
+class FakeOllamaSettings:
+    """Simulation parameters; defaults come from FAKE_OLLAMA_* environment variables."""
+
+    def __init__(self, **overrides: Any):
+        env = os.environ
+        self.models: List[str] = env.get("FAKE_OLLAMA_MODELS", "llava,llama2-uncensored").split(",")
+        self.ttft = float(env.get("FAKE_OLLAMA_TTFT", "0.2"))
+        self.tokens_per_second = float(env.get("FAKE_OLLAMA_TOKENS_PER_SECOND", "40"))
+        self.prompt_tokens_per_second = float(env.get("FAKE_OLLAMA_PROMPT_TOKENS_PER_SECOND", "800"))
+        self.load_seconds = float(env.get("FAKE_OLLAMA_LOAD_SECONDS", "2"))
+        self.num_parallel = int(env.get("FAKE_OLLAMA_NUM_PARALLEL", "1"))
+        self.error_rate = float(env.get("FAKE_OLLAMA_ERROR_RATE", "0"))
+        self.malformed_rate = float(env.get("FAKE_OLLAMA_MALFORMED_RATE", "0"))
+        self.seed = int(env.get("FAKE_OLLAMA_SEED", "0"))
+        self.script: Optional[str] = env.get("FAKE_OLLAMA_SCRIPT") or None
+        for key, value in overrides.items():
+            if value is not None:
+                setattr(self, key, value)
+
+
+class FakeOllama:
+    """Simulated model state shared by all requests."""
+
+    def __init__(self, settings: FakeOllamaSettings):
+        self.settings = settings
+        self.random = random.Random(settings.seed)
+        self.slots = asyncio.Semaphore(settings.num_parallel)
+        self.loaded: Dict[str, float] = {}
+        self.last_prompt: Dict[str, str] = {}
+        self.rules: List[dict] = []
+        if settings.script:
+            with open(settings.script, encoding="utf-8") as f:
+                self.rules = json.load(f)
+
+    # ---- answers ----
+
+    def answer(self, operation: str, prompt: str) -> Any:
+        for rule in self.rules:
+            if rule.get("operation", operation) == operation and re.search(rule.get("match", ""), prompt):
+                return rule["response"]
+        if operation == "categorization":
+            return self._categorize(prompt)
+        if operation == "validation":
+            return self._validate(prompt)
+        return self._summarize(prompt)
+
+    @staticmethod
+    def _summarize(prompt: str) -> str:
+        content = prompt.split("content from the user:", 1)[-1].strip() or "Incident report"
+        words = content.split()
+        title = " ".join(words[:8]).rstrip(".,;:")
+        return f"Title: {title}\nDescription: {' '.join(words[:120])}"
+
+    @staticmethod
+    def _categorize(prompt: str) -> dict:
+        categories = _CATEGORY_LINE.findall(prompt)
+        report = prompt.split("REPORT TO CATEGORIZE:", 1)[-1].lower()
+        report_words = set(_WORD.findall(report))
+        scored = []
+        for category_id, name, description in categories:
+            overlap = len(report_words & set(_WORD.findall(f"{name} {description}".lower())))
+            scored.append((overlap, -int(category_id)))
+        scored.sort(reverse=True)
+        top = [(-neg_id, overlap) for overlap, neg_id in scored[:2] if overlap > 0]
+        if not top and scored:
+            # "select the closest match rather than none": fall back to the lowest id
+            top = [(min(int(category_id) for category_id, _, _ in categories), 0)]
+        return {
+            "category_ids": [category_id for category_id, _ in top],
+            "confidences": [float(min(95, 30 + 20 * overlap)) for _, overlap in top],
+        }
+
+    @staticmethod
+    def _validate(prompt: str) -> dict:
+        match = _TRUST_SCORE.search(prompt)
+        trust = int(match.group(1)) if match else 50
+        if trust >= 70:
+            status, review = "valid", False
+        elif trust >= 40:
+            status, review = "suspicious", True
+        else:
+            status, review = "invalid", True
+        return {
+            "summary": f"Assessment based on a trust score of {trust}/100.",
+            "requires_human_review": review,
+            "confidence_score": float(min(95, max(5, trust))),
+            "final_validity_status": status,
+            "reasons": [f"Trust score is {trust}/100"],
+            "supporting_inferences": [],
+        }
+
+    # ---- timing ----
+
+    def prompt_eval_tokens(self, model: str, prompt: str) -> tuple[int, int]:
+        """Total and evaluated prompt tokens; the common prefix with the last prompt is cached."""
+        previous = self.last_prompt.get(model, "")
+        common = 0
+        for a, b in zip(previous, prompt):
+            if a != b:
+                break
+            common += 1
+        self.last_prompt[model] = prompt
+        total = max(1, len(prompt) // 4)
+        return total, max(1, (len(prompt) - common) // 4)
+
+    async def load(self, model: str) -> float:
+        if model in self.loaded:
+            return 0.0
+        await asyncio.sleep(self.settings.load_seconds)
+        self.loaded[model] = time.time()
+        return self.settings.load_seconds
+
+
+def _operation(body: dict) -> str:
+    schema: Any = body.get("format")
+    if body.get("tools"):
+        schema = body["tools"][0].get("function", {}).get("parameters", {})
+    properties = schema.get("properties", {}) if isinstance(schema, dict) else {}
+    if "category_ids" in properties:
+        return "categorization"
+    if "final_validity_status" in properties:
+        return "validation"
+    return "summary"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def create_app(settings: Optional[FakeOllamaSettings] = None) -> FastAPI:
+    app = FastAPI(title="Fake Ollama")
+    fake = FakeOllama(settings or FakeOllamaSettings())
+    app.state.fake = fake
+
+    @app.get("/")
+    async def root() -> Any:
+        return "Ollama is running"
+
+    @app.get("/api/version")
+    async def version() -> dict:
+        return {"version": "0.0.0-fake"}
+
+    @app.get("/api/tags")
+    async def tags() -> dict:
+        return {"models": [{"name": f"{m}:latest", "model": f"{m}:latest"} for m in fake.settings.models]}
+
+    @app.get("/api/ps")
+    async def ps() -> dict:
+        return {"models": [{"name": f"{m}:latest", "model": f"{m}:latest"} for m in fake.loaded]}
+
+    @app.post("/api/chat")
+    async def chat(request: Request) -> Any:
+        body = await request.json()
+        model = body.get("model", "").split(":")[0]
+        if model not in fake.settings.models:
+            return JSONResponse({"error": f"model '{model}' not found"}, status_code=404)
+        if fake.random.random() < fake.settings.error_rate:
+            return JSONResponse({"error": "injected failure"}, status_code=500)
+
+        operation = _operation(body)
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        answer = fake.answer(operation, prompt)
+        tool_calls = None
+        if operation == "summary":
+            content = answer if isinstance(answer, str) else json.dumps(answer)
+        elif fake.random.random() < fake.settings.malformed_rate:
+            content = "Sure! Here is the JSON you asked for: {"
+        elif body.get("tools"):
+            content = ""
+            tool_calls = [{"function": {"name": body["tools"][0]["function"]["name"], "arguments": answer}}]
+        else:
+            content = json.dumps(answer)
+
+        async def generate() -> AsyncIterator[dict]:
+            """Yield streamed chunks, holding a parallel slot while generating; the last chunk is final."""
+            started = time.monotonic()
+            async with fake.slots:
+                load_seconds = await fake.load(model)
+                _, prompt_evaluated = fake.prompt_eval_tokens(model, prompt)
+                prompt_seconds = prompt_evaluated / fake.settings.prompt_tokens_per_second
+                await asyncio.sleep(prompt_seconds + fake.settings.ttft)
+                generating = time.monotonic()
+                if tool_calls:
+                    eval_count = max(1, len(json.dumps(answer)) // 4)
+                    await asyncio.sleep(eval_count / fake.settings.tokens_per_second)
+                    yield {"role": "assistant", "content": "", "tool_calls": tool_calls}
+                else:
+                    tokens = _TOKEN.findall(content)
+                    eval_count = len(tokens)
+                    for token in tokens:
+                        await asyncio.sleep(1 / fake.settings.tokens_per_second)
+                        yield {"role": "assistant", "content": token}
+                yield {
+                    "done_reason": "stop",
+                    "total_duration": int((time.monotonic() - started) * 1e9),
+                    "load_duration": int(load_seconds * 1e9),
+                    "prompt_eval_count": prompt_evaluated,
+                    "prompt_eval_duration": int(prompt_seconds * 1e9),
+                    "eval_count": eval_count,
+                    "eval_duration": int((time.monotonic() - generating) * 1e9),
+                }
+
+        def envelope(chunk: dict) -> dict:
+            base = {"model": body.get("model"), "created_at": _now()}
+            if "done_reason" in chunk:
+                return {**base, "message": {"role": "assistant", "content": ""}, "done": True, **chunk}
+            return {**base, "message": chunk, "done": False}
+
+        if body.get("stream", True):
+            async def ndjson() -> AsyncIterator[str]:
+                async for chunk in generate():
+                    yield json.dumps(envelope(chunk)) + "\n"
+
+            return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+        chunks = [chunk async for chunk in generate()]
+        response = envelope(chunks[-1])
+        response["message"] = {"role": "assistant", "content": "".join(c["content"] for c in chunks[:-1])}
+        if tool_calls:
+            response["message"]["tool_calls"] = tool_calls
+        return response
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deterministic stand-in Ollama server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--models", type=lambda v: v.split(","))
+    parser.add_argument("--ttft", type=float, help="Seconds to first token after prompt evaluation")
+    parser.add_argument("--tokens-per-second", type=float, dest="tokens_per_second")
+    parser.add_argument("--prompt-tokens-per-second", type=float, dest="prompt_tokens_per_second")
+    parser.add_argument("--load-seconds", type=float, dest="load_seconds")
+    parser.add_argument("--num-parallel", type=int, dest="num_parallel")
+    parser.add_argument("--error-rate", type=float, dest="error_rate")
+    parser.add_argument("--malformed-rate", type=float, dest="malformed_rate")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--script", help="JSON file of scripted responses")
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    uvicorn.run(create_app(FakeOllamaSettings(**args)), host=host, port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Train the logistic pre-screen model for predictive validation.
+
+Reads the historical verdicts from the predictive-validation stream
+(resq:report:predictive-validation) and joins them with the features the
+validator stored for each report (resq:validation:features:<report_id>). Only
+"valid" and "invalid" verdicts are used, the last one per report, and by
+default only those the LLM made: the model only ever sees reports the rules did
+not decide, so rule verdicts would skew it (and its reported coverage), and its
+own verdicts would teach it its own output. --include-rules and
+--include-prescreen add them back. A held-out share of the reports is used to
+report:
+    - log loss and accuracy at a 0.5 cut-off
+    - coverage: the share of reports the configured thresholds would decide
+      without the LLM, and the accuracy on those
+    - single-report and batch scoring time
+The fitted model is saved as JSON to VALIDATION_PRESCREEN_MODEL_PATH (or
+--output), where the service loads it at startup.
+
+Run with: python -m app.scripts.train_validation_prescreen [--holdout 0.2] [--output path]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+import redis.asyncio as redis
+
+from app.adapters.ai.prediction.linear import (
+    FEATURE_NAMES,
+    LogisticModel,
+    feature_matrix,
+    log_loss,
+    training_features_key,
+)
+from app.core.config import config
+from app.domain.constants.stream_constants import REDIS_STREAM_REPORT_PREDICTIVE_VALIDATION
+
+LABELS = {"valid": 1, "invalid": 0}
+
+
+async def _read_verdicts(client: redis.Redis, stream: str, batch: int) -> Dict[str, int]:
+    """Last valid/invalid verdict per report id, in stream order."""
+    verdicts: Dict[str, int] = {}
+    start = "-"
+    while True:
+        messages = await client.xrange(stream, min=start, max="+", count=batch)
+        for _, fields in messages:
+            status = fields.get("final_validity_status")
+            if fields.get("is_final", "true") == "true" and status in LABELS:
+                verdicts[str(fields.get("report_id"))] = LABELS[status]
+        if len(messages) < batch:
+            return verdicts
+        start = f"({messages[-1][0]}"
+
+
+async def _load_dataset(
+    client: redis.Redis, args: argparse.Namespace
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, int]]:
+    verdicts = await _read_verdicts(client, args.stream, args.batch)
+    report_ids = list(verdicts)
+    rows: List[Dict[str, float]] = []
+    labels: List[int] = []
+    included = {"llm"}
+    if args.include_rules:
+        included.add("rules")
+    if args.include_prescreen:
+        included.add("prescreen")
+    skipped = {"no_features": 0, "rules": 0, "prescreen": 0}
+    for offset in range(0, len(report_ids), args.batch):
+        chunk = report_ids[offset : offset + args.batch]
+        stored = await client.mget([training_features_key(report_id) for report_id in chunk])
+        for report_id, raw in zip(chunk, stored):
+            if not raw:
+                skipped["no_features"] += 1
+                continue
+            record = json.loads(raw)
+            path = record.get("path", "llm")
+            if path not in included:
+                skipped[path] = skipped.get(path, 0) + 1
+                continue
+            rows.append(record["features"])
+            labels.append(verdicts[report_id])
+    return feature_matrix(rows, FEATURE_NAMES), np.array(labels, dtype=np.float64), skipped
+
+
+def _evaluate(model: LogisticModel, features: np.ndarray, labels: np.ndarray) -> None:
+    if not len(labels):
+        print("  no held-out reports")
+        return
+    probabilities = model.predict_proba(features)
+    accuracy = float(np.mean((probabilities >= 0.5) == (labels == 1)))
+    print(f"  log loss {log_loss(probabilities, labels):.4f}  accuracy {accuracy:.1%}")
+
+    decided_valid = probabilities >= config.VALIDATION_PRESCREEN_VALID_THRESHOLD
+    decided_invalid = probabilities <= config.VALIDATION_PRESCREEN_INVALID_THRESHOLD
+    decided = decided_valid | decided_invalid
+    if decided.any():
+        correct = (decided_valid & (labels == 1)) | (decided_invalid & (labels == 0))
+        print(
+            f"  thresholds {config.VALIDATION_PRESCREEN_INVALID_THRESHOLD}/{config.VALIDATION_PRESCREEN_VALID_THRESHOLD}: "
+            f"decide {decided.mean():.1%} of reports without the LLM, "
+            f"{correct.sum() / decided.sum():.1%} of them correctly"
+        )
+    else:
+        print("  thresholds decide no held-out report; the LLM would see every report")
+
+    iterations = 10_000
+    started = time.perf_counter()
+    for i in range(iterations):
+        model.score(features[i % len(features)])
+    single = (time.perf_counter() - started) / iterations
+    started = time.perf_counter()
+    model.predict_proba(features)
+    batch = (time.perf_counter() - started) / len(features)
+    print(f"  scoring: {single * 1e6:.2f} us per report, {batch * 1e6:.3f} us per report in a batch of {len(features)}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    client = redis.from_url(config.get_redis_url(), decode_responses=True)
+    try:
+        features, labels, skipped = await _load_dataset(client, args)
+    finally:
+        await client.aclose()
+
+    print(
+        f"{len(labels)} labelled reports ({int(labels.sum())} valid, {int(len(labels) - labels.sum())} invalid); "
+        f"skipped {skipped['no_features']} without stored features, {skipped['rules']} rule verdicts, "
+        f"{skipped['prescreen']} pre-screen verdicts"
+    )
+    if len(labels) < args.min_reports or len(set(labels.tolist())) < 2:
+        print(f"Not enough data to train (need {args.min_reports} reports with both verdicts)")
+        return
+
+    order = np.random.default_rng(args.seed).permutation(len(labels))
+    holdout = int(len(labels) * args.holdout)
+    test, train = order[:holdout], order[holdout:]
+    model = LogisticModel.fit(features[train], labels[train], l2=args.l2, epochs=args.epochs)
+
+    print("\nWeights (standardized):")
+    for name, weight in sorted(zip(model.feature_names, model.weights), key=lambda item: -abs(item[1])):
+        print(f"  {name:28} {weight:+.3f}")
+    print(f"\nHeld-out evaluation ({len(test)} reports):")
+    _evaluate(model, features[test], labels[test])
+
+    model.save(args.output)
+    print(f"\nSaved model to {args.output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Train the predictive-validation pre-screen model")
+    parser.add_argument("--stream", default=REDIS_STREAM_REPORT_PREDICTIVE_VALIDATION)
+    parser.add_argument("--output", default=config.VALIDATION_PRESCREEN_MODEL_PATH or "models/validation_prescreen.json")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of reports held out for evaluation")
+    parser.add_argument("--batch", type=int, default=1000, help="Stream entries / feature keys read per round trip")
+    parser.add_argument("--min-reports", type=int, default=50)
+    parser.add_argument("--l2", type=float, default=1e-2)
+    parser.add_argument("--epochs", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--include-rules", action="store_true", help="Also train on rule verdicts (reports the model never sees)"
+    )
+    parser.add_argument("--include-prescreen", action="store_true", help="Also train on the model's own verdicts")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,101 @@
-from typing import List, Optional
-import json
+import asyncio
+from typing import List, Optional, Tuple
 from datetime import datetime, timezone
-from app.core.exceptions import CacheError
+from app.core.exceptions import AIProcessingError, CacheError
 from app.domain.constants.stream_constants import REDIS_STREAM_REPORT_LIGHT_CATEGORIZATION
 from app.domain.schema.categorize import CategoryNode, LightCategorizerStreamInformation
 from app.adapters.cache.base import CacheInterface, StreamInterface
 from app.infra.logger import main_logger
-from app.adapters.ai.llm.ollama import OllamaLLMEngine
+from app.adapters.ai.llm.ollama import CategoryPromptBlock, render_categories_block
+from app.adapters.ai.llm.router import estimate_prompt_tokens, get_model_router
 from app.adapters.cache.utils import encode_redis_stream_payload
+from app.services.categorization_cache import CachedCategorization, CategorizationResultCache
+from app.services.category_tree import CategoryTreeIndex, category_tree_cache
+from app.core.config import config
+from app.infra.metrics import metrics
+
+
+# Histogram buckets for LLM calls per categorized report
+LLM_CALLS_BUCKETS = (0, 1, 2, 3, 4, 6, 8, 12, 16)
+
+
+class CategorizationBudget:
+    """
+    Per-report limits and state shared by every branch of a categorization.
+
+    Args:
+        max_parallel: Concurrent LLM calls for the report
+        max_calls: LLM calls allowed for the report (0 for no limit)
+    """
+
+    def __init__(self, max_parallel: int, max_calls: int):
+        self.slots = asyncio.Semaphore(max_parallel)
+        self.max_calls = max_calls
+        self.calls = 0
+        self.saved = 0  # calls avoided by pruning branches and by the cap
+        self.events: List[List[str]] = []  # intermediate stream events (category slugs), in push order
+        self.degraded = False  # an LLM call failed, so the result is not worth caching
+
+    def reserve(self) -> bool:
+        """Claim one LLM call; False once the report's cap is reached."""
+        if self.max_calls and self.calls >= self.max_calls:
+            self.saved += 1
+            return False
+        self.calls += 1
+        return True
+
+
+def _prune(
+    ranked: List[Tuple[CategoryNode, Optional[float]]], max_branches: int, floor: float
+) -> Tuple[List[CategoryNode], List[Tuple[CategoryNode, str]]]:
+    """
+    Keep the most confident categories: at most max_branches (0 for no limit)
+    and none below the confidence floor, except the most confident one, which
+    is always kept. Categories without a confidence rank last and are not
+    subject to the floor.
+
+    Returns:
+        Tuple: The kept categories, and the pruned ones with the reason ("top_n" or "floor")
+    """
+    ordered = sorted(ranked, key=lambda item: (item[1] is None, -(item[1] or 0.0)))
+    kept: List[CategoryNode] = []
+    pruned: List[Tuple[CategoryNode, str]] = []
+    for position, (category, confidence) in enumerate(ordered):
+        if position and max_branches and len(kept) >= max_branches:
+            pruned.append((category, "top_n"))
+        elif position and confidence is not None and confidence < floor:
+            pruned.append((category, "floor"))
+        else:
+            kept.append(category)
+    return kept, pruned
+
+
+def _invalid_id_reason(index: CategoryTreeIndex, category_id: int, eligible: bool) -> str:
+    """Metric reason for a returned ID that was not offered: eligible but shortlisted out, another level, or unknown."""
+    if eligible:
+        return "not_offered"
+    return "wrong_level" if category_id in index.by_id else "unknown"
 
 
 class ResQAICategorizer:
     def __init__(self, logger=None, cache: Optional[CacheInterface] = None, stream: Optional[StreamInterface] = None):
         self.logger = logger if logger is not None else main_logger
-        self.ollama_engine = OllamaLLMEngine(model="llava") #TODO: change later as a variable.
         self.cache = cache  # Can be None if Redis is not available.
+        self.router = get_model_router(cache=cache)
         self.stream = stream
+        self.result_cache = CategorizationResultCache(cache=cache) if cache is not None else None
 
-    async def categorize_report(self, title: str, description: str, category_key: str, report_id: Optional[str] = None, correlated_id: Optional[str] = None) -> List[CategoryNode]:
+    async def categorize_report(self, title: str, description: str, category_key: str, report_id: Optional[str] = None, correlated_id: Optional[str] = None, mode: Optional[str] = None) -> List[CategoryNode]:
         """
-        Recursively categorize a report by drilling down through category hierarchies.
+        Categorize a report against the category tree.
+
+        Reports whose keywords name a leaf category unambiguously are answered
+        without the LLM. Reports already categorized against the same tree
+        version (up to case, punctuation and spacing) replay the cached stream
+        events. Otherwise, in "recursive" mode the categorizer drills down
+        through the hierarchy, one LLM call per level and matched branch; in
+        "flat" mode the model picks from every leaf, rendered as its full path,
+        in a single call.
 
         Args:
             title (str): Report title
@@ -27,22 +103,21 @@ class ResQAICategorizer:
             category_key (str): Cache key for categories
             report_id (Optional[str]): Unique report identifier for streaming
             correlated_id (Optional[str]): Correlation ID for request tracking
+            mode (Optional[str]): "recursive" or "flat"; defaults to CATEGORIZER_MODE
 
         Returns:
             List[CategoryNode]: Final leaf categories that match the report
         """
-        # Get category tree from cache
+        # Get the parsed category tree (kept in process, refreshed when it changes in Redis)
         if not self.cache:
             self.logger.log("Redis cache not available. Cannot fetch categories.", "ERROR")
             return []
 
-        categories_json = await self.cache.get(category_key)
-        if not categories_json:
+        tree = await category_tree_cache.get(self.cache, category_key)
+        if tree is None:
             self.logger.log(f"No categories found for key: {category_key}", "WARNING")
             return []
 
-        category_dicts = json.loads(categories_json)
-        category_nodes: List[CategoryNode] = [CategoryNode.model_validate(item) for item in category_dicts]
 
         # Start recursive categorization from top level
         self.logger.debug("\n" + "=" * 60)
@@ -52,15 +127,54 @@ class ResQAICategorizer:
         self.logger.debug(f"Description: {description[:100]}..." if len(description) > 100 else f"Description: {description}")
         self.logger.debug("=" * 60 + "\n")
 
-        final_categories = await self._recursive_categorize(
-            title=title,
-            description=description,
-            categories=category_nodes,
-            level=0,
-            path=[],
-            report_id=report_id,  # propagate report_id for streaming
-            correlated_id=correlated_id  # propagate correlated_id for streaming
-        )
+        mode = mode or config.CATEGORIZER_MODE
+        # Obvious reports are answered from the keyword index in well under a
+        # millisecond; only ambiguous ones reach the LLM.
+        keyword_match = tree.index.keywords.match(f"{title}\n{description}") if config.CATEGORIZER_KEYWORD_FAST_PATH else None
+        if keyword_match is not None:
+            result = "confident" if keyword_match.confident else "ambiguous" if keyword_match.category_ids else "no_match"
+            metrics.increment("categorizer_keyword_total", result=result)
+        budget = CategorizationBudget(config.CATEGORIZER_MAX_PARALLEL_BRANCHES, config.CATEGORIZER_MAX_LLM_CALLS)
+        cached = None
+        if keyword_match is not None and keyword_match.confident:
+            mode = "keyword"
+        elif self.result_cache is not None and self.result_cache.enabled:
+            cached = await self.result_cache.get(tree, mode, title, description)
+
+        if mode == "keyword":
+            final_categories = [tree.index.by_id[category_id] for category_id in keyword_match.category_ids]
+            self.logger.debug(f"Keyword match: {keyword_match.phrases}")
+        elif cached is not None:
+            self.logger.debug(f"Replaying cached categorization ({len(cached.events)} intermediate events)")
+            for slugs in cached.events:
+                await self._push_intermediate(report_id, correlated_id, slugs)
+            final_categories = [tree.index.by_id[category_id] for category_id in cached.category_ids]
+        elif mode == "flat":
+            final_categories = await self._flat_categorize(
+                title=title, description=description, index=tree.index, budget=budget
+            )
+        else:
+            final_categories = await self._recursive_categorize(
+                title=title,
+                description=description,
+                index=tree.index,
+                parent_id=None,
+                level=0,
+                path=[],
+                report_id=report_id,  # propagate report_id for streaming
+                correlated_id=correlated_id,  # propagate correlated_id for streaming
+                budget=budget,
+            )
+        # Degraded results (an LLM call failed) are not cached; the next submission retries them.
+        cacheable = cached is None and mode != "keyword" and not budget.degraded
+        if cacheable and self.result_cache is not None and self.result_cache.enabled:
+            await self.result_cache.set(
+                tree, mode, title, description, CachedCategorization(budget.events, [cat.id for cat in final_categories])
+            )
+        metrics.increment("categorizer_reports_total", mode=mode)
+        metrics.observe("categorizer_llm_calls_per_report", budget.calls, buckets=LLM_CALLS_BUCKETS, mode=mode)
+        if budget.saved:
+            metrics.increment("categorizer_llm_calls_saved_total", budget.saved, mode=mode)
 
         self.logger.debug("\n" + "=" * 60)
         self.logger.debug("Final Categorization Results:")
@@ -87,15 +201,103 @@ class ResQAICategorizer:
 
         return final_categories
 
+    async def _push_intermediate(
+        self, report_id: Optional[str], correlated_id: Optional[str], slugs: List[str], indent: str = ""
+    ) -> None:
+        """Push an intermediate stream event if stream is available and report_id is provided."""
+        if not (self.stream and report_id):
+            return
+        try:
+            stream_payload = LightCategorizerStreamInformation(
+                report_id=report_id,
+                recognized_categories=slugs,
+                time_added=datetime.now(timezone.utc).isoformat(),
+                is_final=False,
+                correlated_id=correlated_id,
+            ).model_dump()
+
+            encoded_payload = encode_redis_stream_payload(stream_payload)
+
+            self.logger.debug(f"{indent}[STREAM] Pushing intermediate stream payload for report_id={report_id}: {slugs}")
+            await self.stream.add_to_stream(REDIS_STREAM_REPORT_LIGHT_CATEGORIZATION, encoded_payload)
+        except CacheError as e:
+            self.logger.debug(f"{indent}Stream push failed: {str(e)}")
+
+    async def _flat_categorize(
+        self, title: str, description: str, index: CategoryTreeIndex, budget: CategorizationBudget
+    ) -> List[CategoryNode]:
+        """
+        Categorize in a single LLM call over all leaf categories.
+
+        Args:
+            title (str): Report title
+            description (str): Report description
+            index (CategoryTreeIndex): Compiled category tree
+            budget (CategorizationBudget): The report's LLM call budget
+
+        Returns:
+            List[CategoryNode]: Leaf categories that match
+        """
+        leaves = index.leaf_nodes()
+        if not leaves:
+            return []
+
+        offered = index.shortlist(leaves, f"{title} {description}", config.CATEGORIZER_SHORTLIST_FLAT_K)
+
+        def _block(model: str) -> CategoryPromptBlock:
+            return index.leaf_paths_block(model) if offered is leaves else index.render_paths(offered, model)
+
+        self.logger.debug(f"🔍 Flat mode: Analyzing {len(offered)} of {len(leaves)} leaf categories")
+        prompt_tokens = estimate_prompt_tokens(f"{title} {description}") + _block(config.OLLAMA_FAST_MODEL).tokens
+        if not budget.reserve():
+            return []
+        try:
+            response = await self.router.run(
+                "categorization",
+                prompt_tokens,
+                lambda engine: engine.categorize_report(
+                    title=title,
+                    description=description,
+                    categories=offered,
+                    categories_block=_block(engine.model_name),
+                ),
+            )
+        except AIProcessingError as e:
+            self.logger.log(f"Flat categorization degraded: {str(e)}", "WARNING")
+            budget.degraded = True
+            return []
+
+        # Only the offered leaves may be returned; anything else was hallucinated
+        # by the model (a leaf outside the shortlist was never in the prompt).
+        offered_ids = {category.id for category in offered}
+        ranked = []
+        for category_id, confidence in response.ranked():
+            if category_id in offered_ids:
+                ranked.append((index.by_id[category_id], confidence))
+            else:
+                reason = _invalid_id_reason(index, category_id, category_id in index.leaves)
+                metrics.increment("categorizer_invalid_category_ids_total", reason=reason)
+                self.logger.debug(f"Ignoring invalid category id {category_id} ({reason})")
+        matched_categories, pruned = _prune(ranked, 0, config.CATEGORIZER_CONFIDENCE_FLOOR)
+        for category, reason in pruned:
+            metrics.increment("categorizer_branches_pruned_total", reason=reason)
+            self.logger.debug(f"Pruned low-confidence category {category.name} ({reason})")
+
+        for cat in matched_categories:
+            self.logger.debug(f"   - {index.path_name(cat.id)} (ID: {cat.id})")
+        return matched_categories
+
     async def _recursive_categorize(
         self,
         title: str,
         description: str,
-        categories: List[CategoryNode],
+        index: CategoryTreeIndex,
+        parent_id: Optional[int],
         level: int,
         path: List[str],
         report_id: Optional[str] = None,
-        correlated_id: Optional[str] = None
+        correlated_id: Optional[str] = None,
+        budget: Optional[CategorizationBudget] = None,
     ) -> List[CategoryNode]:
         """
         Recursively categorize through the category tree.
@@ -103,90 +305,131 @@ class ResQAICategorizer:
         Args:
             title (str): Report title
             description (str): Report description
-            categories (List[CategoryNode]): Current level categories to check
+            index (CategoryTreeIndex): Compiled category tree
+            parent_id (Optional[int]): Category whose children are checked (None for the root level)
             level (int): Current recursion depth
             path (List[str]): Current category path for display
             report_id (Optional[str]): Unique report identifier for streaming
             correlated_id (Optional[str]): Correlation ID for request tracking
+            budget (Optional[CategorizationBudget]): This report's concurrency and LLM call limits
 
         Returns:
             List[CategoryNode]: Leaf categories that match
         """
+        if budget is None:
+            budget = CategorizationBudget(config.CATEGORIZER_MAX_PARALLEL_BRANCHES, config.CATEGORIZER_MAX_LLM_CALLS)
+        categories = index.children(parent_id)
         if not categories:
             return []
 
+        # Offer the model only the level's best lexical matches (the whole
+        # level, with its pre-rendered block, when it is small).
+        offered = index.shortlist(categories, f"{title} {description}", config.CATEGORIZER_SHORTLIST_K)
+
+        def _block(model: str) -> CategoryPromptBlock:
+            return index.prompt_block(parent_id, model) if offered is categories else render_categories_block(offered, model)
+
         indent = "  " * level
-        self.logger.debug(f"{indent}🔍 Level {level}: Analyzing {len(categories)} categories")
+        self.logger.debug(f"{indent}🔍 Level {level}: Analyzing {len(offered)} of {len(categories)} categories")
         self.logger.debug(f"{indent}Current path: {' > '.join(path) if path else 'Root'}")
 
-        # Get AI categorization for current level
-        category_ids = await self.ollama_engine.categorize_report(
-            title=title,
-            description=description,
-            categories=categories
-        )
+        # Get AI categorization for current level (routed across model tiers).
+        # A failed or timed-out level degrades to its parent category instead of
+        # failing the whole report.
+        prompt_tokens = estimate_prompt_tokens(f"{title} {description}") + _block(config.OLLAMA_FAST_MODEL).tokens
+        if not budget.reserve():
+            # Out of LLM calls for this report: the branch stops at its parent.
+            metrics.increment("categorizer_llm_call_cap_total")
+            self.logger.debug(f"{indent}LLM call cap reached, stopping at level {level}")
+            return []
+        try:
+            # Only the LLM call holds a slot, so a parent waiting on its branches
+            # never blocks them.
+            async with budget.slots:
+                response = await self.router.run(
+                    "categorization",
+                    prompt_tokens,
+                    lambda engine: engine.categorize_report(
+                        title=title,
+                        description=description,
+                        categories=offered,
+                        categories_block=_block(engine.model_name),
+                    ),
+                )
+        except AIProcessingError as e:
+            self.logger.log(f"{indent}Categorization at level {level} degraded: {str(e)}", "WARNING")
+            budget.degraded = True
+            return []
 
-        if not category_ids:
+        if not response.category_ids:
             self.logger.debug(f"{indent}❌ No matching categories at this level")
             return []
 
-        # Find the actual category nodes that match
-        matched_categories = [cat for cat in categories if cat.id in category_ids]
+        # Resolve the returned IDs; IDs that were not offered at this level
+        # (hallucinated by the model, or left out by the shortlist) are dropped.
+        offered_ids = {category.id for category in offered}
+        ranked = []
+        for category_id, confidence in response.ranked():
+            if category_id in offered_ids:
+                ranked.append((index.by_id[category_id], confidence))
+            else:
+                reason = _invalid_id_reason(index, category_id, index.is_child(category_id, parent_id))
+                metrics.increment("categorizer_invalid_category_ids_total", reason=reason)
+                self.logger.debug(f"{indent}Ignoring invalid category id {category_id} ({reason})")
+        if not ranked:
+            self.logger.debug(f"{indent}❌ No valid categories at this level")
+            return []
 
-        # Stream intermediate result after every categorization step if stream is available and report_id is provided
-        if self.stream and report_id:
-            try:
-                stream_payload = LightCategorizerStreamInformation(
-                    report_id=report_id,
-                    recognized_categories=[cat.slug for cat in matched_categories],
-                    time_added=datetime.now(timezone.utc).isoformat(),
-                    is_final=False,
-                    correlated_id=correlated_id,
-                ).model_dump()
-
-                encoded_payload = encode_redis_stream_payload(stream_payload)
-
-                self.logger.debug(
-                    f"{indent}[STREAM] Pushing intermediate stream payload for report_id={report_id}: "
-                    f"{[cat.slug for cat in matched_categories]}"
-                )
-                await self.stream.add_to_stream(REDIS_STREAM_REPORT_LIGHT_CATEGORIZATION, encoded_payload)
-            except CacheError as e:
-                self.logger.debug(f"{indent}Stream push failed: {str(e)}")
+        # Follow only the most confident branches: every branch that is not a
+        # leaf costs at least one more generation.
+        matched_categories, pruned = _prune(
+            ranked, config.CATEGORIZER_MAX_BRANCHES_PER_LEVEL, config.CATEGORIZER_CONFIDENCE_FLOOR
+        )
+        for category, reason in pruned:
+            metrics.increment("categorizer_branches_pruned_total", reason=reason)
+            if category.id not in index.leaves:
+                budget.saved += 1
+            self.logger.debug(f"{indent}Pruned branch {category.name} ({reason})")
+
+        # Stream intermediate result after every categorization step (recorded
+        # for the result cache, which replays it)
+        slugs = [cat.slug for cat in matched_categories]
+        budget.events.append(slugs)
+        await self._push_intermediate(report_id, correlated_id, slugs, indent)
 
         self.logger.debug(f"{indent}✅ Found {len(matched_categories)} matching categories:")
         for cat in matched_categories:
             self.logger.debug(f"{indent}   - {cat.name} (ID: {cat.id})")
 
-        # For each matched category, recursively check subcategories
-        final_results = []
-
-        for matched_cat in matched_categories:
-            new_path = path + [matched_cat.name]
+        # Drill into the matched categories' subcategories concurrently: sibling
+        # branches are independent, so the report takes about as long as its
+        # deepest path. Each branch streams its own events in order.
+        async def _drill(matched_cat: CategoryNode) -> List[CategoryNode]:
+            # Leaf category (no children), this is a final result
+            if matched_cat.id in index.leaves:
+                self.logger.debug(f"{indent}🎯 Leaf category reached: {matched_cat.name}")
+                return [matched_cat]
 
-            # If this category has children, recurse deeper
-            if matched_cat.children and len(matched_cat.children) > 0:
-                self.logger.debug(f"\n{indent}🔽 Drilling into '{matched_cat.name}' subcategories...")
-                sub_results = await self._recursive_categorize(
-                    title=title,
-                    description=description,
-                    categories=matched_cat.children,
-                    level=level + 1,
-                    path=new_path,
-                    report_id=report_id,
-                    correlated_id=correlated_id,
-                )
+            self.logger.debug(f"\n{indent}🔽 Drilling into '{matched_cat.name}' subcategories...")
+            sub_results = await self._recursive_categorize(
+                title=title,
+                description=description,
+                index=index,
+                parent_id=matched_cat.id,
+                level=level + 1,
+                path=list(index.paths[matched_cat.id]),
+                report_id=report_id,
+                correlated_id=correlated_id,
+                budget=budget,
+            )
+            # If we found specific subcategories, use those
+            if sub_results:
+                return sub_results
+            # No subcategories matched, use the parent category
+            self.logger.debug(f"{indent}⚠️  No subcategories matched, using parent: {matched_cat.name}")
+            return [matched_cat]
 
-                # If we found specific subcategories, use those
-                if sub_results:
-                    final_results.extend(sub_results)
-                else:
-                    # No subcategories matched, use the parent category
-                    self.logger.debug(f"{indent}⚠️  No subcategories matched, using parent: {matched_cat.name}")
-                    final_results.append(matched_cat)
-            else:
-                # Leaf category (no children), this is a final result
-                self.logger.debug(f"{indent}🎯 Leaf category reached: {matched_cat.name}")
-                final_results.append(matched_cat)
+        branch_results = await asyncio.gather(*(_drill(cat) for cat in matched_categories))
+        final_results = [cat for results in branch_results for cat in results]
 
         return final_results
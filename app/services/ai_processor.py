@@ -1,5 +1,7 @@
+import asyncio
 import os
-from typing import List, Optional
+import time
+from typing import AsyncIterator, List, Optional
 from datetime import datetime, timezone
 from app.core.exceptions import AIProcessingError, CacheError, MediaProcessingError
 from app.domain.constants.media_constants import MediaTypes
@@ -12,11 +14,14 @@ from app.services.primitives.image_processing import ImageProcessor
 from app.services.primitives.text_processing import TextProcessor
 from app.services.primitives.video_processing import VideoProcessor
 from app.adapters.storage.s3 import S3Client
-from app.adapters.cache.base import StreamInterface
+from app.adapters.cache.base import CacheInterface, StreamInterface
 from app.adapters.cache.utils import encode_redis_stream_payload
 from app.infra.logger import main_logger, LoggerStatus
+from app.infra.metrics import metrics
 from app.domain.utils.main import flatten_list_to_string
-from app.adapters.ai.llm.ollama import OllamaLLMEngine
+from app.adapters.ai.llm.ollama import get_llm_engine
+from app.adapters.ai.llm.router import estimate_prompt_tokens, get_model_router
+from app.adapters.ai.llm.streaming import SummaryStreamParser
 from app.services.ai_categorizer import ResQAICategorizer
 from app.core.config import config
 
@@ -36,11 +41,13 @@ class ResQAIProcessor:
         logger=None,
         s3_client: Optional[S3Client] = None,
         stream: Optional[StreamInterface] = None,
+        cache: Optional[CacheInterface] = None,
     ):
         self.supported_media_types = _media_type_lookup()
         self.logger = logger if logger is not None else main_logger
-        self.ollama_engine = OllamaLLMEngine(model="llava")
-        self.categorizer = ResQAICategorizer(logger=self.logger)
+        self.ollama_engine = get_llm_engine(model=config.OLLAMA_FAST_MODEL, cache=cache)
+        self.router = get_model_router(cache=cache)
+        self.categorizer = ResQAICategorizer(logger=self.logger, cache=cache)
         self.s3_client = s3_client
         self.stream = stream
 
@@ -283,24 +290,24 @@ class ResQAIProcessor:
     ) -> dict:
         """
         Flattens a JSON, gets summary (description), and generates a title using Ollama LLM.
-        Returns dict with title and description.
+        Returns dict with title, description and a degraded flag.
+
+        The LLM call is bounded by the summary deadline (LLM_LATENCY_BUDGET_SUMMARY);
+        when it fails or the deadline passes, the extractive fallback answers and
+        the result is marked degraded.
         """
+        text_with_context = self._build_tags_context(tags, extra_description)
         try:
-            flat_text = flatten_list_to_string(tags)
-            if extra_description and len(extra_description) > 0:
-                flat_description = flatten_list_to_string(extra_description)
-                extra_context = f"- report came with more information on {flat_description}"
-            else:
-                extra_context = "- user did not provide any extra information."
-
-            text_with_context = f"user made a report and we found these items {flat_text} {extra_context}"
-
             self.logger.log("Generating title and description with Ollama", LoggerStatus.INFO)
-            ollama_response = await self.ollama_engine.generate_report_summary(text_with_context)
+            ollama_response = await self.router.run(
+                "summary",
+                estimate_prompt_tokens(text_with_context),
+                lambda engine: engine.generate_report_summary(text_with_context),
+            )
 
             title, description = self.ollama_engine.parse_ollama_response(ollama_response)
 
-            return {"title": title, "description": description}
+            return {"title": title, "description": description, "degraded": False}
 
         except AIProcessingError as e:
             self.logger.log(
@@ -308,15 +315,100 @@ class ResQAIProcessor:
                 LoggerStatus.WARNING,
             )
             # Fallback to simple method if Ollama fails
-            if extra_description and len(extra_description) > 0:
-                flat_description = flatten_list_to_string(extra_description)
-                extra_context = f"- report came with more information on {flat_description}"
-            else:
-                extra_context = "- user did not provide any extra information."
-            text_with_context = f"user made a report and we found these items {flat_text} {extra_context}"
-            summary = await self.simple_summarize_text(text_with_context)
-            title = self._generate_fallback_title(text_with_context, summary)
-            return {"title": title, "description": summary.get("summary_text", "")}
+            return await self._fallback_report_summary(text_with_context)
+
+    async def stream_report_tags(
+        self, tags: List[str], extra_description: Optional[List[str]] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Streaming variant of process_report_tags.
+
+        Yields events as the model generates them:
+            {"event": "title", "data": {"title": ...}} as soon as the title line completes
+            {"event": "description", "data": {"delta": ...}} for each description chunk
+            {"event": "done", "data": {"title": ..., "description": ..., "degraded": ...}} at the end
+
+        The generation is bounded by the summary deadline. If Ollama fails or the
+        deadline passes before anything was emitted, the extractive fallback answers
+        with a title, a single description event and a degraded done event; if it
+        passes mid-stream, the partial result is finished and marked degraded. A
+        missed deadline is reported to the engine's circuit breaker as a slow call
+        with its elapsed time.
+
+        This path streams from the default engine directly: unlike
+        process_report_tags it does not go through the ModelRouter, so there is
+        no fallback to another model tier.
+        """
+        text_with_context = self._build_tags_context(tags, extra_description)
+        parser = SummaryStreamParser()
+        emitted = False
+        degraded = False
+        started = time.monotonic()
+        deadline = started + config.LLM_LATENCY_BUDGET_SUMMARY
+        chunks = aiter(self.ollama_engine.stream_report_summary(text_with_context))
+        try:
+            self.logger.log("Streaming title and description with Ollama", LoggerStatus.INFO)
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(chunks), timeout=max(deadline - time.monotonic(), 0))
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    await chunks.aclose()
+                    # The cancelled stream only gave back its breaker admission;
+                    # the missed deadline counts as a slow call.
+                    self.ollama_engine.circuit_breaker.record(False, time.monotonic() - started)
+                    if not emitted:
+                        raise
+                    self.logger.log("Summary stream exceeded its deadline, ending early", LoggerStatus.WARNING)
+                    degraded = True
+                    break
+                for event, text in parser.feed(chunk):
+                    emitted = True
+                    yield self._summary_stream_event(event, text)
+            for event, text in parser.finish():
+                yield self._summary_stream_event(event, text)
+
+            title, description = parser.result()
+            yield {"event": "done", "data": {"title": title, "description": description, "degraded": degraded}}
+
+        except Exception as e:  # pylint: disable=broad-except
+            # Headers are already sent for a streaming response, so errors are
+            # answered in-band instead of as an HTTP 500.
+            self.logger.log(f"Ollama streaming failed: {str(e)}", LoggerStatus.WARNING)
+            if emitted:
+                yield {"event": "error", "data": {"message": f"Generation interrupted: {str(e)}"}}
+                return
+
+            result = await self._fallback_report_summary(text_with_context)
+            yield {"event": "title", "data": {"title": result["title"]}}
+            yield {"event": "description", "data": {"delta": result["description"]}}
+            yield {"event": "done", "data": result}
+
+    def _summary_stream_event(self, event: str, text: str) -> dict:
+        if event == "title":
+            return {"event": "title", "data": {"title": text}}
+        return {"event": "description", "data": {"delta": text}}
+
+    def _build_tags_context(
+        self, tags: List[str], extra_description: Optional[List[str]] = None
+    ) -> str:
+        """Flatten report tags and extra description into the summarization input."""
+        flat_text = flatten_list_to_string(tags)
+        if extra_description and len(extra_description) > 0:
+            flat_description = flatten_list_to_string(extra_description)
+            extra_context = f"- report came with more information on {flat_description}"
+        else:
+            extra_context = "- user did not provide any extra information."
+
+        return f"user made a report and we found these items {flat_text} {extra_context}"
+
+    async def _fallback_report_summary(self, text_with_context: str) -> dict:
+        """Generate title and description with the extractive summarizer (marked degraded)."""
+        metrics.increment("llm_degraded_responses_total", operation="summary")
+        summary = await self.simple_summarize_text(text_with_context)
+        title = self._generate_fallback_title(text_with_context, summary)
+        return {"title": title, "description": summary.get("summary_text", ""), "degraded": True}
 
     def _generate_fallback_title(self, flat_text: str, summary: Optional[dict]) -> str:
         """
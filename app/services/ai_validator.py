@@ -1,4 +1,5 @@
-from typing import Optional
+import json
+from typing import Dict, Optional
 from datetime import datetime, timezone
 from app.domain.schema.validate import (
     AIPredictiveValidation,
@@ -7,10 +8,41 @@ from app.domain.schema.validate import (
 )
 from app.domain.constants.stream_constants import REDIS_STREAM_REPORT_PREDICTIVE_VALIDATION
 from app.adapters.ai.llm.ollama import OllamaLLMEngine
-from app.adapters.cache.base import StreamInterface
+from app.adapters.ai.prediction.linear import (
+    LogisticModel,
+    feature_dict,
+    feature_vector,
+    load_model,
+    training_features_key,
+)
+from app.adapters.ai.llm.router import estimate_prompt_tokens, get_model_router
+from app.adapters.cache.base import CacheInterface, StreamInterface
 from app.adapters.cache.utils import encode_redis_stream_payload
-from app.infra.logger import main_logger
+from app.infra.logger import LoggerStatus, main_logger
+from app.infra.metrics import metrics
+from app.core.config import config
 from app.core.exceptions import AIProcessingError, CacheError
+from app.services.validation_rules import ValidationRuleEngine, validation_rules
+
+PROBABILITY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95)
+
+
+def _load_prescreen_model() -> Optional[LogisticModel]:
+    try:
+        model = load_model(config.VALIDATION_PRESCREEN_MODEL_PATH)
+    except (OSError, ValueError, KeyError) as e:
+        main_logger.log(
+            f"[VALIDATION] Pre-screen model {config.VALIDATION_PRESCREEN_MODEL_PATH} not loaded: {e}",
+            LoggerStatus.WARNING,
+        )
+        return None
+    if model is not None:
+        main_logger.log(f"[VALIDATION] Loaded pre-screen model {config.VALIDATION_PRESCREEN_MODEL_PATH}", LoggerStatus.INFO)
+    return model
+
+
+# Shared pre-screen model (None until one is trained; see app/scripts/train_validation_prescreen.py)
+validation_prescreen = _load_prescreen_model()
 
 
 class ResQAIValidator:
@@ -19,18 +51,31 @@ class ResQAIValidator:
         logger=None,
         llm_engine: Optional[OllamaLLMEngine] = None,
         stream: Optional[StreamInterface] = None,
+        cache: Optional[CacheInterface] = None,
+        rules: Optional[ValidationRuleEngine] = None,
+        prescreen: Optional[LogisticModel] = None,
     ):
         """
         Initialize the AI validator.
 
         Args:
             logger: Optional logger instance (defaults to main_logger)
-            llm_engine: Optional LLM engine instance (defaults to OllamaLLMEngine)
+            llm_engine: Optional LLM engine instance; when omitted, calls are routed
+                across model tiers by the shared ModelRouter
             stream: Optional stream interface for pushing validation results
+            cache: Optional cache interface used for LLM response caching
+            rules: Optional rule engine deciding clear cases without the LLM
+                (defaults to the shared engine)
+            prescreen: Optional logistic model deciding confident cases without
+                the LLM (defaults to the shared model, if one was trained)
         """
         self.logger = logger if logger is not None else main_logger
-        self.llm_engine = llm_engine or OllamaLLMEngine(model="llama2-uncensored")
+        self.llm_engine = llm_engine
+        self.router = get_model_router(cache=cache)
         self.stream = stream
+        self.cache = cache
+        self.rules = rules if rules is not None else validation_rules
+        self.prescreen = prescreen if prescreen is not None else validation_prescreen
 
     async def validate_report(
         self, req_body: AIPredictiveValidationRequest, correlated_id: Optional[str] = None
@@ -38,6 +83,10 @@ class ResQAIValidator:
         """
         Runs predictive validation using AI for the given report data.
 
+        Reports whose deterministic data is decisive are answered by the rule
+        engine, then reports the pre-screen model is confident about by the
+        model; only the remaining ones are sent to the LLM.
+
         Args:
             req_body: An instance of AIPredictiveValidationRequest (from schema)
             correlated_id: Optional correlation ID for logging/tracing
@@ -50,6 +99,27 @@ class ResQAIValidator:
                 f"[VALIDATION] Starting predictive validation for report_id={req_body.report_id}"
             )
 
+            # Clear cases are decided from the deterministic data alone: first
+            # by the operator rules, then by the pre-screen model
+            features = feature_dict(req_body.deterministic_validation)
+            path = "rules"
+            fast_result = self.rules.evaluate(req_body.deterministic_validation)
+            if fast_result is None and self.prescreen is not None:
+                path = "prescreen"
+                fast_result = self._prescreen(req_body, features)
+            if fast_result is not None:
+                metrics.increment("validation_path_total", path=path)
+                self.logger.debug(
+                    f"[VALIDATION] Decided by {path} for report_id={req_body.report_id}: "
+                    f"Status: {fast_result.final_validity_status}"
+                )
+                await self._store_features(req_body.report_id, features, path)
+                if self.stream:
+                    await self._push_to_stream(req_body.report_id, fast_result, correlated_id)
+                return fast_result
+            metrics.increment("validation_path_total", path="llm")
+            await self._store_features(req_body.report_id, features, "llm")
+
             # Prepare deterministic validation data for LLM (excluding is_valid - AI decides independently)
             deterministic_data = {
                 "trust_score": req_body.deterministic_validation.trust_score,
@@ -66,12 +136,7 @@ class ResQAIValidator:
             }
 
             # Call LLM for predictive validation - returns structured ValidationResponse
-            llm_result = await self.llm_engine.validate_report(
-                title=req_body.report_title,
-                summary=req_body.report_summary,
-                categories=req_body.categories,
-                deterministic_data=deterministic_data,
-            )
+            llm_result = await self._run_llm_validation(req_body, deterministic_data)
 
             # Log parsed LLM result for debugging
             self.logger.debug("\n" + "=" * 80)
@@ -132,6 +197,67 @@ class ResQAIValidator:
 
             return fallback_result
 
+    def _prescreen(self, req_body: AIPredictiveValidationRequest, features: Dict[str, float]) -> Optional[AIPredictiveValidation]:
+        """Verdict of the pre-screen model when it is confident, else None (the LLM decides)."""
+        vector = feature_vector(features, self.prescreen.feature_names)
+        probability = self.prescreen.score(vector)
+        metrics.observe("validation_prescreen_probability", probability, buckets=PROBABILITY_BUCKETS)
+        if probability >= config.VALIDATION_PRESCREEN_VALID_THRESHOLD:
+            status, confidence, review = "valid", probability, False
+        elif probability <= config.VALIDATION_PRESCREEN_INVALID_THRESHOLD:
+            status, confidence, review = "invalid", 1.0 - probability, True
+        else:
+            return None
+
+        reasons = [
+            f"{name.replace('_', ' ').capitalize()} is {features.get(name, 0.0):g}, "
+            f"which {'supports' if change > 0 else 'counts against'} validity"
+            for name, change in self.prescreen.contributions(vector)
+        ]
+        return AIPredictiveValidation(
+            summary=f"Pre-screen model estimates a {probability:.0%} probability that the report is valid.",
+            requires_human_review=review,
+            confidence_score=round(confidence * 100, 1),
+            final_validity_status=status,
+            reasons=reasons,
+            supporting_inferences=[inference.observation for inference in req_body.deterministic_validation.inferences],
+        )
+
+    async def _store_features(self, report_id: int, features: Dict[str, float], path: str) -> None:
+        """Keep a report's features and decision path so its verdict can be used for training."""
+        if self.cache is None or config.VALIDATION_FEATURES_TTL_SECONDS <= 0:
+            return
+        try:
+            await self.cache.set(
+                training_features_key(report_id),
+                json.dumps({"features": features, "path": path}),
+                ttl=config.VALIDATION_FEATURES_TTL_SECONDS,
+            )
+        except CacheError as e:
+            self.logger.debug(f"[VALIDATION] Failed to store features for report_id={report_id}: {str(e)}")
+
+    async def _run_llm_validation(
+        self, req_body: AIPredictiveValidationRequest, deterministic_data: dict
+    ):
+        """Run LLM validation on the injected engine, or through the model router."""
+
+        def _call(engine: OllamaLLMEngine):
+            return engine.validate_report(
+                title=req_body.report_title,
+                summary=req_body.report_summary,
+                categories=req_body.categories,
+                deterministic_data=deterministic_data,
+            )
+
+        if self.llm_engine is not None:
+            return await _call(self.llm_engine)
+
+        prompt_text = " ".join(
+            [req_body.report_title, req_body.report_summary]
+            + [str(item) for item in deterministic_data["issues"] + deterministic_data["inferences"]]
+        )
+        return await self.router.run("validation", estimate_prompt_tokens(prompt_text), _call)
+
     async def _push_to_stream(
         self,
         report_id: int,
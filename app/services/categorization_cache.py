@@ -0,0 +1,152 @@
+"""
+app.services.categorization_cache
+---------------------------------
+
+Redis-backed cache of whole categorization results.
+
+The backend re-submits reports after edits that do not change their meaning,
+and near-identical reports are common. A result is stored under a key built
+from:
+    - the category tree key and version, so a changed tree is never served
+      results that refer to old categories
+    - the categorizer mode and the categorization prompt version
+    - the models the router may use for categorization and a hash of the
+      categorizer settings that change results (shortlist sizes, branch
+      pruning, call cap, keyword fast path, structured-output mode), so a
+      model or config change is not answered with results of the old one
+    - a hash of the normalized title and description (lower-cased, punctuation
+      dropped, whitespace collapsed)
+The value holds the intermediate stream events in the order they were pushed
+and the final category IDs, so a hit replays the same stream without any LLM
+work.
+
+Typical Usage:
+    result_cache = CategorizationResultCache(cache=redis_cache)
+    cached = await result_cache.get(tree, "recursive", title, description)
+    if cached is None:
+        ...
+        await result_cache.set(tree, "recursive", title, description, CachedCategorization(events, ids))
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from app.adapters.ai.llm.models import models
+from app.adapters.ai.llm.prompts import PROMPT_VERSIONS
+from app.adapters.ai.llm.router import OPERATION_TIERS
+from app.adapters.cache.base import CacheInterface
+from app.core.config import config
+from app.core.exceptions import CacheError
+from app.infra.logger import LoggerStatus, StructuredLogger, main_logger
+from app.infra.metrics import metrics
+from app.services.category_tree import CategoryTree
+
+CATEGORIZATION_RESULT_KEY_PREFIX = "resq:categorization"
+
+_WORD = re.compile(r"\w+")
+
+
+class CachedCategorization(NamedTuple):
+    """A categorization result: intermediate events (category slugs per event) and final category IDs."""
+
+    events: List[List[str]]
+    category_ids: List[int]
+
+
+def normalize_report_text(text: str) -> str:
+    """Lower-case a text and reduce it to its words, so edits to case, punctuation or spacing share a key."""
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def categorization_settings() -> Dict[str, Any]:
+    """The models and categorizer settings a cached result depends on (read when the key is built)."""
+    tiers = [models[name] for name in OPERATION_TIERS["categorization"] if name in models]
+    return {
+        "models": [tier.model for tier in tiers if tier.is_local or config.LLM_ROUTER_CLOUD_ENABLED],
+        "structured_output": config.LLM_STRUCTURED_OUTPUT_MODE,
+        "shortlist_k": config.CATEGORIZER_SHORTLIST_K,
+        "shortlist_flat_k": config.CATEGORIZER_SHORTLIST_FLAT_K,
+        "flat_token_budget": config.CATEGORIZER_FLAT_TOKEN_BUDGET,
+        "catch_all": config.CATEGORIZER_CATCH_ALL_SLUGS,
+        "max_branches": config.CATEGORIZER_MAX_BRANCHES_PER_LEVEL,
+        "confidence_floor": config.CATEGORIZER_CONFIDENCE_FLOOR,
+        "max_llm_calls": config.CATEGORIZER_MAX_LLM_CALLS,
+        "keyword_fast_path": config.CATEGORIZER_KEYWORD_FAST_PATH,
+        "keyword_max_matches": config.CATEGORIZER_KEYWORD_MAX_MATCHES,
+        "synonyms": config.CATEGORIZER_SYNONYMS_PATH,
+    }
+
+
+def build_categorization_key(tree: CategoryTree, mode: str, title: str, description: str) -> str:
+    """Build the cache key of a report's categorization against a tree version and the current settings."""
+    text = f"{normalize_report_text(title)}\n{normalize_report_text(description)}"
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    version = PROMPT_VERSIONS.get("categorization", "0")
+    settings = categorization_settings()
+    model = "+".join(settings["models"]) or "none"
+    fingerprint = hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    return (
+        f"{CATEGORIZATION_RESULT_KEY_PREFIX}:{tree.key}:{tree.version}:{mode}:v{version}:"
+        f"{model}:{fingerprint}:{digest}"
+    )
+
+
+class CategorizationResultCache:
+    """
+    TTL cache of categorization results with hit/miss metrics.
+
+    Cache failures are logged and treated as misses; they never fail a categorization.
+
+    Args:
+        cache: CacheInterface used for storage
+        ttl: Seconds a result is kept (0 disables the cache); defaults to CATEGORIZATION_RESULT_CACHE_TTL
+        logger: StructuredLogger instance (optional, defaults to main_logger)
+    """
+
+    def __init__(
+        self,
+        cache: CacheInterface,
+        ttl: Optional[int] = None,
+        logger: Optional[StructuredLogger] = None,
+    ):
+        self.cache = cache
+        self.ttl = config.CATEGORIZATION_RESULT_CACHE_TTL if ttl is None else ttl
+        self.logger = logger or main_logger
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def get(self, tree: CategoryTree, mode: str, title: str, description: str) -> Optional[CachedCategorization]:
+        """Return the cached result for a report, or None on a miss."""
+        try:
+            raw = await self.cache.get(build_categorization_key(tree, mode, title, description))
+        except CacheError as e:
+            self.logger.log(f"[CATEGORIZATION CACHE] Lookup failed: {e}", LoggerStatus.WARNING)
+            metrics.increment("categorization_result_cache_errors_total")
+            return None
+
+        try:
+            value = json.loads(raw) if raw else None
+            cached = CachedCategorization(value["events"], value["category_ids"]) if value else None
+        except (json.JSONDecodeError, TypeError, KeyError):
+            cached = None
+        # A stored ID the tree no longer has means the entry is unusable.
+        if cached is not None and not all(category_id in tree.index.by_id for category_id in cached.category_ids):
+            cached = None
+        metrics.increment("categorization_result_cache_total", mode=mode, result="miss" if cached is None else "hit")
+        return cached
+
+    async def set(self, tree: CategoryTree, mode: str, title: str, description: str, result: CachedCategorization) -> None:
+        """Store a report's result for the cache TTL."""
+        try:
+            await self.cache.set(
+                build_categorization_key(tree, mode, title, description),
+                json.dumps(result._asdict()),
+                ttl=self.ttl,
+            )
+        except CacheError as e:
+            self.logger.log(f"[CATEGORIZATION CACHE] Store failed: {e}", LoggerStatus.WARNING)
+            metrics.increment("categorization_result_cache_errors_total")
@@ -0,0 +1,235 @@
+"""
+app.services.category_search
+----------------------------
+
+Local lexical retrieval over categories.
+
+BM25Index ranks categories against a report to shortlist the categories sent to
+the LLM. Each category is indexed as one document: its full path of names, its
+slug and its description. Reports are matched with Okapi BM25, so rare, specific
+words ("burglary", "flood") weigh more than words shared by many categories.
+
+KeywordMatcher answers obvious reports without the LLM. It is an inverted index
+of keyword phrases, keyed by their first word, built from each category's name,
+slug, short comma-separated description phrases ("Burst water pipe, flooding")
+and an operator-maintained synonym file (CATEGORIZER_SYNONYMS_PATH):
+    {"armed-robbery": ["gunmen", "robbed at gunpoint"], "fire": ["on fire", "inferno"]}
+A report is matched in one pass over its words. Hits on a category and on one
+of its descendants count for the descendant only. Catch-all categories
+("other", "general") are not indexed: their names are common words and say
+nothing about the report. The match is confident when it names a few leaf
+categories and nothing else, each through a specific hit (a phrase of several
+words, or a word no unrelated category uses), and no hit follows a negation
+("no accident", "not a fire"); anything else is left to the LLM.
+
+Text is lower-cased, split into words, stripped of stop words and of common
+English suffixes ("robbed", "robbery" and "robbing" all index as "robb"). Both
+indexes are part of CategoryTreeIndex, so they are built once per tree version.
+
+Typical Usage:
+    search = BM25Index({1: "Crime robbery theft", 2: "Fire building smoke"})
+    search.rank("armed robbery at bus stop", [1, 2])  # [(1, 0.6...), (2, 0.0)]
+
+    matcher = KeywordMatcher({21: ["fire", "building fire"]}, parent={21: 2}, leaves={21})
+    matcher.match("Fire at the market").category_ids  # [21]
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+_WORD = re.compile(r"[a-z0-9]+")
+_SUFFIXES = ("ings", "ing", "ery", "ed", "s")
+_STOP_WORDS = frozenset(
+    "a an and are as at be been by for from has have in into is it its of on or that the their there this "
+    "to was were with who what when where which while".split()
+)
+
+
+def _stem(word: str) -> str:
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith("ss"):
+        return word
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+# Words too vague to decide a category on their own, stemmed like report words
+_GENERIC_WORDS = frozenset(
+    _stem(word) for word in "general help incident issue misc miscellaneous other problem report situation".split()
+)
+# Negations, stemmed like report words ("isn't" is split into "isn" and "t");
+# a hit right after one is not trusted
+_NEGATIONS = frozenset(
+    _stem(word)
+    for word in "no not never without none nothing nobody neither nor cannot isn wasn weren aren don doesn didn".split()
+)
+_NEGATION_WINDOW = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased, stemmed words of a text, without stop words."""
+    return [_stem(word) for word in _WORD.findall(text.lower()) if word not in _STOP_WORDS and len(word) > 1]
+
+
+class BM25Index:
+    """
+    Okapi BM25 ranking over a fixed set of documents.
+
+    Args:
+        documents: Text per document id
+        k1: Term frequency saturation
+        b: Document length normalization
+    """
+
+    def __init__(self, documents: Dict[int, str], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.lengths: Dict[int, int] = {}
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, text in documents.items():
+            terms = Counter(tokenize(text))
+            self.lengths[doc_id] = sum(terms.values())
+            for term, frequency in terms.items():
+                self.postings.setdefault(term, []).append((doc_id, frequency))
+        count = len(documents) or 1
+        self.average_length = (sum(self.lengths.values()) / count) or 1.0
+        self.idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self.postings.items()
+        }
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """BM25 score of every document sharing at least one term with the query."""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, frequency in self.postings[term]:
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / self.average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+        return scores
+
+    def rank(self, query: str, candidates: Iterable[int]) -> List[Tuple[int, float]]:
+        """Candidates ordered by score (best first); ties keep candidate order."""
+        scores = self.scores(query)
+        return sorted(((doc_id, scores.get(doc_id, 0.0)) for doc_id in candidates), key=lambda item: -item[1])
+
+
+class KeywordMatch(NamedTuple):
+    """Outcome of a keyword match: the most specific matched categories and the phrases that hit."""
+
+    category_ids: List[int]
+    phrases: Dict[int, List[str]]
+    confident: bool
+
+
+class KeywordMatcher:
+    """
+    Inverted index of keyword phrases to categories.
+
+    Args:
+        keywords: Keyword phrases per category id
+        parent: Parent id per category id (None for roots)
+        leaves: Ids of the leaf categories
+        max_matches: Most leaf categories a confident match may name
+        excluded: Ids of categories not to index (the catch-all categories)
+    """
+
+    def __init__(
+        self,
+        keywords: Dict[int, Iterable[str]],
+        parent: Dict[int, Optional[int]],
+        leaves: Set[int],
+        max_matches: int = 1,
+        excluded: Optional[Set[int]] = None,
+    ):
+        self.parent = parent
+        self.leaves = leaves
+        self.max_matches = max_matches
+        excluded = excluded or set()
+        # first word -> [(phrase words, phrase, category id)], longest phrases first
+        self.index: Dict[str, List[Tuple[Tuple[str, ...], str, int]]] = {}
+        word_categories: Dict[str, Set[int]] = {}
+        for category_id, phrases in keywords.items():
+            if category_id in excluded:
+                continue
+            seen: Set[Tuple[str, ...]] = set()
+            for phrase in phrases:
+                words = tuple(tokenize(phrase))
+                if words and words not in seen:
+                    seen.add(words)
+                    self.index.setdefault(words[0], []).append((words, phrase, category_id))
+                    for word in words:
+                        word_categories.setdefault(word, set()).add(category_id)
+        for entries in self.index.values():
+            entries.sort(key=lambda entry: -len(entry[0]))
+        # A single word identifies a category when no unrelated category uses it
+        # (a parent describing its children with the same word does not count).
+        self.specific_words: Set[str] = {
+            word
+            for word, category_ids in word_categories.items()
+            if word not in _GENERIC_WORDS and len(self._most_specific(category_ids)) == 1
+        }
+
+    def _ancestors(self, category_id: int) -> Set[int]:
+        ancestors = set()
+        ancestor = self.parent.get(category_id)
+        while ancestor is not None:
+            ancestors.add(ancestor)
+            ancestor = self.parent.get(ancestor)
+        return ancestors
+
+    def _most_specific(self, category_ids: Iterable[int]) -> List[int]:
+        """The categories that are not an ancestor of another one in the set."""
+        category_ids = list(category_ids)
+        implied: Set[int] = set()
+        for category_id in category_ids:
+            implied |= self._ancestors(category_id)
+        return [category_id for category_id in category_ids if category_id not in implied]
+
+    def match(self, text: str) -> KeywordMatch:
+        """Match a report's text against the keyword phrases."""
+        words = tokenize(text)
+        phrases: Dict[int, List[str]] = {}
+        specific: Set[int] = set()
+        negated = False
+        for position, word in enumerate(words):
+            for phrase_words, phrase, category_id in self.index.get(word, ()):
+                if tuple(words[position : position + len(phrase_words)]) == phrase_words:
+                    hits = phrases.setdefault(category_id, [])
+                    if phrase not in hits:
+                        hits.append(phrase)
+                    if len(phrase_words) > 1 or word in self.specific_words:
+                        specific.add(category_id)
+                    if _NEGATIONS.intersection(words[max(0, position - _NEGATION_WINDOW) : position]):
+                        negated = True
+
+        # A hit on a category is implied by a hit on any of its descendants.
+        category_ids = self._most_specific(phrases)
+        confident = (
+            0 < len(category_ids) <= self.max_matches
+            and all(c in self.leaves and c in specific for c in category_ids)
+            and not negated
+        )
+        return KeywordMatch(category_ids, phrases, confident)
+
+
+def category_keywords(name: str, slug: str, description: str, max_words: int = 3) -> List[str]:
+    """
+    Keyword phrases of a category: its name, its slug and the short phrases of its description.
+
+    Descriptions written as comma-separated lists ("Robbery, theft, assault")
+    contribute each item of up to max_words words; sentences do not.
+    """
+    keywords = [name, slug.replace("-", " ")]
+    for phrase in re.split(r"[,;/]", description):
+        phrase = phrase.strip()
+        if phrase and len(tokenize(phrase)) <= max_words:
+            keywords.append(phrase)
+    return keywords
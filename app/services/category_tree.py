@@ -0,0 +1,360 @@
+"""
+app.services.category_tree
+--------------------------
+
+In-process cache of parsed category trees, one per cache key.
+
+The category tree is stored in Redis as JSON and rarely changes, but parsing it
+(json.loads plus CategoryNode validation of the whole tree) on every
+categorization is expensive. CategoryTreeCache keeps the parsed tree per key,
+stamped with a version:
+    - the version is the content of "<key>:version" when the writer maintains
+      one, otherwise a hash of the tree JSON
+    - while an entry is fresh, get() does no Redis round trip and no parsing
+    - an entry goes stale when a keyspace notification reports a write to the
+      key or its version key, or when its TTL expires
+    - a stale entry is revalidated: if the version key is unchanged, or the tree
+      JSON hashes to the same version, the parsed tree is kept as is
+
+Each loaded tree is compiled once into a CategoryTreeIndex: id and slug maps,
+parent pointers, full paths, the leaf set, and the rendered prompt block of each
+node's children (per model), so the categorizer neither scans lists to match
+model output nor re-renders a level's category list. The flat categorizer mode
+uses the leaf paths block instead: every leaf rendered as its full path.
+
+The index also holds a BM25 index over every category's path, slug and
+description; shortlist() uses it to offer the LLM only the categories closest to
+the report (plus any catch-all category) when a level has many categories. Its
+KeywordMatcher, built from the categories and the operator synonym file, lets
+obvious reports skip the LLM entirely.
+
+Keyspace notifications are enabled on Redis when allowed (CONFIG SET can be
+forbidden on managed Redis); without them the TTL bounds staleness. The
+listener reconnects with exponential backoff when its connection drops, and
+marks every tree stale once it is back, since writes made during the outage
+were not notified.
+
+Typical Usage:
+    tree = await category_tree_cache.get(redis_cache, "categories:tree")
+    if tree is not None:
+        children = tree.index.children(None)
+        block = tree.index.prompt_block(None, "llava")
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.adapters.ai.llm.ollama import CategoryPromptBlock, render_categories_block
+from app.adapters.cache.base import CacheInterface
+from app.core.config import config
+from app.domain.schema.categorize import CategoryNode
+from app.infra.logger import LoggerStatus, main_logger
+from app.infra.metrics import metrics
+from app.services.category_search import BM25Index, KeywordMatcher, category_keywords
+
+# Keyspace event classes required: K (keyspace channel), $ (strings), g (del/rename/expire), x (expired)
+_REQUIRED_KEYSPACE_FLAGS = "K$gx"
+
+# Reconnect delays of the invalidation listener, in seconds
+_LISTENER_MIN_BACKOFF = 1.0
+_LISTENER_MAX_BACKOFF = 60.0
+
+
+class CategoryTreeIndex:
+    """
+    Compiled lookup structure over a category tree.
+
+    Args:
+        nodes (List[CategoryNode]): Root categories, with nested children
+    """
+
+    def __init__(self, nodes: List[CategoryNode]):
+        self.roots = nodes
+        self.by_id: Dict[int, CategoryNode] = {}
+        self.by_slug: Dict[str, CategoryNode] = {}
+        self.parent: Dict[int, Optional[int]] = {}
+        self.paths: Dict[int, Tuple[str, ...]] = {}
+        self.leaves: Set[int] = set()
+        self._children: Dict[Optional[int], List[CategoryNode]] = {None: nodes}
+        self._blocks: Dict[Tuple[Optional[int], str], CategoryPromptBlock] = {}
+        self._leaf_blocks: Dict[str, CategoryPromptBlock] = {}
+
+        stack: List[Tuple[CategoryNode, Optional[int], Tuple[str, ...]]] = [(n, None, ()) for n in nodes]
+        while stack:
+            node, parent_id, parent_path = stack.pop()
+            path = parent_path + (node.name,)
+            self.by_id[node.id] = node
+            self.by_slug[node.slug] = node
+            self.parent[node.id] = parent_id
+            self.paths[node.id] = path
+            children = node.children or []
+            if children:
+                self._children[node.id] = children
+                stack.extend((child, node.id, path) for child in children)
+            else:
+                self.leaves.add(node.id)
+
+        catch_all_slugs = {slug.strip() for slug in config.CATEGORIZER_CATCH_ALL_SLUGS.split(",") if slug.strip()}
+        self.catch_all: Set[int] = {node.id for node in self.by_id.values() if node.slug in catch_all_slugs}
+        self.search = BM25Index(
+            {
+                node.id: f"{' '.join(self.paths[node.id])} {node.slug.replace('-', ' ')} {node.description}"
+                for node in self.by_id.values()
+            }
+        )
+        synonyms = load_synonyms(config.CATEGORIZER_SYNONYMS_PATH)
+        self.keywords = KeywordMatcher(
+            {
+                node.id: category_keywords(node.name, node.slug, node.description) + synonyms.get(node.slug, [])
+                for node in self.by_id.values()
+            },
+            parent=self.parent,
+            leaves=self.leaves,
+            max_matches=config.CATEGORIZER_KEYWORD_MAX_MATCHES,
+            excluded=self.catch_all,
+        )
+
+    def children(self, parent_id: Optional[int]) -> List[CategoryNode]:
+        """Children of a category (the root categories for None)."""
+        return self._children.get(parent_id, [])
+
+    def is_child(self, category_id: int, parent_id: Optional[int]) -> bool:
+        """Whether category_id is one of the categories at the level below parent_id."""
+        return category_id in self.parent and self.parent[category_id] == parent_id
+
+    def prompt_block(self, parent_id: Optional[int], model: str) -> CategoryPromptBlock:
+        """Rendered category list for the level below parent_id, rendered once per model."""
+        key = (parent_id, model)
+        block = self._blocks.get(key)
+        if block is None:
+            block = render_categories_block(self.children(parent_id), model)
+            self._blocks[key] = block
+        return block
+
+    def shortlist(self, categories: List[CategoryNode], query: str, k: int) -> List[CategoryNode]:
+        """
+        The k categories that best match the query, plus any catch-all category.
+
+        The list is returned unchanged when shortlisting would not shrink it,
+        or when no category shares a word with the query (there is nothing to
+        rank on, so the model sees every category).
+
+        Args:
+            categories (List[CategoryNode]): Categories offered at one level
+            query (str): Report title and description
+            k (int): Number of best-matching categories kept (0 disables shortlisting)
+        """
+        catch_all = [category for category in categories if category.id in self.catch_all]
+        if k <= 0 or len(categories) <= k + len(catch_all):
+            return categories
+        ranked = self.search.rank(query, [category.id for category in categories if category.id not in self.catch_all])
+        if not ranked or ranked[0][1] <= 0:
+            metrics.increment("categorizer_shortlist_total", result="no_match")
+            return categories
+        metrics.increment("categorizer_shortlist_total", result="shortlisted")
+        return [self.by_id[category_id] for category_id, _ in ranked[:k]] + catch_all
+
+    def path_name(self, category_id: int) -> str:
+        """Full path of a category, e.g. "Crime > Theft > Vehicle"."""
+        return " > ".join(self.paths[category_id])
+
+    def leaf_nodes(self) -> List[CategoryNode]:
+        """Leaf categories of the whole tree."""
+        return [self.by_id[category_id] for category_id in self.leaves]
+
+    def leaf_paths_block(self, model: str) -> CategoryPromptBlock:
+        """Rendered list of every leaf as its full path (flat mode), rendered once per model."""
+        block = self._leaf_blocks.get(model)
+        if block is None:
+            block = self.render_paths(self.leaf_nodes(), model)
+            self._leaf_blocks[model] = block
+        return block
+
+    def render_paths(self, categories: List[CategoryNode], model: str) -> CategoryPromptBlock:
+        """Render categories by their full path, within the flat mode budget (not cached)."""
+        return render_categories_block(
+            categories,
+            model,
+            names={category.id: self.path_name(category.id) for category in categories},
+            budget=config.CATEGORIZER_FLAT_TOKEN_BUDGET,
+        )
+
+
+class CategoryTree:
+    """A parsed category tree, its compiled index and the version it was parsed from."""
+
+    def __init__(self, key: str, version: str, nodes: List[CategoryNode]):
+        self.key = key
+        self.version = version
+        self.nodes = nodes
+        self.index = CategoryTreeIndex(nodes)
+        self.checked_at = time.monotonic()
+        self.stale = False
+
+
+def load_synonyms(path: str) -> Dict[str, List[str]]:
+    """
+    Read the operator synonym file: a JSON object of category slug -> keyword phrases.
+
+    Edits take effect when the category tree is next reloaded. A missing or
+    malformed file is logged and ignored.
+    """
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            synonyms = json.load(f)
+        return {str(slug): [str(phrase) for phrase in phrases] for slug, phrases in synonyms.items()}
+    except (OSError, ValueError, AttributeError, TypeError) as e:
+        main_logger.log(f"[CATEGORY TREE] Ignoring synonym file {path}: {e}", LoggerStatus.WARNING)
+        return {}
+
+
+def version_key(key: str) -> str:
+    return f"{key}:version"
+
+
+class CategoryTreeCache:
+    """
+    Per-key cache of parsed category trees.
+
+    Args:
+        ttl_seconds: Maximum time an entry is served without revalidation
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.trees: Dict[str, CategoryTree] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def get(self, cache: CacheInterface, key: str) -> Optional[CategoryTree]:
+        """
+        Return the parsed tree for a key, loading or revalidating it when stale.
+
+        Args:
+            cache (CacheInterface): Redis cache holding the tree JSON
+            key (str): Cache key of the tree
+
+        Returns:
+            Optional[CategoryTree]: The tree, or None if the key holds no tree
+        """
+        tree = self.trees.get(key)
+        if tree is not None and self._is_fresh(tree):
+            metrics.increment("category_tree_cache_total", result="hit")
+            return tree
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have reloaded the tree while we waited.
+            tree = self.trees.get(key)
+            if tree is not None and self._is_fresh(tree):
+                metrics.increment("category_tree_cache_total", result="hit")
+                return tree
+            return await self._load(cache, key, tree)
+
+    def invalidate(self, key: str, source: str = "manual") -> None:
+        """Mark a key's tree stale so the next get() revalidates it."""
+        tree = self.trees.get(key)
+        if tree is not None and not tree.stale:
+            tree.stale = True
+            metrics.increment("category_tree_invalidations_total", source=source)
+            main_logger.debug(f"[CATEGORY TREE] Invalidated '{key}' ({source})")
+
+    async def run_invalidation_listener(self, redis_client: Any, db: int = config.CACHE_DB) -> None:
+        """
+        Invalidate cached trees on Redis keyspace notifications; runs until cancelled.
+
+        Args:
+            redis_client: redis.asyncio client (RedisCache.redis)
+            db (int): Redis database number the trees live in
+        """
+        if not await self._enable_keyspace_notifications(redis_client):
+            return
+        prefix = f"__keyspace@{db}__:"
+        backoff = _LISTENER_MIN_BACKOFF
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{prefix}{config.CATEGORY_TREE_KEY_PATTERN}")
+                main_logger.log("Category tree invalidation listener started", LoggerStatus.INFO)
+                backoff = _LISTENER_MIN_BACKOFF
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    changed = str(message["channel"])[len(prefix):]
+                    key = changed[: -len(":version")] if changed.endswith(":version") else changed
+                    self.invalidate(key, source="keyspace")
+            except Exception as e:  # pylint: disable=broad-except
+                main_logger.log(
+                    f"[CATEGORY TREE] Invalidation listener disconnected ({e}); reconnecting in {backoff:.0f}s",
+                    LoggerStatus.WARNING,
+                )
+                metrics.increment("category_tree_listener_reconnects_total")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:  # pylint: disable=broad-except
+                    pass
+            # Writes made while disconnected were not notified.
+            for key in list(self.trees):
+                self.invalidate(key, source="reconnect")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _LISTENER_MAX_BACKOFF)
+
+    def _is_fresh(self, tree: CategoryTree) -> bool:
+        return not tree.stale and time.monotonic() - tree.checked_at < self.ttl_seconds
+
+    async def _load(self, cache: CacheInterface, key: str, current: Optional[CategoryTree]) -> Optional[CategoryTree]:
+        stored_version = await cache.get(version_key(key))
+        if current is not None and stored_version is not None and stored_version == current.version:
+            return self._revalidated(current)
+
+        categories_json = await cache.get(key)
+        if not categories_json:
+            self.trees.pop(key, None)
+            metrics.increment("category_tree_cache_total", result="miss")
+            return None
+
+        version = stored_version or hashlib.sha256(categories_json.encode("utf-8")).hexdigest()[:16]
+        if current is not None and version == current.version:
+            return self._revalidated(current)
+
+        nodes = [CategoryNode.model_validate(item) for item in json.loads(categories_json)]
+        tree = CategoryTree(key, version, nodes)
+        self.trees[key] = tree
+        metrics.increment("category_tree_cache_total", result="reload")
+        main_logger.log(f"[CATEGORY TREE] Loaded '{key}' version {version}", LoggerStatus.INFO)
+        return tree
+
+    @staticmethod
+    def _revalidated(tree: CategoryTree) -> CategoryTree:
+        tree.stale = False
+        tree.checked_at = time.monotonic()
+        metrics.increment("category_tree_cache_total", result="revalidated")
+        return tree
+
+    async def _enable_keyspace_notifications(self, redis_client: Any) -> bool:
+        try:
+            current = (await redis_client.config_get("notify-keyspace-events")).get("notify-keyspace-events", "")
+            flags = current
+            for flag in _REQUIRED_KEYSPACE_FLAGS:
+                # "A" is an alias for all event classes except K/E
+                if flag not in flags and (flag == "K" or "A" not in flags):
+                    flags += flag
+            if flags != current:
+                await redis_client.config_set("notify-keyspace-events", flags)
+            return True
+        except Exception as e:  # pylint: disable=broad-except
+            main_logger.log(
+                f"Keyspace notifications unavailable ({e}); category trees refresh every "
+                f"{self.ttl_seconds:.0f}s instead",
+                LoggerStatus.WARNING,
+            )
+            return False
+
+
+# Shared cache: the parsed tree is reused by every categorizer in this process.
+category_tree_cache = CategoryTreeCache(ttl_seconds=config.CATEGORY_TREE_TTL_SECONDS)
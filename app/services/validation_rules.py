@@ -0,0 +1,267 @@
+"""
+app.services.validation_rules
+-----------------------------
+
+Deterministic rule engine run before LLM predictive validation.
+
+Many reports are decided by their deterministic validation data alone: a
+trusted reporter with no issues, or a reporter with a high rejection rate
+posting from an unknown device. Rules describe such clear cases as conditions
+on features of the DeterministicValidationData; the first rule whose
+conditions all hold produces the AIPredictiveValidation directly, and only
+reports no rule matches go to the LLM.
+
+Features:
+    trust_score, issues_count, inferences_count
+    error_issues, warning_issues        issues by level
+    error_inferences, warning_inferences
+    reporter_history_count, rejected_reports_count
+    rejection_rate                      rejected / history (0 for new reporters)
+    device_fingerprint_match            1.0 or 0.0
+    average_evidence_distance, report_frequency_score
+The metadata and count features are the pre-screen model's (feature_dict in
+app.adapters.ai.prediction.linear).
+
+Conditions map a feature to bounds, {"min": x} and/or {"max": y} (inclusive).
+The default rules can be replaced by a JSON list in VALIDATION_RULES_PATH:
+    [{"name": "trusted_clean", "status": "valid", "confidence": 90,
+      "requires_human_review": false, "description": "Trusted reporter, no issues",
+      "conditions": {"trust_score": {"min": 90}, "issues_count": {"max": 0}}}]
+Every definition is checked when the file is loaded (known keys and features,
+a status from VALIDITY_STATUSES, a confidence from 0 to 100, numeric bounds);
+if any is invalid the whole file is rejected and the default rules are used.
+
+Typical Usage:
+    verdict = validation_rules.evaluate(req_body.deterministic_validation)
+    if verdict is None:
+        ...  # ambiguous, ask the LLM
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from app.adapters.ai.prediction.linear import FEATURE_NAMES, feature_dict
+from app.core.config import config
+from app.domain.schema.validate import AIPredictiveValidation, DeterministicValidationData
+from app.infra.logger import LoggerStatus, main_logger
+from app.infra.metrics import metrics
+
+VALIDITY_STATUSES = ("valid", "suspicious", "invalid", "requires_review")
+
+# Features rules can be written against (see validation_features)
+RULE_FEATURES = frozenset(
+    FEATURE_NAMES
+    + ("trust_score", "error_issues", "warning_issues", "error_inferences", "warning_inferences")
+)
+
+_REQUIRED_KEYS = {"name", "status", "confidence", "requires_human_review", "conditions"}
+_OPTIONAL_KEYS = {"description"}
+
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {
+        "name": "trusted_clean",
+        "status": "valid",
+        "confidence": 90,
+        "requires_human_review": False,
+        "description": "Trusted reporter on a known device with no issues and few rejected reports",
+        "conditions": {
+            "trust_score": {"min": 90},
+            "issues_count": {"max": 0},
+            "error_inferences": {"max": 0},
+            "device_fingerprint_match": {"min": 1},
+            "rejection_rate": {"max": 0.1},
+        },
+    },
+    {
+        "name": "repeat_rejections_unknown_device",
+        "status": "invalid",
+        "confidence": 85,
+        "requires_human_review": True,
+        "description": "Most of the reporter's previous reports were rejected and the device is not recognized",
+        "conditions": {
+            "reporter_history_count": {"min": 4},
+            "rejection_rate": {"min": 0.5},
+            "device_fingerprint_match": {"max": 0},
+            "trust_score": {"max": 40},
+        },
+    },
+    {
+        "name": "very_low_trust_with_errors",
+        "status": "invalid",
+        "confidence": 80,
+        "requires_human_review": True,
+        "description": "Very low trust score with blocking issues",
+        "conditions": {
+            "trust_score": {"max": 15},
+            "error_issues": {"min": 1},
+        },
+    },
+]
+
+
+def validation_features(data: DeterministicValidationData) -> Dict[str, float]:
+    """Numeric features of the deterministic validation data that rules are written against."""
+    features = feature_dict(data)
+    features.update(
+        trust_score=data.trust_score,
+        error_issues=sum(1 for issue in data.issues if issue.level == "error"),
+        warning_issues=sum(1 for issue in data.issues if issue.level == "warning"),
+        error_inferences=sum(1 for inference in data.inferences if inference.level == "error"),
+        warning_inferences=sum(1 for inference in data.inferences if inference.level == "warning"),
+    )
+    return features
+
+
+class ValidationRule:
+    """
+    One clear-case rule: conditions on features and the verdict they imply.
+
+    Args:
+        name: Rule name, used in metrics and in the verdict's reasons
+        status: final_validity_status of the verdict
+        confidence: confidence_score of the verdict (0-100)
+        requires_human_review: requires_human_review of the verdict
+        conditions: Feature name -> {"min": x, "max": y} (inclusive bounds)
+        description: One-line explanation used as the verdict's summary
+    """
+
+    def __init__(
+        self,
+        name: str,
+        status: str,
+        confidence: float,
+        requires_human_review: bool,
+        conditions: Dict[str, Dict[str, float]],
+        description: str = "",
+    ):
+        self.name = name
+        self.status = status
+        self.confidence = confidence
+        self.requires_human_review = requires_human_review
+        self.conditions = conditions
+        self.description = description or name
+
+    @classmethod
+    def from_definition(cls, definition: Any) -> "ValidationRule":
+        """
+        Build a rule from its JSON definition.
+
+        Raises:
+            ValueError: If the definition has unknown or missing keys, an unknown
+                status or feature, a confidence outside 0-100 or non-numeric bounds
+        """
+        if not isinstance(definition, dict):
+            raise ValueError(f"rule must be an object, got {type(definition).__name__}")
+        name = definition.get("name", "<unnamed>")
+        missing = _REQUIRED_KEYS - definition.keys()
+        unknown = definition.keys() - _REQUIRED_KEYS - _OPTIONAL_KEYS
+        if missing or unknown:
+            raise ValueError(f"rule '{name}': missing keys {sorted(missing)}, unknown keys {sorted(unknown)}")
+        if not isinstance(name, str) or not name:
+            raise ValueError("rule name must be a non-empty string")
+        if definition["status"] not in VALIDITY_STATUSES:
+            raise ValueError(f"rule '{name}': status must be one of {VALIDITY_STATUSES}")
+        confidence = definition["confidence"]
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)) or not 0 <= confidence <= 100:
+            raise ValueError(f"rule '{name}': confidence must be a number from 0 to 100")
+        if not isinstance(definition["requires_human_review"], bool):
+            raise ValueError(f"rule '{name}': requires_human_review must be true or false")
+        if not isinstance(definition.get("description", ""), str):
+            raise ValueError(f"rule '{name}': description must be a string")
+
+        conditions = definition["conditions"]
+        if not isinstance(conditions, dict) or not conditions:
+            raise ValueError(f"rule '{name}': conditions must be a non-empty object")
+        for feature, bounds in conditions.items():
+            if feature not in RULE_FEATURES:
+                raise ValueError(f"rule '{name}': unknown feature '{feature}'")
+            if not isinstance(bounds, dict) or not bounds or bounds.keys() - {"min", "max"}:
+                raise ValueError(f"rule '{name}': bounds of '{feature}' must be {{\"min\": x}} and/or {{\"max\": y}}")
+            if any(isinstance(v, bool) or not isinstance(v, (int, float)) for v in bounds.values()):
+                raise ValueError(f"rule '{name}': bounds of '{feature}' must be numbers")
+        return cls(**definition)
+
+    def matches(self, features: Dict[str, float]) -> bool:
+        for feature, bounds in self.conditions.items():
+            value = features.get(feature)
+            if value is None:
+                return False
+            if "min" in bounds and value < bounds["min"]:
+                return False
+            if "max" in bounds and value > bounds["max"]:
+                return False
+        return True
+
+    def reasons(self, features: Dict[str, float]) -> List[str]:
+        reasons = []
+        for feature, bounds in self.conditions.items():
+            value = features[feature]
+            shown = f"{value:.2f}" if isinstance(value, float) else str(value)
+            limits = [f">= {bounds['min']}"] if "min" in bounds else []
+            limits += [f"<= {bounds['max']}"] if "max" in bounds else []
+            reasons.append(f"{feature.replace('_', ' ').capitalize()} is {shown} ({' and '.join(limits)})")
+        return reasons
+
+
+class ValidationRuleEngine:
+    """
+    Ordered list of validation rules; the first matching rule decides.
+
+    Args:
+        rules: Rules in evaluation order
+    """
+
+    def __init__(self, rules: List[ValidationRule]):
+        self.rules = rules
+
+    @classmethod
+    def from_config(cls) -> "ValidationRuleEngine":
+        """
+        Rules from VALIDATION_RULES_PATH, or the defaults; no rules when VALIDATION_RULES_ENABLED is off.
+
+        A rules file that cannot be read, or that holds any invalid definition,
+        is logged and replaced by the default rules; it never fails startup.
+        """
+        if not config.VALIDATION_RULES_ENABLED:
+            return cls([])
+        if config.VALIDATION_RULES_PATH:
+            try:
+                with open(config.VALIDATION_RULES_PATH, encoding="utf-8") as f:
+                    definitions = json.load(f)
+                if not isinstance(definitions, list):
+                    raise ValueError("the file must hold a list of rules")
+                return cls([ValidationRule.from_definition(definition) for definition in definitions])
+            except (OSError, ValueError) as e:
+                main_logger.log(
+                    f"[VALIDATION RULES] Using default rules, cannot load {config.VALIDATION_RULES_PATH}: {e}",
+                    LoggerStatus.WARNING,
+                )
+        return cls([ValidationRule.from_definition(definition) for definition in DEFAULT_RULES])
+
+    def evaluate(self, data: DeterministicValidationData) -> Optional[AIPredictiveValidation]:
+        """
+        Decide a report from its deterministic data alone.
+
+        Returns:
+            Optional[AIPredictiveValidation]: The verdict of the first matching rule,
+                or None when no rule matches and the LLM must decide
+        """
+        if not self.rules:
+            return None
+        features = validation_features(data)
+        for rule in self.rules:
+            if rule.matches(features):
+                metrics.increment("validation_rule_matches_total", rule=rule.name)
+                return AIPredictiveValidation(
+                    summary=f"{rule.description} (deterministic rule '{rule.name}').",
+                    requires_human_review=rule.requires_human_review,
+                    confidence_score=float(rule.confidence),
+                    final_validity_status=rule.status,
+                    reasons=rule.reasons(features),
+                    supporting_inferences=[inference.observation for inference in data.inferences],
+                )
+        return None
+
+
+# Shared engine: rules are loaded once per process.
+validation_rules = ValidationRuleEngine.from_config()
@@ -0,0 +1,88 @@
+from app.services.category_search import BM25Index, KeywordMatcher, category_keywords, tokenize
+
+# id: (name, slug, description, parent id)
+TREE = {
+    1: ("Crime", "crime", "Robbery, theft, assault", None),
+    11: ("Armed Robbery", "armed-robbery", "Robbery with guns or weapons", 1),
+    12: ("Other", "other", "Other incidents", 1),
+    2: ("Traffic", "traffic", "Accidents, road incidents", None),
+    21: ("Accident", "accident", "Vehicle collision, crash", 2),
+    3: ("Emergency", "emergency", "Fire", None),
+    31: ("Fire", "fire", "Building fire, smoke", 3),
+}
+LEAVES = {11, 12, 21, 31}
+CATCH_ALL = {12}
+
+
+def _matcher(**kwargs) -> KeywordMatcher:
+    return KeywordMatcher(
+        {category_id: category_keywords(name, slug, description) for category_id, (name, slug, description, _) in TREE.items()},
+        parent={category_id: parent for category_id, (_, _, _, parent) in TREE.items()},
+        leaves=LEAVES,
+        excluded=CATCH_ALL,
+        **kwargs,
+    )
+
+
+def test_tokenize_stems_and_drops_stop_words():
+    assert tokenize("The robbers robbed a store") == ["robber", "robb", "store"]
+    assert tokenize("Fires and fire") == ["fire", "fire"]
+
+
+def test_bm25_ranks_specific_matches_first():
+    search = BM25Index({1: "Crime robbery theft", 2: "Fire building smoke"})
+    ranked = search.rank("armed robbery at bus stop", [1, 2])
+    assert ranked[0][0] == 1 and ranked[0][1] > 0
+    assert ranked[1] == (2, 0.0)
+
+
+def test_confident_leaf_match():
+    match = _matcher().match("Fire at the market, smoke everywhere")
+    assert match.category_ids == [31]
+    assert match.confident
+
+
+def test_hit_on_parent_is_implied_by_leaf():
+    match = _matcher().match("Armed robbery at the bus stop")
+    assert match.category_ids == [11]
+    assert set(match.phrases) == {1, 11}
+    assert match.confident
+
+
+def test_catch_all_category_is_not_indexed():
+    match = _matcher().match("Two other men were seen near the car park")
+    assert 12 not in match.category_ids
+    assert not match.confident
+
+
+def test_generic_word_is_not_confident():
+    matcher = KeywordMatcher({21: ["incident"]}, parent={21: None}, leaves={21})
+    match = matcher.match("Incident near the school")
+    assert match.category_ids == [21]
+    assert not match.confident
+
+
+def test_word_shared_by_unrelated_categories_is_not_confident():
+    matcher = KeywordMatcher({21: ["crash"], 22: ["crash", "computer"]}, parent={21: None, 22: None}, leaves={21, 22})
+    assert matcher.match("crash").category_ids == [21, 22]
+    assert "crash" not in matcher.specific_words
+    assert matcher.match("computer crash").confident is False
+
+
+def test_negated_hit_is_not_confident():
+    matcher = _matcher()
+    assert not matcher.match("This was no accident, he deliberately rammed me").confident
+    assert not matcher.match("The building isn't on fire").confident
+    assert matcher.match("Accident on the main road").confident
+
+
+def test_too_many_leaves_is_not_confident():
+    match = _matcher().match("Vehicle collision caused a building fire")
+    assert set(match.category_ids) == {21, 31}
+    assert not match.confident
+    assert _matcher(max_matches=2).match("Vehicle collision caused a building fire").confident
+
+
+def test_category_keywords_keep_short_description_phrases():
+    keywords = category_keywords("Water", "burst-pipe", "Burst water pipe, flooding, water is leaking out of the main line")
+    assert keywords == ["Water", "burst pipe", "Burst water pipe", "flooding"]
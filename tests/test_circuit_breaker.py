@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from app.adapters.ai.llm import circuit_breaker as circuit_breaker_module
+from app.adapters.ai.llm.circuit_breaker import CircuitBreaker, CircuitState
+from app.adapters.ai.llm.ollama import OllamaLLMEngine
+from app.adapters.ai.llm.scheduler import LLMScheduler, Priority
+from app.core.exceptions import LLMCircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module.time, "monotonic", fake)
+    return fake
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    options = dict(
+        failure_rate_threshold=0.5,
+        minimum_calls=4,
+        window_seconds=60,
+        open_seconds=30,
+        half_open_max_calls=1,
+        slow_call_seconds=10,
+    )
+    options.update(kwargs)
+    return CircuitBreaker("test", **options)
+
+
+def _call(breaker: CircuitBreaker, success: bool, duration: float = 1.0) -> None:
+    breaker.before_call()
+    breaker.record(success, duration)
+
+
+def test_closed_open_half_open_closed(clock):
+    breaker = _breaker()
+    _call(breaker, True)
+    _call(breaker, True)
+    _call(breaker, False)
+    assert breaker.state == CircuitState.CLOSED
+    _call(breaker, False)
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(LLMCircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 31
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(LLMCircuitOpenError):
+        breaker.before_call()  # the single probe is in use
+    breaker.record(True, 1.0)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_failed_probe_reopens(clock):
+    breaker = _breaker(minimum_calls=1)
+    _call(breaker, False)
+    assert breaker.state == CircuitState.OPEN
+    clock.now += 31
+    _call(breaker, False)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_slow_call_counts_as_failure(clock):
+    breaker = _breaker(minimum_calls=2)
+    _call(breaker, True, duration=11)
+    _call(breaker, True, duration=12)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_released_calls_do_not_count(clock):
+    breaker = _breaker()
+    for _ in range(10):
+        breaker.before_call()
+        breaker.release()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.snapshot()["calls_in_window"] == 0
+
+
+def test_released_probe_keeps_circuit_half_open(clock):
+    breaker = _breaker(minimum_calls=1)
+    _call(breaker, False)
+    clock.now += 31
+    breaker.before_call()
+    breaker.release()
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()  # the probe slot was given back
+    breaker.record(True, 1.0)
+    assert breaker.state == CircuitState.CLOSED
+
+
+class _StreamingModel(GenericFakeChatModel):
+    """Fake chat model that streams word by word (structured output is not used here)."""
+
+    def with_structured_output(self, *args, **kwargs):
+        return self
+
+
+def _engine(breaker: CircuitBreaker) -> OllamaLLMEngine:
+    model = _StreamingModel(messages=iter([AIMessage(content="Title: Fire at market\nDescription: Smoke seen")]))
+    scheduler = LLMScheduler(total_limit=4, class_limits={p: 4 for p in Priority}, max_wait_seconds=5)
+    engine = OllamaLLMEngine(model="fake-stream", chat_model=model, scheduler=scheduler)
+    engine.circuit_breaker = breaker
+    return engine
+
+
+def test_closed_stream_releases_without_failure():
+    breaker = _breaker(minimum_calls=1)
+
+    async def read_one_chunk() -> None:
+        stream = _engine(breaker).stream_report_summary("fire at the market")
+        await anext(stream)
+        await stream.aclose()
+
+    asyncio.run(read_one_chunk())
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.snapshot()["calls_in_window"] == 0
+
+
+def test_completed_stream_records_success():
+    breaker = _breaker(minimum_calls=1)
+
+    async def read_all() -> str:
+        return "".join([chunk async for chunk in _engine(breaker).stream_report_summary("fire at the market")])
+
+    assert asyncio.run(read_all()).startswith("Title: Fire")
+    assert breaker.snapshot()["calls_in_window"] == 1
+    assert breaker.snapshot()["failure_rate"] == 0.0
@@ -0,0 +1,81 @@
+import numpy as np
+
+from app.adapters.ai.prediction.linear import (
+    FEATURE_NAMES,
+    LogisticModel,
+    feature_matrix,
+    feature_vector,
+    load_model,
+    log_loss,
+)
+
+
+def _dataset(count=400, seed=0):
+    """Two informative features (history up, rejection rate down) and noise in the rest."""
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(count, len(FEATURE_NAMES)))
+    features[:, 0] = rng.integers(0, 50, size=count)
+    features[:, 2] = rng.uniform(0, 1, size=count)
+    logits = 0.1 * (features[:, 0] - 25) - 6 * (features[:, 2] - 0.5)
+    labels = (rng.uniform(size=count) < 1 / (1 + np.exp(-logits))).astype(np.float64)
+    return features, labels
+
+
+def test_fit_learns_the_signal():
+    features, labels = _dataset()
+    model = LogisticModel.fit(features, labels)
+    assert model.weights[0] > 0
+    assert model.weights[2] < 0
+    probabilities = model.predict_proba(features)
+    baseline = log_loss(np.full(len(labels), labels.mean()), labels)
+    assert log_loss(probabilities, labels) < baseline
+    assert np.mean((probabilities >= 0.5) == (labels == 1)) > 0.7
+
+
+def test_fit_handles_constant_features():
+    features, labels = _dataset()
+    features[:, 5] = 3.0
+    model = LogisticModel.fit(features, labels, epochs=200)
+    assert model.scale[5] == 1.0
+    assert np.all(np.isfinite(model.predict_proba(features)))
+
+
+def test_score_matches_predict_proba():
+    features, labels = _dataset(count=50)
+    model = LogisticModel.fit(features, labels, epochs=200)
+    batch = model.predict_proba(features)
+    single = np.array([model.score(row) for row in features])
+    np.testing.assert_allclose(single, batch, rtol=1e-9, atol=1e-12)
+
+
+def test_score_does_not_overflow():
+    model = LogisticModel(FEATURE_NAMES, np.zeros(8), np.ones(8), np.full(8, 100.0), 0.0)
+    assert model.score(np.full(8, 1e6)) == 1.0
+    assert model.score(np.full(8, -1e6)) < 1e-200
+
+
+def test_save_load_round_trip(tmp_path):
+    features, labels = _dataset(count=100)
+    model = LogisticModel.fit(features, labels, epochs=200)
+    path = tmp_path / "models" / "prescreen.json"
+    model.save(str(path))
+
+    loaded = load_model(str(path))
+    assert loaded.feature_names == model.feature_names
+    np.testing.assert_array_equal(loaded.weights, model.weights)
+    np.testing.assert_array_equal(loaded.predict_proba(features), model.predict_proba(features))
+
+
+def test_load_model_without_file(tmp_path):
+    assert load_model(str(tmp_path / "missing.json")) is None
+    assert load_model("") is None
+
+
+def test_feature_vector_and_matrix_use_model_order():
+    row = {"issues_count": 2.0, "reporter_history_count": 7.0}
+    vector = feature_vector(row)
+    assert vector[FEATURE_NAMES.index("issues_count")] == 2.0
+    assert vector[FEATURE_NAMES.index("reporter_history_count")] == 7.0
+    assert vector.sum() == 9.0
+    np.testing.assert_array_equal(feature_matrix([row, row]), np.vstack([vector, vector]))
+    assert feature_matrix([]).shape == (0, len(FEATURE_NAMES))
@@ -0,0 +1,69 @@
+import asyncio
+
+from app.adapters.ai.llm.scheduler import LLMScheduler, Priority
+
+
+def _scheduler(max_wait_seconds: float) -> LLMScheduler:
+    return LLMScheduler(total_limit=1, class_limits={p: 1 for p in Priority}, max_wait_seconds=max_wait_seconds)
+
+
+async def _grant_order(scheduler: LLMScheduler, batch_head_start: float) -> list:
+    """Hold the only slot, queue a BATCH then an INTERACTIVE call, and return the order they are served in."""
+    order = []
+
+    async def call(priority: Priority) -> None:
+        async with scheduler.slot(priority):
+            order.append(priority)
+
+    await scheduler.acquire(Priority.INTERACTIVE)
+    batch = asyncio.create_task(call(Priority.BATCH))
+    await asyncio.sleep(batch_head_start)
+    interactive = asyncio.create_task(call(Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+    scheduler.release(Priority.INTERACTIVE)
+    await asyncio.gather(batch, interactive)
+    return order
+
+
+def test_higher_priority_is_served_first():
+    order = asyncio.run(_grant_order(_scheduler(max_wait_seconds=60), batch_head_start=0.01))
+    assert order == [Priority.INTERACTIVE, Priority.BATCH]
+
+
+def test_starved_class_is_promoted_after_max_wait():
+    order = asyncio.run(_grant_order(_scheduler(max_wait_seconds=0.02), batch_head_start=0.05))
+    assert order == [Priority.BATCH, Priority.INTERACTIVE]
+
+
+def test_class_limit_is_respected():
+    async def scenario():
+        scheduler = LLMScheduler(
+            total_limit=4,
+            class_limits={Priority.INTERACTIVE: 4, Priority.BACKGROUND: 1, Priority.BATCH: 1},
+            max_wait_seconds=60,
+        )
+        await scheduler.acquire(Priority.BATCH)
+        waiting = asyncio.create_task(scheduler.acquire(Priority.BATCH))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        await scheduler.acquire(Priority.INTERACTIVE)  # other classes still get slots
+        scheduler.release(Priority.BATCH)
+        await asyncio.wait_for(waiting, timeout=1)
+        assert scheduler.class_in_flight[Priority.BATCH] == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        scheduler = _scheduler(max_wait_seconds=60)
+        await scheduler.acquire(Priority.INTERACTIVE)
+        waiting = asyncio.create_task(scheduler.acquire(Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert not scheduler.waiters[Priority.BACKGROUND]
+        scheduler.release(Priority.INTERACTIVE)
+        assert scheduler.in_flight == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from app.adapters.ai.llm.single_flight import SingleFlight
+
+
+class SlowCall:
+    """Counts how often it was started and whether it was cancelled."""
+
+    def __init__(self, result="done"):
+        self.result = result
+        self.started = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.started += 1
+        try:
+            await self.release.wait()
+            return self.result
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def test_concurrent_callers_share_one_generation():
+    async def scenario():
+        flight = SingleFlight()
+        call = SlowCall()
+        waiters = [asyncio.create_task(flight.do("key", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 1
+        call.release.set()
+        results = await asyncio.gather(*waiters)
+        assert results == ["done"] * 5
+        assert call.started == 1
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())
+
+
+def test_errors_reach_every_caller():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do("key", failing) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_the_others():
+    async def scenario():
+        flight = SingleFlight()
+        call = SlowCall()
+        first = asyncio.create_task(flight.do("key", call))
+        second = asyncio.create_task(flight.do("key", call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert not call.cancelled
+
+        call.release.set()
+        assert await second == "done"
+        assert call.started == 1
+
+    asyncio.run(scenario())
+
+
+def test_last_waiter_cancelled_cancels_the_generation():
+    async def scenario():
+        flight = SingleFlight()
+        call = SlowCall()
+        waiters = [asyncio.create_task(flight.do("key", call)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert call.cancelled
+        assert flight.in_flight() == 0
+        assert not flight._waiters  # pylint: disable=protected-access
+
+    asyncio.run(scenario())
+
+
+def test_deadline_cancels_generation_and_next_call_starts_fresh():
+    async def scenario():
+        flight = SingleFlight()
+        call = SlowCall()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(flight.do("key", call), timeout=0.01)
+        await asyncio.sleep(0)
+        assert call.cancelled
+
+        fresh = SlowCall(result="again")
+        fresh.release.set()
+        assert await flight.do("key", fresh) == "again"
+        assert fresh.started == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from app.core.config import config
+from app.domain.schema.validate import (
+    DeterministicValidationData,
+    ValidationInference,
+    ValidationIssue,
+    ValidationMetadata,
+)
+from app.services.validation_rules import DEFAULT_RULES, ValidationRule, ValidationRuleEngine, validation_features
+
+
+def _data(trust_score=50, issues=(), history=10, rejected=0, device_match=True) -> DeterministicValidationData:
+    issues = [ValidationIssue(field="title", message="bad", level=level) for level in issues]
+    inferences = [ValidationInference(category="location", observation="Near the reported area", level="info")]
+    return DeterministicValidationData(
+        trust_score=trust_score,
+        is_valid=True,
+        issues=issues,
+        inferences=inferences,
+        metadata=ValidationMetadata(
+            reporter_history_count=history,
+            rejected_reports_count=rejected,
+            device_fingerprint_match=device_match,
+            average_evidence_distance=120.0,
+            report_frequency_score=2,
+        ),
+        issues_count=len(issues),
+        inferences_count=len(inferences),
+    )
+
+
+def _rule(**overrides) -> dict:
+    return {
+        "name": "low_trust",
+        "status": "invalid",
+        "confidence": 80,
+        "requires_human_review": True,
+        "conditions": {"trust_score": {"max": 20}},
+        **overrides,
+    }
+
+
+@pytest.fixture
+def rules_file(tmp_path, monkeypatch):
+    path = tmp_path / "rules.json"
+    monkeypatch.setattr(config, "VALIDATION_RULES_ENABLED", True)
+    monkeypatch.setattr(config, "VALIDATION_RULES_PATH", str(path))
+    return path
+
+
+def test_features_include_counts_and_rates():
+    features = validation_features(_data(trust_score=30, issues=("error", "warning"), history=4, rejected=2))
+    assert features["trust_score"] == 30
+    assert features["error_issues"] == 1 and features["warning_issues"] == 1
+    assert features["rejection_rate"] == 0.5
+    assert features["device_fingerprint_match"] == 1.0
+
+
+def test_bounds_are_inclusive():
+    rule = ValidationRule.from_definition(_rule(conditions={"trust_score": {"min": 10, "max": 20}}))
+    assert rule.matches({"trust_score": 10})
+    assert rule.matches({"trust_score": 20})
+    assert not rule.matches({"trust_score": 9})
+    assert not rule.matches({"trust_score": 21})
+    assert not rule.matches({})
+
+
+def test_default_rules_decide_clear_cases():
+    engine = ValidationRuleEngine([ValidationRule.from_definition(definition) for definition in DEFAULT_RULES])
+    trusted = engine.evaluate(_data(trust_score=95))
+    assert trusted.final_validity_status == "valid"
+    assert not trusted.requires_human_review
+
+    abusive = engine.evaluate(_data(trust_score=30, history=10, rejected=8, device_match=False))
+    assert abusive.final_validity_status == "invalid"
+    assert "repeat_rejections_unknown_device" in abusive.summary
+
+    assert engine.evaluate(_data(trust_score=60)) is None
+
+
+def test_first_matching_rule_wins():
+    engine = ValidationRuleEngine(
+        [
+            ValidationRule.from_definition(_rule(name="first", status="suspicious")),
+            ValidationRule.from_definition(_rule(name="second")),
+        ]
+    )
+    assert engine.evaluate(_data(trust_score=10)).final_validity_status == "suspicious"
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        _rule(status="fake"),
+        _rule(confidence=150),
+        _rule(confidence="high"),
+        _rule(requires_human_review="yes"),
+        _rule(extra_key=1),
+        {key: value for key, value in _rule().items() if key != "conditions"},
+        _rule(conditions={}),
+        _rule(conditions={"unknown_feature": {"min": 1}}),
+        _rule(conditions={"trust_score": {"above": 1}}),
+        _rule(conditions={"trust_score": {"min": "1"}}),
+        "not a rule",
+    ],
+)
+def test_invalid_definitions_are_rejected(definition):
+    with pytest.raises(ValueError):
+        ValidationRule.from_definition(definition)
+
+
+def test_rules_file_replaces_defaults(rules_file):
+    rules_file.write_text(json.dumps([_rule()]))
+    engine = ValidationRuleEngine.from_config()
+    assert [rule.name for rule in engine.rules] == ["low_trust"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        json.dumps({"name": "not a list"}),
+        json.dumps([_rule(), _rule(status="fake")]),
+        json.dumps([_rule(unexpected=True)]),
+    ],
+)
+def test_bad_rules_file_falls_back_to_defaults(rules_file, content):
+    rules_file.write_text(content)
+    engine = ValidationRuleEngine.from_config()
+    assert [rule.name for rule in engine.rules] == [definition["name"] for definition in DEFAULT_RULES]
+
+
+def test_missing_rules_file_falls_back_to_defaults(rules_file):
+    assert len(ValidationRuleEngine.from_config().rules) == len(DEFAULT_RULES)
+
+
+def test_rules_disabled(monkeypatch):
+    monkeypatch.setattr(config, "VALIDATION_RULES_ENABLED", False)
+    assert ValidationRuleEngine.from_config().evaluate(_data(trust_score=95)) is None